@@ -5,10 +5,16 @@ Defines all supported trading pairs with their specific parameters,
 including profit asset preferences and decimal precision.
 """
 
-from dataclasses import dataclass
+import functools
+import re
+from dataclasses import dataclass, field
 from typing import Dict, Literal
 
 
+# Trailing zeros (and a dangling decimal point) in a fixed-point string
+_TRAIL = re.compile(r'\.?0+$')
+
+
 @dataclass
 class TradingPairConfig:
     """Configuration for a trading pair."""
@@ -21,13 +27,26 @@ class TradingPairConfig:
     min_amount: float  # Minimum order amount
     profit_asset: Literal['base', 'quote']  # Which asset to keep spread profit in
 
+    # Format templates derived from the decimals (built in __post_init__)
+    _base_fmt: str = field(init=False, repr=False, compare=False)
+    _quote_fmt: str = field(init=False, repr=False, compare=False)
+    _base_fmt_plain: str = field(init=False, repr=False, compare=False)
+    _quote_fmt_plain: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute format templates so formatting skips spec building."""
+        self._base_fmt = f"{{:,.{self.base_decimals}f}}"
+        self._quote_fmt = f"{{:,.{self.quote_decimals}f}}"
+        self._base_fmt_plain = f"{{:.{self.base_decimals}f}}"
+        self._quote_fmt_plain = f"{{:.{self.quote_decimals}f}}"
+
     def format_base_amount(self, amount: float) -> str:
         """Format base asset amount with correct decimals."""
-        return f"{amount:,.{self.base_decimals}f}"
+        return self._base_fmt.format(amount)
 
     def format_quote_amount(self, amount: float) -> str:
         """Format quote asset amount with correct decimals."""
-        return f"{amount:,.{self.quote_decimals}f}"
+        return self._quote_fmt.format(amount)
 
     def round_base_quantity(self, amount: float) -> str:
         """
@@ -39,9 +58,10 @@ class TradingPairConfig:
         Returns:
             Formatted string with correct decimals, trailing zeros removed
         """
-        rounded = round(amount, self.base_decimals)
-        formatted = f"{rounded:.{self.base_decimals}f}".rstrip('0').rstrip('.')
-        return formatted
+        formatted = self._base_fmt_plain.format(round(amount, self.base_decimals))
+        if self.base_decimals == 0:
+            return formatted  # No fractional part to trim
+        return _TRAIL.sub('', formatted)
 
     def round_quote_quantity(self, amount: float) -> str:
         """
@@ -53,9 +73,10 @@ class TradingPairConfig:
         Returns:
             Formatted string with correct decimals, trailing zeros removed
         """
-        rounded = round(amount, self.quote_decimals)
-        formatted = f"{rounded:.{self.quote_decimals}f}".rstrip('0').rstrip('.')
-        return formatted
+        formatted = self._quote_fmt_plain.format(round(amount, self.quote_decimals))
+        if self.quote_decimals == 0:
+            return formatted  # No fractional part to trim
+        return _TRAIL.sub('', formatted)
 
 
 # Supported trading pairs
@@ -92,7 +113,10 @@ SUPPORTED_PAIRS: Dict[str, TradingPairConfig] = {
     ),
 }
 
+_SUPPORTED_KEYS = tuple(SUPPORTED_PAIRS)
+
 
+@functools.lru_cache(maxsize=64)
 def get_pair_config(symbol: str) -> TradingPairConfig:
     """
     Get configuration for a trading pair.
@@ -106,14 +130,19 @@ def get_pair_config(symbol: str) -> TradingPairConfig:
     Raises:
         ValueError: If pair is not supported
     """
-    symbol_upper = symbol.upper()
-    if symbol_upper not in SUPPORTED_PAIRS:
+    # Callers usually pass the canonical uppercase symbol already
+    config = SUPPORTED_PAIRS.get(symbol)
+    if config is not None:
+        return config
+
+    config = SUPPORTED_PAIRS.get(symbol.upper())
+    if config is None:
         raise ValueError(
             f"Unsupported trading pair: {symbol}. "
-            f"Supported: {list(SUPPORTED_PAIRS.keys())}"
+            f"Supported: {list(_SUPPORTED_KEYS)}"
         )
 
-    return SUPPORTED_PAIRS[symbol_upper]
+    return config
 
 
 def parse_pair(pair_str: str) -> tuple[str, str]:
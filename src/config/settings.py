@@ -5,9 +5,10 @@ Loads settings from environment variables with sensible defaults.
 """
 
 import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 @dataclass
@@ -23,12 +24,21 @@ class Settings:
     default_stream_duration_seconds: int = 30
     auto_refresh: bool = True
     improvement_threshold_bps: float = 1.0
+    lp_quote_timeout_seconds: float = 0.0  # Per-LP response deadline (0 = none)
+    hedge_after_ms: float = 0.0  # Re-request slow LPs after this long (0 = off)
+    lp_concurrency: int = 0  # Max LP quote requests in flight (0 = unlimited)
+
+    # Event loop
+    use_uvloop: bool = True  # Use uvloop when installed (falls back to asyncio)
 
     # Database
     database_path: str = "quotes.db"
     enable_database_logging: bool = True
+    partition_lp_quotes_by_day: bool = False  # One lp_quotes file per UTC day
+    quote_log_flush_ms: float = 0.0  # Collect quote log writes this long per commit (0 = commit immediately)
 
     # Mock LP settings (for testing)
+    lp_backend: str = 'sine'  # 'sine' (phase-shifted sine LPs) or 'mock' (random MockLPs)
     mock_lp_count: int = 3
     mock_base_price: float = 100000.0
     mock_spread_bps: float = 5.0
@@ -37,42 +47,150 @@ class Settings:
     mock_failure_rate: float = 0.0
 
     @classmethod
-    def from_env(cls, env_file: Optional[str] = None) -> 'Settings':
+    def from_env(cls, env_file: Optional[str] = None, overwrite: bool = False) -> 'Settings':
         """
         Load settings from environment variables.
 
+        Results loaded from an env_file are cached until the file's mtime
+        or one of the settings' environment variables changes, so repeated
+        reloads of an unchanged file are free.
+
         Args:
             env_file: Path to .env file (optional)
+            overwrite: If True, .env values also replace variables set in
+                the real process environment (values a previous load took
+                from a .env file are always replaced)
 
         Returns:
             Settings instance
         """
-        # Load .env file if provided
+        # Reuse the previous result while neither the .env file nor the
+        # environment it was merged into has changed
+        cache_key = None
         if env_file and Path(env_file).exists():
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        os.environ[key] = value
-
-        return cls(
-            markup_bps=float(os.getenv('MARKUP_BPS', '5.0')),
-            validity_buffer_seconds=float(os.getenv('VALIDITY_BUFFER_SECONDS', '2.0')),
-            poll_interval_ms=int(os.getenv('POLL_INTERVAL_MS', '500')),
-            default_stream_duration_seconds=int(os.getenv('DEFAULT_STREAM_DURATION_SECONDS', '30')),
-            auto_refresh=os.getenv('AUTO_REFRESH', 'false').lower() == 'true',
-            improvement_threshold_bps=float(os.getenv('IMPROVEMENT_THRESHOLD_BPS', '1.0')),
-            database_path=os.getenv('DATABASE_PATH', 'quotes.db'),
-            enable_database_logging=os.getenv('ENABLE_DATABASE_LOGGING', 'true').lower() == 'true',
-            mock_lp_count=int(os.getenv('MOCK_LP_COUNT', '3')),
-            mock_base_price=float(os.getenv('MOCK_BASE_PRICE', '100000.0')),
-            mock_spread_bps=float(os.getenv('MOCK_SPREAD_BPS', '5.0')),
-            mock_min_delay=float(os.getenv('MOCK_MIN_DELAY', '0.1')),
-            mock_max_delay=float(os.getenv('MOCK_MAX_DELAY', '0.5')),
-            mock_failure_rate=float(os.getenv('MOCK_FAILURE_RATE', '0.0'))
+            cache_key = (env_file, overwrite)
+            mtime_ns = Path(env_file).stat().st_mtime_ns
+            with _ENV_CACHE_LOCK:
+                cached = _ENV_CACHE.get(cache_key)
+            if cached and cached[0] == mtime_ns and cached[1] == _setting_env_values():
+                return cached[2]
+
+            # Load .env file
+            _merge_env_file(env_file, overwrite)
+
+        # Single snapshot of the environment for all lookups below
+        env = os.environ.copy()
+
+        result = cls(
+            markup_bps=float(env.get('MARKUP_BPS', '5.0')),
+            validity_buffer_seconds=float(env.get('VALIDITY_BUFFER_SECONDS', '2.0')),
+            poll_interval_ms=int(env.get('POLL_INTERVAL_MS', '500')),
+            default_stream_duration_seconds=int(env.get('DEFAULT_STREAM_DURATION_SECONDS', '30')),
+            auto_refresh=env.get('AUTO_REFRESH', 'false').lower() == 'true',
+            improvement_threshold_bps=float(env.get('IMPROVEMENT_THRESHOLD_BPS', '1.0')),
+            lp_quote_timeout_seconds=float(env.get('LP_QUOTE_TIMEOUT_SECONDS', '0.0')),
+            hedge_after_ms=float(env.get('HEDGE_AFTER_MS', '0.0')),
+            lp_concurrency=int(env.get('LP_CONCURRENCY', '0')),
+            use_uvloop=env.get('USE_UVLOOP', 'true').lower() == 'true',
+            database_path=env.get('DATABASE_PATH', 'quotes.db'),
+            enable_database_logging=env.get('ENABLE_DATABASE_LOGGING', 'true').lower() == 'true',
+            partition_lp_quotes_by_day=env.get('PARTITION_LP_QUOTES_BY_DAY', 'false').lower() == 'true',
+            quote_log_flush_ms=float(env.get('QUOTE_LOG_FLUSH_MS', '0.0')),
+            lp_backend=env.get('LP_BACKEND', 'sine').lower(),
+            mock_lp_count=int(env.get('MOCK_LP_COUNT', '3')),
+            mock_base_price=float(env.get('MOCK_BASE_PRICE', '100000.0')),
+            mock_spread_bps=float(env.get('MOCK_SPREAD_BPS', '5.0')),
+            mock_min_delay=float(env.get('MOCK_MIN_DELAY', '0.1')),
+            mock_max_delay=float(env.get('MOCK_MAX_DELAY', '0.5')),
+            mock_failure_rate=float(env.get('MOCK_FAILURE_RATE', '0.0'))
         )
 
+        if cache_key:
+            with _ENV_CACHE_LOCK:
+                _ENV_CACHE[cache_key] = (mtime_ns, _setting_env_values(), result)
+
+        return result
+
+
+# Every variable from_env reads (keep in sync with from_env)
+_SETTING_ENV_VARS = (
+    'MARKUP_BPS',
+    'VALIDITY_BUFFER_SECONDS',
+    'POLL_INTERVAL_MS',
+    'DEFAULT_STREAM_DURATION_SECONDS',
+    'AUTO_REFRESH',
+    'IMPROVEMENT_THRESHOLD_BPS',
+    'LP_QUOTE_TIMEOUT_SECONDS',
+    'HEDGE_AFTER_MS',
+    'LP_CONCURRENCY',
+    'USE_UVLOOP',
+    'DATABASE_PATH',
+    'ENABLE_DATABASE_LOGGING',
+    'PARTITION_LP_QUOTES_BY_DAY',
+    'QUOTE_LOG_FLUSH_MS',
+    'LP_BACKEND',
+    'MOCK_LP_COUNT',
+    'MOCK_BASE_PRICE',
+    'MOCK_SPREAD_BPS',
+    'MOCK_MIN_DELAY',
+    'MOCK_MAX_DELAY',
+    'MOCK_FAILURE_RATE',
+)
+
+# (env_file, overwrite) -> (.env mtime in ns, values of _SETTING_ENV_VARS,
+# Settings parsed from them)
+_ENV_CACHE: Dict[Tuple[str, bool], Tuple[int, Tuple[Optional[str], ...], Settings]] = {}
+_ENV_CACHE_LOCK = threading.Lock()
+
+
+def _setting_env_values() -> Tuple[Optional[str], ...]:
+    """Current values of the variables from_env reads (cache key part)"""
+    return tuple(os.environ.get(name) for name in _SETTING_ENV_VARS)
+
+
+# KEY -> value for every variable a .env file put into os.environ, so a
+# reload can tell them apart from the real process environment
+_ENV_FILE_VALUES: Dict[str, str] = {}
+
+
+def _merge_env_file(env_file: str, overwrite: bool) -> None:
+    """
+    Copy a .env file into os.environ.
+
+    Variables from the real process environment win unless overwrite is
+    set. Variables an earlier load took from a .env file (and nobody has
+    changed since) are always updated, so edits to the file take effect.
+
+    Args:
+        env_file: Path to .env file
+        overwrite: Also replace variables from the real environment
+    """
+    for key, value in _read_env_file(env_file).items():
+        current = os.environ.get(key)
+        if overwrite or current is None or current == _ENV_FILE_VALUES.get(key):
+            os.environ[key] = value
+            _ENV_FILE_VALUES[key] = value
+
+
+def _read_env_file(env_file: str) -> Dict[str, str]:
+    """
+    Parse a .env file into a dictionary.
+
+    Args:
+        env_file: Path to .env file
+
+    Returns:
+        Dictionary of KEY -> value (later lines win)
+    """
+    values = {}
+    with open(env_file) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                key, value = line.split('=', 1)
+                values[key] = value
+    return values
+
 
 # Global settings instance
 settings = Settings.from_env('.env')
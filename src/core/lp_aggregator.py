@@ -5,11 +5,68 @@ Pings multiple LPs concurrently, selects best quote, and applies markup.
 """
 
 import asyncio
+import bisect
+import contextlib
+import logging
 import math
-from typing import List, Optional
+import time
+from collections import deque
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+from operator import gt, lt
+from typing import Deque, Dict, List, Optional, Tuple
 from .models import QuoteRequest, LPQuote, AggregatedQuote
 from ..lps.base_lp import LiquidityProvider
-from ..config.pairs import get_pair_config
+from ..config.pairs import TradingPairConfig, get_pair_config
+
+
+logger = logging.getLogger(__name__)
+
+# Response-time samples kept per LP for the hedging percentile
+_LATENCY_WINDOW = 100
+
+# Samples required before an LP's own p95 replaces hedge_after_ms
+_MIN_LATENCY_SAMPLES = 20
+
+# Powers of ten indexed by decimal places (avoids 10 ** n per rounding)
+_POW10 = tuple(10 ** i for i in range(12))
+
+# Quote routes keyed by (target_is_base, side).
+#
+# Each route takes (lp_price, amount, buy_mult, sell_mult) and returns
+# (client_price, client_gives_amount, client_receives_amount, client_gives_base).
+# When the client trades the quote asset the spread direction is inverted:
+# SELL quote (buy base) pays a premium, BUY quote (sell base) gets a discount.
+
+def _buy_base(lp_price: float, amount: float, buy_mult: float, sell_mult: float):
+    # Client buys base, pays quote: amount_base × price (quote per base)
+    client_price = lp_price * buy_mult
+    return client_price, amount * client_price, amount, False
+
+
+def _sell_base(lp_price: float, amount: float, buy_mult: float, sell_mult: float):
+    # Client sells base, receives quote: amount_base × price (quote per base)
+    client_price = lp_price * sell_mult
+    return client_price, amount, amount * client_price, True
+
+
+def _buy_quote(lp_price: float, amount: float, buy_mult: float, sell_mult: float):
+    # Client buys quote, pays base: amount_quote / price (base per quote)
+    client_price = lp_price * sell_mult
+    return client_price, amount / client_price, amount, True
+
+
+def _sell_quote(lp_price: float, amount: float, buy_mult: float, sell_mult: float):
+    # Client sells quote, receives base: amount_quote / price (base per quote)
+    client_price = lp_price * buy_mult
+    return client_price, amount, amount / client_price, False
+
+
+_QUOTE_ROUTES = {
+    (True, 'BUY'): _buy_base,
+    (True, 'SELL'): _sell_base,
+    (False, 'BUY'): _buy_quote,
+    (False, 'SELL'): _sell_quote,
+}
 
 
 class LPAggregator:
@@ -27,17 +84,61 @@ class LPAggregator:
         self,
         lps: List[LiquidityProvider],
         markup_bps: float = 5.0,
-        validity_buffer_seconds: float = 2.0
+        validity_buffer_seconds: float = 2.0,
+        exact_rounding: bool = False,
+        quote_timeout_seconds: Optional[float] = None,
+        hedge_after_ms: Optional[float] = None,
+        max_concurrent_requests: Optional[int] = None
     ):
         """
         Args:
             lps: List of LP instances
             markup_bps: Markup to add on top of LP quotes
             validity_buffer_seconds: Buffer to reduce LP validity for client
+            exact_rounding: Round client amounts with Decimal instead of float
+                arithmetic (slower, but exact at the last decimal place)
+            quote_timeout_seconds: Per-LP deadline for a quote response;
+                slower LPs are treated as declined (None = wait indefinitely)
+            hedge_after_ms: Send a duplicate request to an LP that hasn't
+                answered after this long (or after its own p95 latency once
+                enough samples exist) and keep whichever returns first
+                (None = no hedging)
+            max_concurrent_requests: Cap on LP quote requests in flight at
+                once across all polls; extra requests wait for a slot before
+                their timeout starts (None = unlimited)
         """
         self.lps = lps
-        self.markup_bps = markup_bps
+        # LP names are fixed for the aggregator's lifetime, so index them once
+        self._lp_by_name: Dict[str, LiquidityProvider] = {lp.get_name(): lp for lp in lps}
+        self.lp_names = frozenset(self._lp_by_name)
+        self.markup_bps = markup_bps  # Also sets _buy_mult / _sell_mult
         self.validity_buffer = validity_buffer_seconds
+        self.exact_rounding = exact_rounding
+        self.quote_timeout = quote_timeout_seconds
+        self.hedge_after_ms = hedge_after_ms
+        self._request_slots: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_concurrent_requests) if max_concurrent_requests else None
+        )
+
+        # lp_name -> recent response times in seconds (hedging only), in
+        # arrival order and kept sorted alongside so the p95 is an index
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._latencies_sorted: Dict[str, List[float]] = {}
+
+        # (base_asset, quote_asset) -> pair config, filled on first use
+        self._pair_cache: Dict[Tuple[str, str], TradingPairConfig] = {}
+
+    @property
+    def markup_bps(self) -> float:
+        """Markup in basis points applied to LP prices"""
+        return self._markup_bps
+
+    @markup_bps.setter
+    def markup_bps(self, value: float) -> None:
+        # Precompute price multipliers so quotes don't redo the bps math
+        self._markup_bps = value
+        self._buy_mult = 1 + value / 10000   # Client pays premium
+        self._sell_mult = 1 - value / 10000  # Client receives discount
 
     async def get_all_quotes(self, request: QuoteRequest) -> tuple[List[LPQuote], Optional[AggregatedQuote]]:
         """
@@ -50,28 +151,7 @@ class LPAggregator:
             Tuple of (all_lp_quotes, best_aggregated_quote)
             Returns ([], None) if no valid quotes received
         """
-        # Request quotes from all LPs concurrently
-        tasks = [lp.request_quote(request) for lp in self.lps]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Filter valid quotes (ignore errors and None)
-        valid_quotes = []
-        for result in results:
-            if isinstance(result, LPQuote) and result is not None:
-                valid_quotes.append(result)
-            elif isinstance(result, Exception):
-                print(f"LP error: {result}")
-
-        if not valid_quotes:
-            return [], None
-
-        # Select best quote based on side
-        best_lp_quote = self._select_best(valid_quotes, request.side)
-
-        # Apply markup and create aggregated quote
-        best_aggregated = self._create_aggregated_quote(best_lp_quote, request)
-
-        return valid_quotes, best_aggregated
+        return await self._gather_and_aggregate(self.lps, request)
 
     async def get_quotes_excluding(
         self,
@@ -92,58 +172,221 @@ class LPAggregator:
             Returns ([], None) if no valid quotes received
         """
         # Get LPs excluding the locked one
-        competitor_lps = [lp for lp in self.lps if lp.get_name() != excluded_lp_name]
+        competitor_lps = [
+            lp for name, lp in self._lp_by_name.items() if name != excluded_lp_name
+        ]
 
-        if not competitor_lps:
-            return [], None
+        return await self._gather_and_aggregate(competitor_lps, request)
 
-        # Request quotes from competitors only
-        tasks = [lp.request_quote(request) for lp in competitor_lps]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def get_best_quote(self, request: QuoteRequest) -> Optional[AggregatedQuote]:
+        """
+        Request quotes from all LPs and return best with markup.
 
-        # Filter valid quotes
-        valid_quotes = []
-        for result in results:
-            if isinstance(result, LPQuote) and result is not None:
-                valid_quotes.append(result)
-            elif isinstance(result, Exception):
-                print(f"LP error: {result}")
+        Args:
+            request: Quote request
 
-        if not valid_quotes:
-            return [], None
+        Returns:
+            AggregatedQuote with best LP price + markup, or None if no quotes
+        """
+        # Only the winner is needed, so skip building the valid-quote list
+        results = await self._gather_results(self.lps, request)
+        _, best_lp_quote = self._select_best(results, request.side, want_list=False)
 
-        # Select best from competitors
-        best_lp_quote = self._select_best(valid_quotes, request.side)
+        if best_lp_quote is None:
+            return None
+
+        return self._create_aggregated_quote(best_lp_quote, request)
+
+    async def _gather_and_aggregate(
+        self,
+        lps: List[LiquidityProvider],
+        request: QuoteRequest
+    ) -> tuple[List[LPQuote], Optional[AggregatedQuote]]:
+        """
+        Request quotes from the given LPs concurrently and aggregate the best.
+
+        Args:
+            lps: LPs to poll
+            request: Quote request
+
+        Returns:
+            Tuple of (valid_lp_quotes, best_aggregated_quote)
+            Returns ([], None) if no LPs given or no valid quotes received
+        """
+        results = await self._gather_results(lps, request)
+
+        # Filter valid quotes and find the best in a single pass
+        valid_quotes, best_lp_quote = self._select_best(results, request.side, want_list=True)
+
+        if best_lp_quote is None:
+            return [], None
 
         # Apply markup and create aggregated quote
         best_aggregated = self._create_aggregated_quote(best_lp_quote, request)
 
         return valid_quotes, best_aggregated
 
-    async def get_best_quote(self, request: QuoteRequest) -> Optional[AggregatedQuote]:
+    async def _gather_results(
+        self,
+        lps: List[LiquidityProvider],
+        request: QuoteRequest
+    ) -> List[Optional[LPQuote]]:
         """
-        Request quotes from all LPs and return best with markup.
+        Request quotes from the given LPs concurrently.
 
-        Args:
-            request: Quote request
+        Returns:
+            One entry per LP: LPQuote, or None if the LP declined or failed
+        """
+        if not lps:
+            return []
+
+        if len(lps) == 1:
+            # Single LP: await directly instead of scheduling a gather future.
+            # Errors are handled the same way as in the concurrent path.
+            return [await self._request_quote_safe(lps[0], request)]
+
+        # _request_quote_safe never raises, so one LP can't cancel the others
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._request_quote_safe(lp, request)) for lp in lps]
+
+        return [task.result() for task in tasks]
+
+    async def _request_quote_safe(
+        self,
+        lp: LiquidityProvider,
+        request: QuoteRequest
+    ) -> Optional[LPQuote]:
+        """
+        Request a quote from one LP, reporting errors instead of raising.
 
         Returns:
-            AggregatedQuote with best LP price + markup, or None if no quotes
+            LPQuote, or None if the LP declined, timed out or raised
+        """
+        # Wait for a request slot (if capped) outside the LP's timeout
+        async with self._request_slots or contextlib.nullcontext():
+            try:
+                if self.quote_timeout is None:
+                    return await self._request_quote(lp, request)
+                async with asyncio.timeout(self.quote_timeout):
+                    return await self._request_quote(lp, request)
+            except TimeoutError as e:
+                if self.quote_timeout is None:
+                    # Raised by the LP itself, not our deadline
+                    logger.warning("LP error: %s", e)
+                else:
+                    logger.warning("LP %s timed out after %.3fs", lp.get_name(), self.quote_timeout)
+                return None
+            except Exception as e:
+                logger.warning("LP error: %s", e)
+                return None
+
+    async def _request_quote(
+        self,
+        lp: LiquidityProvider,
+        request: QuoteRequest
+    ) -> Optional[LPQuote]:
+        """
+        Request a quote from one LP, hedging stragglers if enabled.
+
+        If the LP hasn't answered within the hedge delay a second identical
+        request is sent; the first successful response wins and the other
+        request is cancelled.
+        """
+        if self.hedge_after_ms is None:
+            return await lp.request_quote(request)
+
+        primary = asyncio.create_task(self._timed_request(lp, request))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self._hedge_delay(lp.get_name()))
+            if not done:
+                pending.add(asyncio.create_task(self._timed_request(lp, request)))
+
+            # First successful response wins; a failure waits for the other
+            while True:
+                if not done:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                task = done.pop()
+                if task.exception() is None or not (done or pending):
+                    return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _timed_request(
+        self,
+        lp: LiquidityProvider,
+        request: QuoteRequest
+    ) -> Optional[LPQuote]:
         """
-        _, best_quote = await self.get_all_quotes(request)
-        return best_quote
+        Request a quote and record the LP's response time.
 
-    def _select_best(self, quotes: List[LPQuote], side: str) -> LPQuote:
+        The sample is recorded even if the request fails or is cancelled
+        (hedge lost, or quote timeout), so slow requests still count
+        towards the p95 as at least the time they were allowed to run.
         """
-        Select best quote from list.
+        start = time.perf_counter()
+        try:
+            return await lp.request_quote(request)
+        finally:
+            self._record_latency(lp.get_name(), time.perf_counter() - start)
+
+    def _record_latency(self, lp_name: str, elapsed: float) -> None:
+        """Add a response time to the LP's window, evicting the oldest."""
+        samples = self._latencies.get(lp_name)
+        if samples is None:
+            samples = self._latencies[lp_name] = deque(maxlen=_LATENCY_WINDOW)
+            self._latencies_sorted[lp_name] = []
+        ordered = self._latencies_sorted[lp_name]
+
+        if len(samples) == _LATENCY_WINDOW:
+            del ordered[bisect.bisect_left(ordered, samples[0])]
+        samples.append(elapsed)
+        bisect.insort(ordered, elapsed)
+
+    def _hedge_delay(self, lp_name: str) -> float:
+        """Seconds to wait before hedging: the LP's p95, else hedge_after_ms."""
+        ordered = self._latencies_sorted.get(lp_name)
+        if ordered is None or len(ordered) < _MIN_LATENCY_SAMPLES:
+            return self.hedge_after_ms / 1000
+
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def _select_best(
+        self,
+        results: List[Optional[LPQuote]],
+        side: str,
+        want_list: bool
+    ) -> tuple[Optional[List[LPQuote]], Optional[LPQuote]]:
+        """
+        Filter LP results and select the best quote in one pass.
 
         For BUY: lowest ask (client pays less)
         For SELL: highest bid (client receives more)
+
+        Args:
+            results: Gathered LP results (None entries are skipped)
+            side: 'BUY' or 'SELL'
+            want_list: Also collect the valid quotes (otherwise returns None)
+
+        Returns:
+            Tuple of (valid_quotes or None, best_quote or None)
         """
-        if side == 'BUY':
-            return min(quotes, key=lambda q: q.price)
-        else:  # SELL
-            return max(quotes, key=lambda q: q.price)
+        valid_quotes = [] if want_list else None
+        better = lt if side == 'BUY' else gt
+        best = None
+        best_price = 0.0
+
+        for quote in results:
+            if quote is None:
+                continue
+            if want_list:
+                valid_quotes.append(quote)
+            if best is None or better(quote.price, best_price):
+                best = quote
+                best_price = quote.price
+
+        return valid_quotes, best
 
     def _create_aggregated_quote(
         self,
@@ -159,67 +402,26 @@ class LPAggregator:
         - Rounding rules (round up when client pays, down when client receives)
         """
         # Get pair configuration
-        pair_symbol = f"{request.base_asset}{request.quote_asset}"
-        pair_config = get_pair_config(pair_symbol)
-
-        # Determine spread direction based on what client is actually buying
-        # When client trades quote asset, the spread direction is inverted
-        if request.target_asset == request.base_asset:
-            # Client trading base - use side directly
-            # BUY base = pay premium, SELL base = receive discount
-            if request.side == 'BUY':
-                client_price = lp_quote.price * (1 + self.markup_bps / 10000)
-            else:  # SELL
-                client_price = lp_quote.price * (1 - self.markup_bps / 10000)
-        else:
-            # Client trading quote - invert spread direction
-            # SELL quote (buy base) = pay premium for base
-            # BUY quote (sell base) = receive discount for base
-            if request.side == 'SELL':
-                # Client sells quote, buys base → price should be higher
-                client_price = lp_quote.price * (1 + self.markup_bps / 10000)
-            else:  # BUY
-                # Client buys quote, sells base → price should be lower
-                client_price = lp_quote.price * (1 - self.markup_bps / 10000)
-
-        # Calculate amounts based on target asset
-        if request.target_asset == request.base_asset:
-            # Client trading base asset (e.g., BTC on BTCUSDT)
-            if request.side == 'BUY':
-                # Client buys base, pays quote
-                client_gives_asset = request.quote_asset
-                client_receives_asset = request.base_asset
-                client_receives_amount = request.amount
-                # Client pays: amount_base × price (quote per base)
-                client_gives_amount = request.amount * client_price
-            else:  # SELL
-                # Client sells base, receives quote
-                client_gives_asset = request.base_asset
-                client_receives_asset = request.quote_asset
-                client_gives_amount = request.amount
-                # Client receives: amount_base × price (quote per base)
-                client_receives_amount = request.amount * client_price
-
-        else:  # target_asset == quote_asset
-            # Client trading quote asset (e.g., USDT on BTCUSDT)
-            if request.side == 'BUY':
-                # Client buys quote, pays base
-                client_gives_asset = request.base_asset
-                client_receives_asset = request.quote_asset
-                client_receives_amount = request.amount
-                # Client pays: amount_quote / price (base per quote)
-                client_gives_amount = request.amount / client_price
-            else:  # SELL
-                # Client sells quote, receives base
-                client_gives_asset = request.quote_asset
-                client_receives_asset = request.base_asset
-                client_gives_amount = request.amount
-                # Client receives: amount_quote / price (base per quote)
-                client_receives_amount = request.amount / client_price
+        pair_config = self._get_pair_config(request.base_asset, request.quote_asset)
+
+        # Price and client flows for this (target asset, side) combination
+        target_is_base = request.target_asset == request.base_asset
+        route = _QUOTE_ROUTES[(target_is_base, request.side)]
+        client_price, client_gives_amount, client_receives_amount, gives_base = route(
+            lp_quote.price, request.amount, self._buy_mult, self._sell_mult
+        )
 
         # Apply rounding rules using pair-specific decimals
-        gives_decimals = pair_config.base_decimals if client_gives_asset == request.base_asset else pair_config.quote_decimals
-        receives_decimals = pair_config.base_decimals if client_receives_asset == request.base_asset else pair_config.quote_decimals
+        if gives_base:
+            client_gives_asset = request.base_asset
+            client_receives_asset = request.quote_asset
+            gives_decimals = pair_config.base_decimals
+            receives_decimals = pair_config.quote_decimals
+        else:
+            client_gives_asset = request.quote_asset
+            client_receives_asset = request.base_asset
+            gives_decimals = pair_config.quote_decimals
+            receives_decimals = pair_config.base_decimals
 
         client_gives_amount = self._round_amount(
             client_gives_amount,
@@ -259,6 +461,15 @@ class LPAggregator:
             validity_seconds=client_validity
         )
 
+    def _get_pair_config(self, base_asset: str, quote_asset: str) -> TradingPairConfig:
+        """Look up pair configuration, caching it per (base, quote) pair."""
+        key = (base_asset, quote_asset)
+        pair_config = self._pair_cache.get(key)
+        if pair_config is None:
+            pair_config = get_pair_config(base_asset + quote_asset)
+            self._pair_cache[key] = pair_config
+        return pair_config
+
     def _round_amount(self, amount: float, decimals: int, round_up: bool) -> float:
         """
         Round amount to specified decimal places.
@@ -271,7 +482,14 @@ class LPAggregator:
         Returns:
             Rounded amount
         """
-        multiplier = 10 ** decimals
+        if self.exact_rounding:
+            exact = Decimal(str(amount)).quantize(
+                Decimal(1).scaleb(-decimals),
+                rounding=ROUND_CEILING if round_up else ROUND_FLOOR
+            )
+            return float(exact)
+
+        multiplier = _POW10[decimals]
 
         if round_up:
             return math.ceil(amount * multiplier) / multiplier
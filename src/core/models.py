@@ -5,12 +5,27 @@ Defines the structure for quote requests, LP quotes, and aggregated quotes.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict
-from datetime import datetime
+from typing import Any, Optional
+import itertools
 import time
 
 
-@dataclass
+# Per-process sequence appended to quote IDs so IDs stay unique even when
+# two quotes are created within the same clock tick
+_quote_counter = itertools.count()
+
+
+def _monotonic_deadline(created_at: float, validity_seconds: float) -> float:
+    """
+    Convert a wall-clock creation time + validity into a monotonic deadline.
+
+    Time already elapsed since created_at (e.g. a backdated timestamp) is
+    taken into account once, at construction.
+    """
+    return time.monotonic() + validity_seconds - (time.time() - created_at)
+
+
+@dataclass(slots=True)
 class QuoteRequest:
     """Request sent to LPs for pricing"""
     side: str  # 'BUY' or 'SELL'
@@ -19,6 +34,9 @@ class QuoteRequest:
     quote_asset: str  # e.g., 'USDT'
     target_asset: str  # Which asset the amount is denominated in (base or quote)
     timestamp: float = field(default_factory=time.time)
+    # Monotonic time (ns) of the poll dispatching this request, set by the
+    # streamer so every LP prices off the same instant (None: LP reads clock)
+    poll_time_ns: Optional[int] = None
 
     def __post_init__(self):
         """Validate target_asset is either base or quote"""
@@ -32,7 +50,7 @@ class QuoteRequest:
         return f"{self.side} {self.amount} {self.target_asset} on {self.base_asset}/{self.quote_asset}"
 
 
-@dataclass
+@dataclass(slots=True)
 class LPQuote:
     """Quote received from a single LP"""
     lp_name: str
@@ -41,19 +59,30 @@ class LPQuote:
     validity_seconds: float  # How long quote is valid
     timestamp: float
     side: str
-    metadata: Optional[Dict] = None
+    metadata: Optional[Any] = None  # Dict, or an object with a dict-style get()
+
+    # Expiry deadline on the monotonic clock (set in __post_init__)
+    expiry_monotonic: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """
+        Anchor expiry to the monotonic clock.
+
+        The wall-clock timestamp is kept for logging; expiry checks use a
+        monotonic deadline so they are immune to system clock adjustments.
+        """
+        self.expiry_monotonic = _monotonic_deadline(self.timestamp, self.validity_seconds)
 
     def is_expired(self) -> bool:
         """Check if quote has expired"""
-        return (time.time() - self.timestamp) > self.validity_seconds
+        return time.monotonic() >= self.expiry_monotonic
 
     def time_remaining(self) -> float:
         """Seconds remaining before expiry"""
-        elapsed = time.time() - self.timestamp
-        return max(0, self.validity_seconds - elapsed)
+        return max(0.0, self.expiry_monotonic - time.monotonic())
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedQuote:
     """Final quote shown to client (LP quote + markup)"""
     quote_id: str
@@ -86,16 +115,22 @@ class AggregatedQuote:
     validity_seconds: float
     created_at: float = field(default_factory=time.time)
 
+    # Expiry deadline on the monotonic clock (set in __post_init__)
+    expiry_monotonic: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Anchor client expiry to the monotonic clock (see LPQuote)"""
+        self.expiry_monotonic = _monotonic_deadline(self.created_at, self.validity_seconds)
+
     def is_expired(self) -> bool:
         """Check if client quote has expired"""
-        return (time.time() - self.created_at) > self.validity_seconds
+        return time.monotonic() >= self.expiry_monotonic
 
     def time_remaining(self) -> float:
         """Seconds remaining for client"""
-        elapsed = time.time() - self.created_at
-        return max(0, self.validity_seconds - elapsed)
+        return max(0.0, self.expiry_monotonic - time.monotonic())
 
     @staticmethod
     def generate_id() -> str:
-        """Generate unique quote ID"""
-        return f"Q{datetime.now().strftime('%Y%m%d-%H%M%S-%f')[:19]}"
+        """Generate unique quote ID (nanosecond timestamp + sequence number)"""
+        return f"Q{time.time_ns()}-{next(_quote_counter):x}"
@@ -6,7 +6,11 @@ Implements quote locking: once an LP wins, they're not polled again until beaten
 """
 
 import asyncio
-from typing import Callable, Optional, List, TYPE_CHECKING
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import ge, le
+from typing import Callable, Literal, Optional, List, Tuple, TYPE_CHECKING
 from .lp_aggregator import LPAggregator
 from .models import QuoteRequest, AggregatedQuote, LPQuote
 
@@ -14,6 +18,17 @@ if TYPE_CHECKING:
     from ..database.quote_logger import QuoteLogger
 
 
+logger = logging.getLogger(__name__)
+
+CallbackMode = Literal['sync', 'soon', 'thread']
+
+
+def _log_callback_error(future: Future) -> None:
+    """Report exceptions from callbacks run on the callback thread."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Quote callback failed: %s", future.exception())
+
+
 class QuoteStreamer:
     """
     Continuously polls LPs and streams quote improvements.
@@ -28,143 +43,158 @@ class QuoteStreamer:
 
     def __init__(self, aggregator: LPAggregator, poll_interval_ms: int = 500,
                  improvement_threshold_bps: float = 1.0,
-                 quote_logger: Optional['QuoteLogger'] = None):
+                 quote_logger: Optional['QuoteLogger'] = None,
+                 hedge_after_ms: Optional[float] = None,
+                 heartbeat_polls: int = 20):
         """
         Args:
             aggregator: LP aggregator instance
             poll_interval_ms: How often to poll LPs (milliseconds)
             improvement_threshold_bps: Minimum improvement to switch quotes (basis points)
             quote_logger: Optional database logger for quotes
+            hedge_after_ms: If set, re-request from LPs slower than this
+                (see LPAggregator hedge_after_ms)
+            heartbeat_polls: Polls that leave the locked quote unchanged are
+                not logged individually; they are recorded as one heartbeat
+                every this many polls (and when the lock changes)
         """
         self.aggregator = aggregator
         self.poll_interval_ms = poll_interval_ms
         self.improvement_threshold_bps = improvement_threshold_bps
         self.quote_logger = quote_logger
+        self.heartbeat_polls = heartbeat_polls
         self.streaming = False
 
+        if hedge_after_ms is not None:
+            self.aggregator.hedge_after_ms = hedge_after_ms
+
         # Quote locking state
         self.locked_lp_name: Optional[str] = None  # Currently locked LP
         self.locked_quote: Optional[AggregatedQuote] = None  # Frozen locked quote
         self.locked_lp_quote: Optional[LPQuote] = None  # Original LP quote (for display)
+        self._expires_at = 0.0  # Locked quote expiry on the event loop clock
+
+        # Improvement trigger for the locked quote: a competitor must satisfy
+        # _trigger_cmp(client_price, _trigger_price) to take the lock
+        self._trigger_price = 0.0
+        self._trigger_cmp = le
+
+        # Unchanged polls since the locked quote was last logged
+        self._quiet_polls = 0
+
+        # on_quote_update dispatch (set per stream; see stream_quotes)
+        self._callback_mode: CallbackMode = 'sync'
+        self._cb_executor: Optional[ThreadPoolExecutor] = None
+
+        # Reused each poll for competitors + frozen locked quote (see stream_quotes)
+        self._display_buf: List[LPQuote] = []
 
     async def stream_quotes(
         self,
         request: QuoteRequest,
-        on_quote_update: Callable[[List[LPQuote], AggregatedQuote, int, bool, Optional[str]], None],
+        on_quote_update: Callable[[List[LPQuote], AggregatedQuote, int, bool, Optional[str], Optional[LPQuote]], None],
         duration_seconds: float = None,
-        auto_refresh: bool = False
+        auto_refresh: bool = False,
+        callback_mode: CallbackMode = 'sync'
     ):
         """
         Stream quotes with locking logic.
 
         Args:
             request: Quote request to stream
-            on_quote_update: Callback(all_lp_quotes, best_quote, poll_count, is_improvement, locked_lp_name)
+            on_quote_update: Callback(all_lp_quotes, best_quote, poll_count, is_improvement,
+                locked_lp_name, locked_lp_quote); locked_lp_quote is the locked LP's
+                original quote.
+                all_lp_quotes may be a buffer reused on the next poll: treat it
+                as read-only and copy it if it must outlive the callback.
             duration_seconds: How long to stream (None = until quote expires or manual stop)
             auto_refresh: If True, automatically request new quote when expired
+            callback_mode: How on_quote_update is invoked:
+                'sync'   - inline, before the next poll (default)
+                'soon'   - scheduled with loop.call_soon (for non-critical callbacks)
+                'thread' - on a dedicated worker thread (for blocking callbacks)
         """
+        if callback_mode not in ('sync', 'soon', 'thread'):
+            raise ValueError(f"Unknown callback_mode: {callback_mode}")
+        self._callback_mode = callback_mode
+
         self.streaming = True
         self.locked_lp_name = None
         self.locked_quote = None
         self.locked_lp_quote = None
+        self._quiet_polls = 0
 
-        poll_count = 0
-        start_time = asyncio.get_event_loop().time()
-
-        # FIRST POLL: Get quotes from ALL LPs
-        poll_count += 1
-        all_lp_quotes, best_quote = await self.aggregator.get_all_quotes(request)
+        try:
+            await self._poll_until_done(request, on_quote_update, duration_seconds, auto_refresh)
+        finally:
+            self.streaming = False
+            self._shutdown_callback_thread()
 
-        if not best_quote:
+    async def _poll_until_done(
+        self,
+        request: QuoteRequest,
+        on_quote_update: Callable,
+        duration_seconds: Optional[float],
+        auto_refresh: bool
+    ) -> None:
+        """Lock the first quote, then poll competitors until the stream ends."""
+        loop = asyncio.get_running_loop()
+        poll_count = 1
+        start_time = loop.time()
+
+        # FIRST POLL: Get quotes from ALL LPs and lock the winner
+        if not await self._lock_fresh_quote(request, on_quote_update, poll_count):
             print("[!] No quotes received from LPs")
-            self.streaming = False
             return
 
-        # LOCK THE WINNER
-        self.locked_lp_name = best_quote.lp_name
-        self.locked_quote = best_quote
-        # Find the original LP quote for this winner
-        self.locked_lp_quote = next((q for q in all_lp_quotes if q.lp_name == best_quote.lp_name), None)
-
-        # Callback with initial locked quote
-        on_quote_update(all_lp_quotes, best_quote, poll_count, True, self.locked_lp_name)
-
-        # Log to database if logger is available
-        if self.quote_logger:
-            self.quote_logger.log_quote(best_quote, all_lp_quotes, poll_count, True, self.locked_lp_name)
+        # SUBSEQUENT POLLS: Poll only competitors, on a fixed cadence
+        # (sleep until the next deadline so LP latency doesn't add drift)
+        interval = self.poll_interval_ms / 1000
+        next_deadline = loop.time() + interval
+        fell_behind = False
 
-        # SUBSEQUENT POLLS: Poll only competitors
         loop_count = 0
         while self.streaming:
             loop_count += 1
 
-            # Wait before next poll
-            await asyncio.sleep(self.poll_interval_ms / 1000)
-
-            # Check expiry before polling (use time_remaining to match monitor display)
-            if self.locked_quote.time_remaining() <= 0:
-                if auto_refresh:
-                    # Auto-refresh: Request fresh quote from ALL LPs
-                    poll_count = 0  # Reset poll count
-                    poll_count += 1
-                    all_lp_quotes, best_quote = await self.aggregator.get_all_quotes(request)
-
-                    if not best_quote:
-                        print("[!] No quotes received from LPs on auto-refresh")
-                        break
-
-                    # Lock the new winner
-                    self.locked_lp_name = best_quote.lp_name
-                    self.locked_quote = best_quote
-                    self.locked_lp_quote = next((q for q in all_lp_quotes if q.lp_name == best_quote.lp_name), None)
-
-                    # Callback with new locked quote
-                    on_quote_update(all_lp_quotes, best_quote, poll_count, True, self.locked_lp_name)
-
-                    # Log to database if logger is available
-                    if self.quote_logger:
-                        self.quote_logger.log_quote(best_quote, all_lp_quotes, poll_count, True, self.locked_lp_name)
-
-                    continue
-                else:
-                    # Stop streaming if quote expired
+            # Wait for the next poll deadline
+            now = loop.time()
+            if now - next_deadline >= interval:
+                # More than a whole interval late: skip the missed ticks
+                # instead of firing catch-up polls back to back
+                if not fell_behind:
+                    logger.warning("Polls slower than %dms interval; skipping missed ticks",
+                                   self.poll_interval_ms)
+                    fell_behind = True
+                next_deadline = now
+            await asyncio.sleep(max(0.0, next_deadline - now))
+            next_deadline += interval
+
+            # Check expiry before polling
+            if loop.time() >= self._expires_at:
+                if not auto_refresh:
+                    break  # Stop streaming if quote expired
+                ok, poll_count = await self._auto_refresh(request, on_quote_update)
+                if not ok:
                     break
+                continue
 
             poll_count += 1
 
             # Poll only non-locked LPs
+            request.poll_time_ns = time.monotonic_ns()
             competitor_quotes, best_competitor = await self.aggregator.get_quotes_excluding(
                 self.locked_lp_name, request
             )
 
             # Re-check expiry AFTER polling (locked quote may have expired during poll)
-            if self.locked_quote.time_remaining() <= 0:
-                if auto_refresh:
-                    # Auto-refresh: Request fresh quote from ALL LPs
-                    poll_count = 0  # Reset poll count
-                    poll_count += 1
-                    all_lp_quotes, best_quote = await self.aggregator.get_all_quotes(request)
-
-                    if not best_quote:
-                        print("[!] No quotes received from LPs on auto-refresh")
-                        break
-
-                    # Lock the new winner
-                    self.locked_lp_name = best_quote.lp_name
-                    self.locked_quote = best_quote
-                    self.locked_lp_quote = next((q for q in all_lp_quotes if q.lp_name == best_quote.lp_name), None)
-
-                    # Callback with new locked quote
-                    on_quote_update(all_lp_quotes, best_quote, poll_count, True, self.locked_lp_name)
-
-                    # Log to database if logger is available
-                    if self.quote_logger:
-                        self.quote_logger.log_quote(best_quote, all_lp_quotes, poll_count, True, self.locked_lp_name)
-
-                    continue
-                else:
-                    # Stop streaming if quote expired
+            if loop.time() >= self._expires_at:
+                if not auto_refresh:
+                    break  # Stop streaming if quote expired
+                ok, poll_count = await self._auto_refresh(request, on_quote_update)
+                if not ok:
                     break
+                continue
 
             # Check if any competitor beats the locked quote
             is_improvement = False
@@ -174,20 +204,22 @@ class QuoteStreamer:
                 old_locked_lp_quote = self.locked_lp_quote  # Save old LP quote for display
 
                 # Lock new winner
+                self._flush_quiet_polls()
                 self.locked_lp_name = best_competitor.lp_name
                 self.locked_quote = best_competitor
-                self.locked_lp_quote = next((q for q in competitor_quotes if q.lp_name == best_competitor.lp_name), None)
+                competitors_by_name = {q.lp_name: q for q in competitor_quotes}
+                self.locked_lp_quote = competitors_by_name.get(best_competitor.lp_name)
+                self._expires_at = loop.time() + best_competitor.time_remaining()
+                self._set_trigger(best_competitor, request.side)
 
                 is_improvement = True
 
                 # For display: include old locked LP's frozen quote in all_quotes
                 # (so it appears in leaderboard as available for re-polling)
-                if old_locked_lp_quote:
-                    all_display_quotes = competitor_quotes + [old_locked_lp_quote]
-                else:
-                    all_display_quotes = competitor_quotes
+                all_display_quotes = self._fill_display_buf(competitor_quotes, old_locked_lp_quote)
 
-                on_quote_update(all_display_quotes, best_competitor, poll_count, is_improvement, self.locked_lp_name)
+                self._emit(on_quote_update, all_display_quotes, best_competitor, poll_count, is_improvement,
+                           self.locked_lp_name, self.locked_lp_quote)
 
                 # Log to database if logger is available
                 if self.quote_logger:
@@ -195,35 +227,150 @@ class QuoteStreamer:
             else:
                 # No improvement, keep locked quote
                 # Display competitors + frozen locked LP quote
-                if self.locked_lp_quote:
-                    all_display_quotes = competitor_quotes + [self.locked_lp_quote]
-                else:
-                    all_display_quotes = competitor_quotes
+                all_display_quotes = self._fill_display_buf(competitor_quotes, self.locked_lp_quote)
 
-                on_quote_update(all_display_quotes, self.locked_quote, poll_count, False, self.locked_lp_name)
+                self._emit(on_quote_update, all_display_quotes, self.locked_quote, poll_count, False,
+                           self.locked_lp_name, self.locked_lp_quote)
 
-                # Log to database if logger is available (non-improvement polls also logged)
-                if self.quote_logger:
-                    self.quote_logger.log_quote(self.locked_quote, all_display_quotes, poll_count, False, self.locked_lp_name)
+                # Nothing changed: count the poll and log a periodic heartbeat
+                self._quiet_polls += 1
+                if self._quiet_polls >= self.heartbeat_polls:
+                    self._flush_quiet_polls()
 
             # Check duration limit if specified
             if duration_seconds is not None:
-                elapsed = asyncio.get_event_loop().time() - start_time
+                elapsed = loop.time() - start_time
                 if elapsed >= duration_seconds:
                     break
 
-        self.streaming = False
+        self._flush_quiet_polls()
 
-    def _is_meaningful_improvement(self, new_quote: AggregatedQuote, side: str) -> bool:
+    def _emit(self, on_quote_update: Callable, all_lp_quotes: List[LPQuote], *args) -> None:
+        """Invoke the quote callback according to the stream's callback_mode."""
+        if self._callback_mode == 'sync':
+            on_quote_update(all_lp_quotes, *args)
+            return
+
+        # Deferred callbacks run after the display buffer may have been
+        # refilled, so they get their own copy
+        all_lp_quotes = list(all_lp_quotes)
+
+        if self._callback_mode == 'soon':
+            asyncio.get_running_loop().call_soon(on_quote_update, all_lp_quotes, *args)
+        else:
+            if self._cb_executor is None:
+                # One worker keeps callbacks in poll order
+                self._cb_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quote-callback")
+            future = self._cb_executor.submit(on_quote_update, all_lp_quotes, *args)
+            future.add_done_callback(_log_callback_error)
+
+    def _shutdown_callback_thread(self) -> None:
+        """Let the 'thread' mode worker finish queued callbacks and exit."""
+        if self._cb_executor is not None:
+            self._cb_executor.shutdown(wait=False)
+            self._cb_executor = None
+
+    def _flush_quiet_polls(self) -> None:
+        """Log unchanged polls for the locked quote as one heartbeat."""
+        if self._quiet_polls and self.quote_logger and self.locked_quote:
+            self.quote_logger.log_heartbeat(self.locked_quote, self._quiet_polls)
+        self._quiet_polls = 0
+
+    def _fill_display_buf(self, competitor_quotes: List[LPQuote],
+                          frozen_quote: Optional[LPQuote]) -> List[LPQuote]:
+        """Refill the reusable display list with competitors + frozen quote."""
+        buf = self._display_buf
+        buf.clear()
+        buf.extend(competitor_quotes)
+        if frozen_quote:
+            buf.append(frozen_quote)
+        return buf
+
+    async def _lock_fresh_quote(
+        self,
+        request: QuoteRequest,
+        on_quote_update: Callable,
+        poll_count: int
+    ) -> bool:
         """
-        Check if new quote beats locked quote by at least IMPROVEMENT_THRESHOLD_BPS.
+        Poll ALL LPs, lock the winner and report it.
+
+        Returns:
+            False if no LP returned a quote
+        """
+        request.poll_time_ns = time.monotonic_ns()
+        all_lp_quotes, best_quote = await self.aggregator.get_all_quotes(request)
+
+        if not best_quote:
+            return False
+
+        # LOCK THE WINNER
+        self._flush_quiet_polls()
+        self.locked_lp_name = best_quote.lp_name
+        self.locked_quote = best_quote
+        # Find the original LP quote for this winner
+        by_name = {q.lp_name: q for q in all_lp_quotes}
+        self.locked_lp_quote = by_name.get(best_quote.lp_name)
+        # Expiry on the loop clock, computed once per lock (matches time_remaining)
+        self._expires_at = asyncio.get_running_loop().time() + best_quote.time_remaining()
+        self._set_trigger(best_quote, request.side)
+
+        # Callback with new locked quote
+        self._emit(on_quote_update, all_lp_quotes, best_quote, poll_count, True,
+                   self.locked_lp_name, self.locked_lp_quote)
+
+        # Log to database if logger is available
+        if self.quote_logger:
+            self.quote_logger.log_quote(best_quote, all_lp_quotes, poll_count, True, self.locked_lp_name)
+
+        return True
+
+    async def _auto_refresh(
+        self,
+        request: QuoteRequest,
+        on_quote_update: Callable
+    ) -> Tuple[bool, int]:
+        """
+        Replace an expired locked quote with a fresh one from ALL LPs.
+
+        Returns:
+            (ok, poll_count): ok is False if no LP quoted; poll_count
+            restarts at 1 for the new quote
+        """
+        poll_count = 1  # Reset poll count
+        if not await self._lock_fresh_quote(request, on_quote_update, poll_count):
+            print("[!] No quotes received from LPs on auto-refresh")
+            return False, poll_count
+
+        return True, poll_count
+
+    def _set_trigger(self, locked_quote: AggregatedQuote, side: str) -> None:
+        """
+        Precompute the price a competitor must reach to beat the locked quote.
 
         For BUY: new_price <= locked_price - threshold
         For SELL: new_price >= locked_price + threshold
+        """
+        threshold = self.improvement_threshold_bps / 10000
+        if side == 'BUY':
+            # For BUY, lower price is better
+            self._trigger_price = locked_quote.client_price * (1 - threshold)
+            self._trigger_cmp = le
+        else:  # SELL
+            # For SELL, higher price is better
+            self._trigger_price = locked_quote.client_price * (1 + threshold)
+            self._trigger_cmp = ge
+
+    def _is_meaningful_improvement(self, new_quote: AggregatedQuote, side: str) -> bool:
+        """
+        Check if new quote beats locked quote by at least IMPROVEMENT_THRESHOLD_BPS.
+
+        The trigger price is precomputed by _set_trigger() when a quote is
+        locked, so this is a single comparison.
 
         Args:
             new_quote: New quote from competitor
-            side: 'BUY' or 'SELL'
+            side: 'BUY' or 'SELL' (already applied when the trigger was set)
 
         Returns:
             True if improvement is meaningful (≥1bp)
@@ -231,15 +378,7 @@ class QuoteStreamer:
         if not self.locked_quote:
             return True
 
-        # Calculate threshold in price terms
-        threshold = self.locked_quote.client_price * (self.improvement_threshold_bps / 10000)
-
-        if side == 'BUY':
-            # For BUY, lower price is better
-            return new_quote.client_price <= (self.locked_quote.client_price - threshold)
-        else:  # SELL
-            # For SELL, higher price is better
-            return new_quote.client_price >= (self.locked_quote.client_price + threshold)
+        return self._trigger_cmp(new_quote.client_price, self._trigger_price)
 
     def stop(self):
         """Stop streaming"""
@@ -4,17 +4,147 @@ Quote Logger - Database logging for LP Aggregation RFQ System.
 Logs all quotes, LP responses, and performance metrics to SQLite database.
 """
 
+import asyncio
+import heapq
 import sqlite3
 import json
+import threading
 import time
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from ..core.models import AggregatedQuote, LPQuote
+from .schema import LP_QUOTES_PARTITION_SQL
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used without it
+    orjson = None
+
+
+def _dumps_metadata(metadata: Any) -> str:
+    """
+    Serialize LP quote metadata to a JSON string (orjson if installed).
+
+    metadata is a dict or a dataclass (e.g. SineMeta), written as an object.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(metadata).decode()
+        except TypeError:
+            pass  # Types orjson rejects (e.g. huge ints): use stdlib json
+    return json.dumps(metadata, default=_json_default)
+
+
+def _json_default(obj: Any) -> Any:
+    """json.dumps fallback: dataclass metadata is written as a dict."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Pending log_quote() records buffered for the background writer
+_WRITE_QUEUE_SIZE = 1024
+
+# Max records committed per writer transaction
+_WRITE_BATCH_SIZE = 64
+
+# Write statements are module constants so every call reuses the same
+# text and hits the connection's prepared-statement cache
+_INSERT_QUOTE_SQL = """
+    INSERT OR IGNORE INTO quotes (
+        quote_id, side, base_asset, quote_asset, target_asset, amount,
+        client_price, lp_price, lp_name, markup_bps,
+        validity_seconds, is_improvement, locked_lp_name,
+        poll_number, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# {table} is lp_quotes, or lp_day.lp_quotes when partitioned by day
+_INSERT_LP_QUOTE_SQL = """
+    INSERT INTO {table} (
+        quote_id, lp_name, price, quantity,
+        validity_seconds, response_time_ms, timestamp,
+        side, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_HEARTBEAT_SQL = """
+    UPDATE quotes SET poll_count_since = poll_count_since + ? WHERE quote_id = ?
+"""
+
+# Write the cached LP performance counters (absolute values)
+_UPSERT_PERFORMANCE_SQL = """
+    INSERT INTO lp_performance (
+        lp_name, total_quotes, total_wins, win_rate,
+        avg_response_time_ms, best_price, worst_price, last_updated
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(lp_name) DO UPDATE SET
+        total_quotes = excluded.total_quotes,
+        total_wins = excluded.total_wins,
+        win_rate = excluded.win_rate,
+        avg_response_time_ms = excluded.avg_response_time_ms,
+        best_price = excluded.best_price,
+        worst_price = excluded.worst_price,
+        last_updated = excluded.last_updated
+"""
+
+
+@dataclass(slots=True)
+class _LPPerformance:
+    """In-memory running performance counters for one LP."""
+    lp_name: str
+    total_quotes: int = 0
+    total_wins: int = 0
+    avg_response_time_ms: Optional[float] = None
+    response_samples: int = 0
+    best_price: Optional[float] = None
+    worst_price: Optional[float] = None
+    last_updated: float = 0.0
+
+    def record(self, won: bool, price: float, response_time_ms: Optional[float], now: float) -> None:
+        """Fold one quote into the counters."""
+        self.total_quotes += 1
+        if won:
+            self.total_wins += 1
+
+        # Running mean of response time (0 / None mean "no sample")
+        if response_time_ms:
+            self.response_samples += 1
+            if self.avg_response_time_ms is None:
+                self.avg_response_time_ms = response_time_ms
+            else:
+                self.avg_response_time_ms += (
+                    (response_time_ms - self.avg_response_time_ms) / self.response_samples
+                )
+
+        self.best_price = price if self.best_price is None else min(price, self.best_price)
+        self.worst_price = price if self.worst_price is None else max(price, self.worst_price)
+        self.last_updated = now
+
+    def as_row(self) -> tuple:
+        """Parameter tuple for _UPSERT_PERFORMANCE_SQL."""
+        return (
+            self.lp_name,
+            self.total_quotes,
+            self.total_wins,
+            (self.total_wins / self.total_quotes) * 100 if self.total_quotes else 0.0,
+            self.avg_response_time_ms,
+            self.best_price,
+            self.worst_price,
+            self.last_updated
+        )
 
 
 class QuoteLogger:
     """
     Logs quote data to SQLite database.
 
+    Close it explicitly: use it as a context manager (``with`` or
+    ``async with``), or call close() / await aclose().
+
     Provides methods for:
     - Logging aggregated quotes
     - Logging individual LP quotes
@@ -22,17 +152,74 @@ class QuoteLogger:
     - Querying historical data
     """
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        partition_lp_quotes_by_day: bool = False,
+        flush_interval_seconds: float = 0.0
+    ):
         """
         Initialize QuoteLogger.
 
         Args:
             db_path: Path to SQLite database file
+            partition_lp_quotes_by_day: Write LP quotes to one file per UTC
+                day (lp_quotes_YYYYMMDD.sqlite next to db_path) instead of
+                the main lp_quotes table, so old days can be archived or
+                deleted as files
+            flush_interval_seconds: Once a record is queued, keep
+                collecting for up to this long before committing, so bursts
+                of polls share one transaction (0 = commit whatever is
+                queued right away)
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.partition_lp_quotes_by_day = partition_lp_quotes_by_day
+        self.flush_interval_seconds = flush_interval_seconds
+        self._partition_path: Optional[str] = None  # Day file currently attached as lp_day
+        self._insert_lp_quote_sql = _INSERT_LP_QUOTE_SQL.format(
+            table='lp_day.lp_quotes' if partition_lp_quotes_by_day else 'lp_quotes'
+        )
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
         self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
 
+        # Autocommit mode: transactions are opened explicitly (see _transaction)
+        self.conn.isolation_level = None
+
+        # WAL lets readers (get_recent_quotes, the blotter, view_db) read a
+        # consistent snapshot without blocking the writer, and NORMAL sync
+        # only fsyncs at checkpoints instead of on every commit
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA wal_autocheckpoint=1000;
+        """)
+
+        # One cursor for all writes (only used while holding _lock);
+        # readers keep their own since they may run on another thread
+        self._cursor = self.conn.cursor()
+
+        # LP performance is tracked in memory and flushed with each logged
+        # poll, instead of a SELECT + UPDATE per LP per poll
+        self._perf_cache: Dict[str, _LPPerformance] = {}
+        self._perf_dirty = set()
+        self._load_performance()
+
+        # All writes go through one dedicated thread (keeps them ordered and
+        # off the event loop); the lock guards the connection and perf cache
+        self._lock = threading.RLock()
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quote-logger")
+
+        # Background writer (created lazily on the running event loop)
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Records the writer has taken off the queue but not yet handed to
+        # the DB thread (only non-empty during flush_interval_seconds), so
+        # close() can write them
+        self._collecting: Optional[List[tuple]] = None
+
     def log_quote(
         self,
         quote: AggregatedQuote,
@@ -44,6 +231,10 @@ class QuoteLogger:
         """
         Log an aggregated quote to the database.
 
+        Inside a running event loop the record is queued and written by a
+        background task, so the polling loop never waits on SQLite. Without
+        a loop (scripts, tests) it is written immediately.
+
         Args:
             quote: Aggregated quote shown to client
             all_lp_quotes: All LP quotes received in this poll
@@ -51,53 +242,185 @@ class QuoteLogger:
             is_improvement: Whether this quote is an improvement
             locked_lp_name: Name of currently locked LP
         """
-        cursor = self.conn.cursor()
+        # Copy the list: callers may reuse it for the next poll
+        self._submit(
+            (self._write_quote, (quote, list(all_lp_quotes), poll_num, is_improvement, locked_lp_name))
+        )
+
+    def log_heartbeat(self, quote: AggregatedQuote, quiet_polls: int) -> None:
+        """
+        Record polls that left the locked quote unchanged.
+
+        Instead of a row per unchanged poll, the locked quote's row counts
+        them in poll_count_since.
+
+        Args:
+            quote: Currently locked quote (already logged via log_quote)
+            quiet_polls: Unchanged polls since the last log/heartbeat
+        """
+        if quiet_polls > 0:
+            self._submit((self._write_heartbeat, (quote.quote_id, quiet_polls)))
+
+    def _submit(self, record: tuple) -> None:
+        """Queue a (write_fn, args) record, or write it now if no loop is running."""
+        queue = self._get_queue()
+        if queue is None:
+            self._write_batch([record])
+            return
 
         try:
-            cursor.execute("""
-                INSERT INTO quotes (
-                    quote_id, side, base_asset, quote_asset, target_asset, amount,
-                    client_price, lp_price, lp_name, markup_bps,
-                    validity_seconds, is_improvement, locked_lp_name,
-                    poll_number, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                quote.quote_id,
-                quote.side,
-                quote.base_asset,
-                quote.quote_asset,
-                quote.target_asset,
-                quote.amount,
-                quote.client_price,
-                quote.lp_price,
-                quote.lp_name,
-                quote.markup_bps,
-                quote.validity_seconds,
-                1 if is_improvement else 0,
-                locked_lp_name,
-                poll_num,
-                quote.created_at
-            ))
-
-            self.conn.commit()
-
-            # Log all LP quotes
-            self.log_lp_quotes(quote.quote_id, all_lp_quotes)
-
-            # Update LP performance for the winning LP
-            self.update_lp_performance(quote.lp_name, won=True, price=quote.lp_price)
-
-            # Update performance for losing LPs
-            for lp_quote in all_lp_quotes:
-                if lp_quote.lp_name != quote.lp_name:
-                    self.update_lp_performance(lp_quote.lp_name, won=False, price=lp_quote.price)
-
-        except sqlite3.IntegrityError as e:
-            # Quote ID already exists (duplicate), skip
-            pass
+            queue.put_nowait(record)
+        except asyncio.QueueFull:
+            # Writer is falling behind: write inline rather than drop the poll
+            self._write_batch([record])
+
+    async def aclose(self) -> None:
+        """Wait for queued quotes to be written, then close the connection."""
+        if self._queue is not None and self._writer_task is not None and not self._writer_task.done():
+            await self._queue.join()
+        self.close()
+
+    async def run_db(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking database call on the logger's DB thread.
+
+        Args:
+            fn: Callable using this logger's connection
+            *args: Positional arguments for fn
+
+        Returns:
+            Whatever fn returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, fn, *args)
+
+    def _get_queue(self) -> Optional[asyncio.Queue]:
+        """Return the write queue for the running loop (None if no loop)."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        if self._writer_task is None or self._writer_task.done():
+            # First use, or the previous loop has gone away
+            self._queue = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+            self._writer_task = asyncio.create_task(self._writer_loop(self._queue))
+        return self._queue
+
+    async def _writer_loop(self, queue: asyncio.Queue) -> None:
+        """Drain the queue, committing up to _WRITE_BATCH_SIZE records at a time."""
+        try:
+            while True:
+                batch = [await queue.get()]
+                self._collecting = batch
+                if self.flush_interval_seconds > 0:
+                    await self._collect_until(queue, batch, self.flush_interval_seconds)
+                while len(batch) < _WRITE_BATCH_SIZE and not queue.empty():
+                    batch.append(queue.get_nowait())
+                self._collecting = None
+
+                try:
+                    await self.run_db(self._write_batch, batch)
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+        finally:
+            # Cancelled (loop shutdown / close): don't lose collected or queued records
+            self._write_collected(queue)
+            self._drain_queue(queue)
+
+    def _write_collected(self, queue: asyncio.Queue) -> None:
+        """Synchronously write records the writer collected but hadn't submitted."""
+        batch, self._collecting = self._collecting, None
+        if batch:
+            self._write_batch(batch)
+            for _ in batch:
+                queue.task_done()
+
+    @staticmethod
+    async def _collect_until(queue: asyncio.Queue, batch: List[tuple], interval: float) -> None:
+        """Append queued records to batch until it is full or interval has passed."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + interval
+        while len(batch) < _WRITE_BATCH_SIZE:
+            try:
+                async with asyncio.timeout_at(deadline):
+                    batch.append(await queue.get())
+            except TimeoutError:
+                return
+
+    def _drain_queue(self, queue: asyncio.Queue) -> None:
+        """Synchronously write anything still queued."""
+        batch = []
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+            queue.task_done()
+        if batch:
+            self._write_batch(batch)
+
+    def _write_batch(self, records: List[tuple]) -> None:
+        """Write queued (write_fn, args) records in a single transaction."""
+        if self.conn is None:
+            return
+
+        try:
+            # Lock held past the commit so no update lands between the
+            # commit and clearing _perf_dirty
+            with self._lock:
+                with self._transaction():
+                    for write, args in records:
+                        write(self._cursor, *args)
+                    self._flush_perf(self._cursor)
+                self._perf_dirty.clear()
         except Exception as e:
-            print(f"[QuoteLogger] Error logging quote: {e}")
-            self.conn.rollback()
+            print(f"[QuoteLogger] Error logging {len(records)} quote(s): {e}")
+
+    def _write_quote(
+        self,
+        cursor: sqlite3.Cursor,
+        quote: AggregatedQuote,
+        all_lp_quotes: List[LPQuote],
+        poll_num: int,
+        is_improvement: bool,
+        locked_lp_name: Optional[str]
+    ) -> None:
+        """Insert one quote, its LP quotes and performance updates (no commit)."""
+        cursor.execute(_INSERT_QUOTE_SQL, (
+            quote.quote_id,
+            quote.side,
+            quote.base_asset,
+            quote.quote_asset,
+            quote.target_asset,
+            quote.amount,
+            quote.client_price,
+            quote.lp_price,
+            quote.lp_name,
+            quote.markup_bps,
+            quote.validity_seconds,
+            1 if is_improvement else 0,
+            locked_lp_name,
+            poll_num,
+            quote.created_at
+        ))
+
+        if cursor.rowcount == 0:
+            # Quote ID already exists (duplicate), skip
+            return
+
+        # Log all LP quotes
+        self._insert_lp_quotes(cursor, quote.quote_id, all_lp_quotes)
+
+        # Update LP performance for the winning LP
+        self.update_lp_performance(quote.lp_name, won=True, price=quote.lp_price)
+
+        # Update performance for losing LPs
+        for lp_quote in all_lp_quotes:
+            if lp_quote.lp_name != quote.lp_name:
+                self.update_lp_performance(lp_quote.lp_name, won=False, price=lp_quote.price)
+
+    def _write_heartbeat(self, cursor: sqlite3.Cursor, quote_id: str, quiet_polls: int) -> None:
+        """Add quiet polls to a logged quote's poll_count_since (no commit)."""
+        cursor.execute(_HEARTBEAT_SQL, (quiet_polls, quote_id))
 
     def log_lp_quotes(self, quote_id: str, lp_quotes: List[LPQuote]) -> None:
         """
@@ -107,40 +430,32 @@ class QuoteLogger:
             quote_id: ID of the parent aggregated quote
             lp_quotes: List of LP quotes to log
         """
-        cursor = self.conn.cursor()
-
-        for lp_quote in lp_quotes:
-            try:
-                # Calculate response time if available
-                response_time_ms = None
-                if lp_quote.metadata and 'delay_ms' in lp_quote.metadata:
-                    response_time_ms = lp_quote.metadata['delay_ms']
-
-                # Serialize metadata to JSON
-                metadata_json = json.dumps(lp_quote.metadata) if lp_quote.metadata else None
-
-                cursor.execute("""
-                    INSERT INTO lp_quotes (
-                        quote_id, lp_name, price, quantity,
-                        validity_seconds, response_time_ms, timestamp,
-                        side, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    quote_id,
-                    lp_quote.lp_name,
-                    lp_quote.price,
-                    lp_quote.quantity,
-                    lp_quote.validity_seconds,
-                    response_time_ms,
-                    lp_quote.timestamp,
-                    lp_quote.side,
-                    metadata_json
-                ))
-
-            except Exception as e:
-                print(f"[QuoteLogger] Error logging LP quote for {lp_quote.lp_name}: {e}")
-
-        self.conn.commit()
+        try:
+            with self._transaction():
+                self._insert_lp_quotes(self._cursor, quote_id, lp_quotes)
+        except Exception as e:
+            print(f"[QuoteLogger] Error logging LP quotes for {quote_id}: {e}")
+
+    def _insert_lp_quotes(self, cursor: sqlite3.Cursor, quote_id: str, lp_quotes: List[LPQuote]) -> None:
+        """Insert LP quote rows with one executemany (no commit)."""
+        # response_time_ms comes from metadata['delay_ms'] when available;
+        # metadata is only serialized when present
+        rows = [
+            (
+                quote_id,
+                q.lp_name,
+                q.price,
+                q.quantity,
+                q.validity_seconds,
+                q.metadata.get('delay_ms') if q.metadata else None,
+                q.timestamp,
+                q.side,
+                _dumps_metadata(q.metadata) if q.metadata else None
+            )
+            for q in lp_quotes
+        ]
+
+        cursor.executemany(self._insert_lp_quote_sql, rows)
 
     def update_lp_performance(
         self,
@@ -150,7 +465,10 @@ class QuoteLogger:
         response_time_ms: Optional[float] = None
     ) -> None:
         """
-        Update LP performance metrics.
+        Update LP performance metrics (in memory).
+
+        Changes are written by the next log_quote() transaction, or by
+        close() / the stats getters if nothing else is logged.
 
         Args:
             lp_name: Name of the LP
@@ -158,79 +476,181 @@ class QuoteLogger:
             price: Price quoted by the LP
             response_time_ms: Response time in milliseconds (optional)
         """
-        cursor = self.conn.cursor()
+        with self._lock:
+            perf = self._perf_cache.get(lp_name)
+            if perf is None:
+                perf = self._perf_cache[lp_name] = _LPPerformance(lp_name)
+            perf.record(won, price, response_time_ms, time.time())
+            self._perf_dirty.add(lp_name)
+
+    def _load_performance(self) -> None:
+        """Seed the in-memory performance cache from the database."""
+        for row in self.conn.execute("SELECT * FROM lp_performance"):
+            self._perf_cache[row['lp_name']] = _LPPerformance(
+                lp_name=row['lp_name'],
+                total_quotes=row['total_quotes'],
+                total_wins=row['total_wins'],
+                avg_response_time_ms=row['avg_response_time_ms'],
+                # Previously stored averages were taken over all quotes
+                response_samples=row['total_quotes'] if row['avg_response_time_ms'] else 0,
+                best_price=row['best_price'],
+                worst_price=row['worst_price'],
+                last_updated=row['last_updated']
+            )
+
+    def _flush_perf(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Write changed LP performance rows.
 
+        The caller owns the transaction and clears _perf_dirty once it has
+        committed, so a rollback leaves the rows marked for the next write.
+        """
+        if self._perf_dirty:
+            cursor.executemany(
+                _UPSERT_PERFORMANCE_SQL,
+                [self._perf_cache[lp_name].as_row() for lp_name in self._perf_dirty]
+            )
+
+    def _flush_pending_performance(self) -> None:
+        """Persist performance updates not yet written by log_quote()."""
+        if not self._perf_dirty:
+            return
         try:
-            # Check if LP exists
-            cursor.execute("SELECT * FROM lp_performance WHERE lp_name = ?", (lp_name,))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update existing record
-                total_quotes = existing['total_quotes'] + 1
-                total_wins = existing['total_wins'] + (1 if won else 0)
-                win_rate = (total_wins / total_quotes) * 100
-
-                # Update average response time
-                if response_time_ms:
-                    if existing['avg_response_time_ms']:
-                        avg_response_time_ms = (
-                            (existing['avg_response_time_ms'] * existing['total_quotes'] + response_time_ms) /
-                            total_quotes
-                        )
-                    else:
-                        avg_response_time_ms = response_time_ms
-                else:
-                    avg_response_time_ms = existing['avg_response_time_ms']
-
-                # Update best/worst prices
-                best_price = min(price, existing['best_price']) if existing['best_price'] else price
-                worst_price = max(price, existing['worst_price']) if existing['worst_price'] else price
-
-                cursor.execute("""
-                    UPDATE lp_performance
-                    SET total_quotes = ?,
-                        total_wins = ?,
-                        win_rate = ?,
-                        avg_response_time_ms = ?,
-                        best_price = ?,
-                        worst_price = ?,
-                        last_updated = ?
-                    WHERE lp_name = ?
-                """, (
-                    total_quotes,
-                    total_wins,
-                    win_rate,
-                    avg_response_time_ms,
-                    best_price,
-                    worst_price,
-                    time.time(),
-                    lp_name
-                ))
+            with self._lock:
+                with self._transaction():
+                    self._flush_perf(self._cursor)
+                self._perf_dirty.clear()
+        except Exception as e:
+            print(f"[QuoteLogger] Error flushing LP performance: {e}")
 
-            else:
-                # Insert new record
-                cursor.execute("""
-                    INSERT INTO lp_performance (
-                        lp_name, total_quotes, total_wins, win_rate,
-                        avg_response_time_ms, best_price, worst_price, last_updated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    lp_name,
-                    1,
-                    1 if won else 0,
-                    100.0 if won else 0.0,
-                    response_time_ms,
-                    price,
-                    price,
-                    time.time()
-                ))
-
-            self.conn.commit()
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """
+        Run a block of writes in one IMMEDIATE transaction.
 
-        except Exception as e:
-            print(f"[QuoteLogger] Error updating LP performance for {lp_name}: {e}")
-            self.conn.rollback()
+        Commits on success, rolls back and re-raises on error. Holds the
+        connection lock so the DB thread and callers don't interleave.
+        """
+        with self._lock:
+            if self.partition_lp_quotes_by_day:
+                # ATTACH/DETACH can't run inside a transaction
+                self._roll_partition(time.time())
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+                self.conn.commit()
+            except BaseException:
+                # Also covers a failed COMMIT, which leaves the transaction open
+                self.conn.rollback()
+                raise
+
+    def executemany(self, sql: str, rows: List[tuple]) -> None:
+        """
+        Run a write statement for many rows in one transaction.
+
+        For other components sharing this logger's connection (e.g.
+        execution logging); raises on error after rolling back.
+
+        Args:
+            sql: Parameterized INSERT/UPDATE statement
+            rows: Parameter tuples
+        """
+        with self._transaction():
+            self._cursor.executemany(sql, rows)
+
+    def db_path_for(self, ts: float) -> str:
+        """
+        Path of the per-day LP quotes file for a timestamp.
+
+        Args:
+            ts: Unix timestamp
+
+        Returns:
+            Path to lp_quotes_YYYYMMDD.sqlite (UTC day) next to db_path
+        """
+        day = time.strftime('%Y%m%d', time.gmtime(ts))
+        return str(Path(self.db_path).parent / f"lp_quotes_{day}.sqlite")
+
+    def _roll_partition(self, now: float) -> None:
+        """Attach today's LP quotes file as lp_day (caller holds _lock)."""
+        path = self.db_path_for(now)
+        if path == self._partition_path:
+            return
+
+        if self._partition_path is not None:
+            self.conn.execute("DETACH DATABASE lp_day")
+        self.conn.execute("ATTACH DATABASE ? AS lp_day", (path,))
+        self.conn.execute("PRAGMA lp_day.journal_mode=WAL")
+        self.conn.executescript(LP_QUOTES_PARTITION_SQL.format(schema='lp_day'))
+        self._partition_path = path
+
+    def get_lp_quote_history(
+        self,
+        lp_name: Optional[str] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Get individual LP quotes, newest first, with optional filters.
+
+        With per-day partitioning, each day file in the requested range is
+        queried separately (using its own index) and the results merged;
+        rows in the main lp_quotes table are included too.
+
+        Args:
+            lp_name: Filter by LP name (optional)
+            start_time: Filter by start timestamp (optional)
+            end_time: Filter by end timestamp (optional)
+            limit: Maximum number of results
+
+        Returns:
+            List of LP quote dictionaries
+        """
+        query = "SELECT * FROM lp_quotes WHERE 1=1"
+        params: List[Any] = []
+
+        if lp_name:
+            query += " AND lp_name = ?"
+            params.append(lp_name)
+
+        if start_time:
+            query += " AND timestamp >= ?"
+            params.append(start_time)
+
+        if end_time:
+            query += " AND timestamp <= ?"
+            params.append(end_time)
+
+        query += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            results = [[dict(row) for row in self.conn.execute(query, params)]]
+
+        if self.partition_lp_quotes_by_day:
+            for path in self._partition_files(start_time, end_time):
+                conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+                conn.row_factory = sqlite3.Row
+                try:
+                    results.append([dict(row) for row in conn.execute(query, params)])
+                finally:
+                    conn.close()
+
+        merged = heapq.merge(*results, key=lambda row: row['timestamp'], reverse=True)
+        return [row for _, row in zip(range(limit), merged)]
+
+    def _partition_files(self, start_time: Optional[float], end_time: Optional[float]) -> List[str]:
+        """Existing per-day LP quote files overlapping [start_time, end_time]."""
+        first = Path(self.db_path_for(start_time)).name if start_time else None
+        last = Path(self.db_path_for(end_time)).name if end_time else None
+
+        files = []
+        for path in Path(self.db_path).parent.glob("lp_quotes_????????.sqlite"):
+            # File names sort by day, so compare them directly
+            if (first is None or path.name >= first) and (last is None or path.name <= last):
+                files.append(str(path))
+        return sorted(files)
 
     def get_recent_quotes(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -242,14 +662,15 @@ class QuoteLogger:
         Returns:
             List of quote dictionaries
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM quotes
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (limit,))
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT * FROM quotes
+                ORDER BY created_at DESC
+                LIMIT ?
+            """, (limit,))
 
-        return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_lp_stats(self, lp_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -261,14 +682,16 @@ class QuoteLogger:
         Returns:
             Dictionary of performance metrics, or None if LP not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM lp_performance
-            WHERE lp_name = ?
-        """, (lp_name,))
+        with self._lock:
+            self._flush_pending_performance()
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT * FROM lp_performance
+                WHERE lp_name = ?
+            """, (lp_name,))
 
-        row = cursor.fetchone()
-        return dict(row) if row else None
+            row = cursor.fetchone()
+            return dict(row) if row else None
 
     def get_all_lp_stats(self) -> List[Dict[str, Any]]:
         """
@@ -277,13 +700,15 @@ class QuoteLogger:
         Returns:
             List of LP performance dictionaries, sorted by win rate
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM lp_performance
-            ORDER BY win_rate DESC
-        """)
+        with self._lock:
+            self._flush_pending_performance()
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT * FROM lp_performance
+                ORDER BY win_rate DESC
+            """)
 
-        return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_quote_history(
         self,
@@ -304,8 +729,6 @@ class QuoteLogger:
         Returns:
             List of quote dictionaries
         """
-        cursor = self.conn.cursor()
-
         query = "SELECT * FROM quotes WHERE 1=1"
         params = []
 
@@ -324,14 +747,39 @@ class QuoteLogger:
         query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
 
-        cursor.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(query, params)]
 
     def close(self) -> None:
         """Close database connection."""
-        if self.conn:
-            self.conn.close()
-
-    def __del__(self):
-        """Ensure connection is closed on deletion."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self._queue is not None:
+            # The cancelled writer's cleanup only runs on the next loop
+            # iteration, after the connection is gone, so write what it
+            # holds here
+            self._write_collected(self._queue)
+            self._drain_queue(self._queue)
+            self._queue = None
+
+        # Let any in-flight batch on the DB thread finish
+        self._db_executor.shutdown(wait=True)
+
+        with self._lock:
+            if self.conn:
+                self._flush_pending_performance()
+                self.conn.close()
+                self.conn = None
+
+    def __enter__(self) -> 'QuoteLogger':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
         self.close()
+
+    async def __aenter__(self) -> 'QuoteLogger':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
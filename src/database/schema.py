@@ -11,10 +11,146 @@ import sqlite3
 from pathlib import Path
 
 
+# lp_quotes layout for per-day partition files (see QuoteLogger
+# partition_lp_quotes_by_day). {schema} is the ATTACH alias; there is no
+# foreign key because the parent quotes live in the main database.
+LP_QUOTES_PARTITION_SQL = """
+    CREATE TABLE IF NOT EXISTS {schema}.lp_quotes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        quote_id TEXT NOT NULL,
+        lp_name TEXT NOT NULL,
+        price REAL NOT NULL,
+        quantity REAL NOT NULL,
+        validity_seconds REAL NOT NULL,
+        response_time_ms REAL,
+        timestamp REAL NOT NULL,
+        side TEXT NOT NULL,
+        metadata TEXT
+    );
+    CREATE INDEX IF NOT EXISTS {schema}.idx_lp_quotes_quote_id ON lp_quotes(quote_id);
+    CREATE INDEX IF NOT EXISTS {schema}.idx_lp_quotes_ts ON lp_quotes(lp_name, timestamp DESC);
+"""
+
+
+# Full schema, applied by init_database as one script in one transaction.
+# Every statement is idempotent so it can run against existing databases.
+_SCHEMA_SQL = """
+    -- Aggregated quotes shown to client
+    CREATE TABLE IF NOT EXISTS quotes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        quote_id TEXT UNIQUE NOT NULL,
+        side TEXT NOT NULL,
+        base_asset TEXT NOT NULL,
+        quote_asset TEXT NOT NULL,
+        target_asset TEXT NOT NULL,
+        amount REAL NOT NULL,
+        client_price REAL NOT NULL,
+        lp_price REAL NOT NULL,
+        lp_name TEXT NOT NULL,
+        markup_bps REAL NOT NULL,
+        validity_seconds REAL NOT NULL,
+        is_improvement INTEGER NOT NULL,
+        locked_lp_name TEXT,
+        poll_number INTEGER NOT NULL,
+        poll_count_since INTEGER NOT NULL DEFAULT 0,
+        created_at REAL NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_quotes_created_at
+    ON quotes(created_at);
+
+    -- (lp_name, created_at) serves get_quote_history's filter + ORDER BY
+    -- without a temp sort; it also covers plain lp_name lookups, so the
+    -- old single-column index is dropped
+    CREATE INDEX IF NOT EXISTS idx_quotes_lp_created
+    ON quotes(lp_name, created_at DESC);
+
+    DROP INDEX IF EXISTS idx_quotes_lp_name;
+
+    CREATE INDEX IF NOT EXISTS idx_quotes_quote_id
+    ON quotes(quote_id);
+
+    -- Individual LP responses
+    CREATE TABLE IF NOT EXISTS lp_quotes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        quote_id TEXT NOT NULL,
+        lp_name TEXT NOT NULL,
+        price REAL NOT NULL,
+        quantity REAL NOT NULL,
+        validity_seconds REAL NOT NULL,
+        response_time_ms REAL,
+        timestamp REAL NOT NULL,
+        side TEXT NOT NULL,
+        metadata TEXT,
+        FOREIGN KEY (quote_id) REFERENCES quotes(quote_id)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_lp_quotes_quote_id
+    ON lp_quotes(quote_id);
+
+    CREATE INDEX IF NOT EXISTS idx_lp_quotes_ts
+    ON lp_quotes(lp_name, timestamp DESC);
+
+    DROP INDEX IF EXISTS idx_lp_quotes_lp_name;
+
+    -- LP performance metrics
+    CREATE TABLE IF NOT EXISTS lp_performance (
+        lp_name TEXT PRIMARY KEY,
+        total_quotes INTEGER DEFAULT 0,
+        total_wins INTEGER DEFAULT 0,
+        win_rate REAL DEFAULT 0.0,
+        avg_response_time_ms REAL,
+        best_price REAL,
+        worst_price REAL,
+        last_updated REAL NOT NULL
+    );
+
+    -- Trade executions
+    CREATE TABLE IF NOT EXISTS executions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        execution_id TEXT UNIQUE NOT NULL,
+        quote_id TEXT NOT NULL,
+        status TEXT NOT NULL,
+        lp_name TEXT NOT NULL,
+        exchange_side TEXT NOT NULL,
+        quantity REAL,
+        quote_qty REAL,
+        executed_qty REAL,
+        executed_quote_qty REAL,
+        avg_price REAL,
+        commission REAL,
+        commission_asset TEXT,
+        pnl_amount REAL,
+        pnl_asset TEXT,
+        pnl_after_fees REAL,
+        pnl_bps REAL,
+        error_message TEXT,
+        executed_at REAL NOT NULL,
+        FOREIGN KEY (quote_id) REFERENCES quotes(quote_id)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_executions_quote_id
+    ON executions(quote_id);
+
+    CREATE INDEX IF NOT EXISTS idx_executions_executed_at
+    ON executions(executed_at);
+
+    CREATE INDEX IF NOT EXISTS idx_executions_status
+    ON executions(status);
+"""
+
+# Migrates databases created before quotes.poll_count_since existed
+_ADD_POLL_COUNT_SINCE_SQL = """
+    ALTER TABLE quotes ADD COLUMN poll_count_since INTEGER NOT NULL DEFAULT 0;
+"""
+
+
 def init_database(db_path: str) -> None:
     """
     Initialize database and create tables if they don't exist.
 
+    The whole schema is applied in a single transaction (one commit).
+
     Args:
         db_path: Path to SQLite database file
     """
@@ -23,131 +159,18 @@ def init_database(db_path: str) -> None:
     db_file.parent.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Create quotes table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS quotes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            quote_id TEXT UNIQUE NOT NULL,
-            side TEXT NOT NULL,
-            base_asset TEXT NOT NULL,
-            quote_asset TEXT NOT NULL,
-            target_asset TEXT NOT NULL,
-            amount REAL NOT NULL,
-            client_price REAL NOT NULL,
-            lp_price REAL NOT NULL,
-            lp_name TEXT NOT NULL,
-            markup_bps REAL NOT NULL,
-            validity_seconds REAL NOT NULL,
-            is_improvement INTEGER NOT NULL,
-            locked_lp_name TEXT,
-            poll_number INTEGER NOT NULL,
-            created_at REAL NOT NULL
-        )
-    """)
-
-    # Create indexes for quotes table
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_quotes_created_at
-        ON quotes(created_at)
-    """)
-
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_quotes_lp_name
-        ON quotes(lp_name)
-    """)
-
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_quotes_quote_id
-        ON quotes(quote_id)
-    """)
-
-    # Create lp_quotes table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS lp_quotes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            quote_id TEXT NOT NULL,
-            lp_name TEXT NOT NULL,
-            price REAL NOT NULL,
-            quantity REAL NOT NULL,
-            validity_seconds REAL NOT NULL,
-            response_time_ms REAL,
-            timestamp REAL NOT NULL,
-            side TEXT NOT NULL,
-            metadata TEXT,
-            FOREIGN KEY (quote_id) REFERENCES quotes(quote_id)
-        )
-    """)
-
-    # Create indexes for lp_quotes table
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_lp_quotes_quote_id
-        ON lp_quotes(quote_id)
-    """)
-
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_lp_quotes_lp_name
-        ON lp_quotes(lp_name)
-    """)
-
-    # Create lp_performance table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS lp_performance (
-            lp_name TEXT PRIMARY KEY,
-            total_quotes INTEGER DEFAULT 0,
-            total_wins INTEGER DEFAULT 0,
-            win_rate REAL DEFAULT 0.0,
-            avg_response_time_ms REAL,
-            best_price REAL,
-            worst_price REAL,
-            last_updated REAL NOT NULL
-        )
-    """)
-
-    # Create executions table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS executions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            execution_id TEXT UNIQUE NOT NULL,
-            quote_id TEXT NOT NULL,
-            status TEXT NOT NULL,
-            lp_name TEXT NOT NULL,
-            exchange_side TEXT NOT NULL,
-            quantity REAL,
-            quote_qty REAL,
-            executed_qty REAL,
-            executed_quote_qty REAL,
-            avg_price REAL,
-            commission REAL,
-            commission_asset TEXT,
-            pnl_amount REAL,
-            pnl_asset TEXT,
-            pnl_after_fees REAL,
-            pnl_bps REAL,
-            error_message TEXT,
-            executed_at REAL NOT NULL,
-            FOREIGN KEY (quote_id) REFERENCES quotes(quote_id)
-        )
-    """)
-
-    # Create indexes for executions table
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_executions_quote_id
-        ON executions(quote_id)
-    """)
-
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_executions_executed_at
-        ON executions(executed_at)
-    """)
-
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_executions_status
-        ON executions(status)
-    """)
-
-    conn.commit()
-    conn.close()
+    try:
+        # Switch to WAL first (can't change inside a transaction) so the
+        # schema write below already lands in WAL mode
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        quote_columns = {row[1] for row in conn.execute("PRAGMA table_info(quotes)")}
+        migration = ""
+        if quote_columns and 'poll_count_since' not in quote_columns:
+            migration = _ADD_POLL_COUNT_SINCE_SQL
+
+        conn.executescript("BEGIN;" + _SCHEMA_SQL + migration + "COMMIT;")
+    finally:
+        conn.close()
 
     print(f"[Database] Initialized at {db_path}")
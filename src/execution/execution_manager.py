@@ -8,13 +8,17 @@ Handles:
 - Database logging
 """
 
+import asyncio
+import itertools
+import logging
 import time
-from typing import Dict, Optional, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 from ..core.models import AggregatedQuote, LPQuote
-from ..config.pairs import get_pair_config
-from .hedge_calculator import determine_hedge_params
-from .pnl_calculator import calculate_pnl
+from ..config.pairs import TradingPairConfig, get_pair_config
+from .hedge_calculator import _hedge_from_flows
+from .pnl_calculator import _pnl_from_flows
 from .simulator import execute_simulated_trade
 
 if TYPE_CHECKING:
@@ -22,6 +26,110 @@ if TYPE_CHECKING:
     from ..database.quote_logger import QuoteLogger
 
 
+logger = logging.getLogger(__name__)
+
+# Execution IDs are a process-start timestamp plus a per-process sequence, so
+# they are cheap to build and can't collide within the same microsecond
+_ID_PREFIX = datetime.now().strftime('%Y%m%d-%H%M%S')
+_ID_COUNTER = itertools.count()
+
+# Max execution rows written per transaction by the log writer
+_FLUSH_MAX_ROWS = 100
+
+# Module constant so every batch reuses the connection's prepared statement
+_INSERT_EXECUTION_SQL = """
+    INSERT INTO executions (
+        execution_id, quote_id, status, lp_name, exchange_side,
+        quantity, quote_qty, executed_qty, executed_quote_qty,
+        avg_price, commission, commission_asset,
+        pnl_amount, pnl_asset, pnl_after_fees, pnl_bps,
+        error_message, executed_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+@dataclass(slots=True)
+class ExecutionResult:
+    """Outcome of executing a confirmed quote (one executions table row)"""
+    execution_id: str
+    status: str  # 'SUCCESS' or 'FAILED'
+    quote_id: str
+    lp_name: str
+    executed_at: float
+    exchange_side: Optional[str] = None  # Hedge side
+    quantity: Optional[float] = None
+    quote_qty: Optional[float] = None
+    executed_qty: Optional[float] = None
+    executed_quote_qty: Optional[float] = None
+    avg_price: Optional[float] = None
+    commission: Optional[float] = None
+    commission_asset: Optional[str] = None
+    pnl_amount: Optional[float] = None  # Gross P&L
+    pnl_asset: Optional[str] = None
+    pnl_after_fees: Optional[float] = None  # Net P&L
+    pnl_bps: Optional[float] = None
+    error_message: Optional[str] = None
+
+    def as_row(self) -> tuple:
+        """Parameter tuple for _INSERT_EXECUTION_SQL."""
+        return (
+            self.execution_id,
+            self.quote_id,
+            self.status,
+            self.lp_name,
+            self.exchange_side,
+            self.quantity,
+            self.quote_qty,
+            self.executed_qty,
+            self.executed_quote_qty,
+            self.avg_price,
+            self.commission,
+            self.commission_asset,
+            self.pnl_amount,
+            self.pnl_asset,
+            self.pnl_after_fees,
+            self.pnl_bps,
+            self.error_message,
+            self.executed_at
+        )
+
+
+def _compute_trade(quote: AggregatedQuote, pair_config: TradingPairConfig) -> tuple:
+    """
+    Hedge, simulate and compute P&L for a quote in one pass.
+
+    Same results as determine_hedge_params -> execute_simulated_trade ->
+    calculate_pnl, but each quote and pair field is read once.
+
+    Returns:
+        Tuple of ((exchange_side, quantity, quote_qty), execution result,
+        (pnl_amount, pnl_asset, pnl_after_fees, pnl_bps))
+    """
+    base_asset = pair_config.base_asset
+    quote_asset = pair_config.quote_asset
+    profit_asset = pair_config.profit_asset
+    side = quote.side
+    target_is_base = quote.target_asset == base_asset
+    client_gives = quote.client_gives_amount
+    client_receives = quote.client_receives_amount
+    market_price = quote.lp_price
+    notional_quote = client_gives if quote.client_gives_asset == quote_asset else client_receives
+
+    hedge = _hedge_from_flows(
+        target_is_base, side, profit_asset, client_gives, client_receives, market_price
+    )
+    exchange_side, quantity, quote_qty = hedge
+
+    exec_result = execute_simulated_trade(quote, exchange_side, quantity, quote_qty, market_price)
+
+    pnl = _pnl_from_flows(
+        target_is_base, side, profit_asset, base_asset, quote_asset,
+        client_gives, client_receives, notional_quote, market_price,
+        exec_result.executed_qty, exec_result.executed_quote_qty, exec_result.commission
+    )
+    return hedge, exec_result, pnl
+
+
 class ExecutionManager:
     """
     Manages trade execution flow.
@@ -35,22 +143,41 @@ class ExecutionManager:
     6. Log to database
     """
 
-    def __init__(self, lps: Dict[str, 'LiquidityProvider'], quote_logger: Optional['QuoteLogger'] = None):
+    def __init__(
+        self,
+        lps: Dict[str, 'LiquidityProvider'],
+        quote_logger: Optional['QuoteLogger'] = None,
+        on_logged: Optional[Callable[[], None]] = None
+    ):
         """
         Initialize execution manager.
 
         Args:
             lps: Dictionary of LP name -> LP instance
             quote_logger: Optional database logger
+            on_logged: Called after execution rows are committed (e.g.
+                ExecutionBlotter.notify); runs on the DB thread
         """
         self.lps = lps
         self.quote_logger = quote_logger
+        self.on_logged = on_logged
+        # (base, quote) -> (pair config, commission asset by hedge side)
+        self._pair_cfg_cache: Dict[Tuple[str, str], Tuple[TradingPairConfig, Tuple[str, str]]] = {}
+
+        # No database: execute_quote's logging call becomes a no-op
+        if quote_logger is None:
+            self._log_execution = lambda result: None
+
+        # Execution rows are queued and written by a background task on the
+        # quote logger's DB thread (created lazily on the running loop)
+        self._log_q: Optional[asyncio.Queue] = None
+        self._log_writer_task: Optional[asyncio.Task] = None
 
     async def execute_quote(
         self,
         quote: AggregatedQuote,
         lp_quote: LPQuote
-    ) -> Dict:
+    ) -> ExecutionResult:
         """
         Execute a confirmed quote.
 
@@ -59,7 +186,7 @@ class ExecutionManager:
             lp_quote: Original LP quote
 
         Returns:
-            Execution result dictionary with:
+            ExecutionResult with:
             - execution_id: Unique execution ID
             - status: 'SUCCESS' or 'FAILED'
             - lp_name: LP name
@@ -75,8 +202,14 @@ class ExecutionManager:
             - error_message: Error if failed
             - executed_at: Timestamp
         """
-        execution_id = self._generate_execution_id()
-        executed_at = time.time()
+        # Starts out FAILED; each outcome fills in its own fields
+        result = ExecutionResult(
+            execution_id=self._generate_execution_id(),
+            status='FAILED',
+            quote_id=quote.quote_id,
+            lp_name=quote.lp_name,
+            executed_at=time.time()
+        )
 
         try:
             # Get LP instance
@@ -85,146 +218,137 @@ class ExecutionManager:
                 raise ValueError(f"LP not found: {quote.lp_name}")
 
             # Get pair config
-            pair_config = get_pair_config(f"{quote.base_asset}{quote.quote_asset}")
+            pair_config, commission_asset_by_side = self._get_pair_config(quote.base_asset, quote.quote_asset)
 
-            # Calculate hedge parameters
-            exchange_side, quantity, quote_qty = determine_hedge_params(
-                quote,
-                quote.side,
-                quote.target_asset,
-                pair_config
-            )
+            # Hedge parameters, simulated hedge and P&L. The simulation is
+            # pure, so it is priced up front and only recorded once the LP
+            # confirms the client trade
+            (exchange_side, quantity, quote_qty), exec_result, pnl = _compute_trade(quote, pair_config)
 
             # Execute with LP (client side trade)
             lp_success = await lp.execute_trade(lp_quote, quote)
 
-            if not lp_success:
+            if lp_success:
+                result.status = 'SUCCESS'
+                result.executed_qty = exec_result.executed_qty
+                result.executed_quote_qty = exec_result.executed_quote_qty
+                result.avg_price = exec_result.avg_price
+                result.commission = exec_result.commission
+                result.commission_asset = commission_asset_by_side[exchange_side == 'BUY']
+                result.pnl_amount, result.pnl_asset, result.pnl_after_fees, result.pnl_bps = pnl
+            else:
                 # LP execution failed
-                result = {
-                    'execution_id': execution_id,
-                    'status': 'FAILED',
-                    'quote_id': quote.quote_id,
-                    'lp_name': quote.lp_name,
-                    'exchange_side': exchange_side,
-                    'quantity': quantity,
-                    'quote_qty': quote_qty,
-                    'error_message': 'LP execution failed',
-                    'executed_at': executed_at
-                }
-
-                # Log to database
-                if self.quote_logger:
-                    self._log_execution(result)
-
-                return result
-
-            # Simulate hedge execution (in production, this would be a real exchange trade)
-            exec_result = execute_simulated_trade(
-                quote, exchange_side, quantity, quote_qty, quote.lp_price
-            )
-
-            # Calculate P&L
-            pnl_amount, pnl_asset, pnl_after_fees, pnl_bps = calculate_pnl(
-                quote, quote.side, quote.target_asset, exec_result, pair_config
-            )
-
-            # Build execution result
-            result = {
-                'execution_id': execution_id,
-                'status': 'SUCCESS',
-                'quote_id': quote.quote_id,
-                'lp_name': quote.lp_name,
-                'exchange_side': exchange_side,
-                'quantity': quantity,
-                'quote_qty': quote_qty,
-                'executed_qty': exec_result['executed_qty'],
-                'executed_quote_qty': exec_result['executed_quote_qty'],
-                'avg_price': exec_result['avg_price'],
-                'commission': exec_result['commission'],
-                'commission_asset': quote.base_asset if exchange_side == 'BUY' else quote.quote_asset,
-                'pnl_amount': pnl_amount,
-                'pnl_asset': pnl_asset,
-                'pnl_after_fees': pnl_after_fees,
-                'pnl_bps': pnl_bps,
-                'error_message': None,
-                'executed_at': executed_at
-            }
-
-            # Log to database
-            if self.quote_logger:
-                self._log_execution(result)
-
-            return result
+                result.error_message = 'LP execution failed'
+
+            result.exchange_side = exchange_side
+            result.quantity = quantity
+            result.quote_qty = quote_qty
 
         except Exception as e:
             # Execution error
-            result = {
-                'execution_id': execution_id,
-                'status': 'FAILED',
-                'quote_id': quote.quote_id,
-                'lp_name': quote.lp_name,
-                'exchange_side': None,
-                'quantity': None,
-                'quote_qty': None,
-                'error_message': str(e),
-                'executed_at': executed_at
-            }
-
-            # Log to database
-            if self.quote_logger:
-                self._log_execution(result)
-
-            return result
+            result.error_message = str(e)
+
+        # Log to database
+        self._log_execution(result)
+
+        return result
+
+    def _get_pair_config(self, base_asset: str, quote_asset: str) -> Tuple[TradingPairConfig, Tuple[str, str]]:
+        """
+        Look up pair configuration, caching it per (base, quote) pair.
+
+        Returns:
+            Tuple of (pair_config, commission_asset_by_side), where
+            commission_asset_by_side[exchange_side == 'BUY'] is the asset the
+            hedge commission is charged in (the asset we receive)
+        """
+        key = (base_asset, quote_asset)
+        cached = self._pair_cfg_cache.get(key)
+        if cached is None:
+            # SELL -> commission in quote, BUY -> commission in base
+            cached = (get_pair_config(base_asset + quote_asset), (quote_asset, base_asset))
+            self._pair_cfg_cache[key] = cached
+        return cached
 
     def _generate_execution_id(self) -> str:
-        """Generate unique execution ID"""
-        return f"E{datetime.now().strftime('%Y%m%d-%H%M%S-%f')[:19]}"
+        """Generate unique execution ID (process start time + sequence number)"""
+        return f"E{_ID_PREFIX}-{next(_ID_COUNTER):07d}"
 
-    def _log_execution(self, result: Dict) -> None:
+    def _log_execution(self, result: ExecutionResult) -> None:
         """
-        Log execution to database.
+        Queue an execution for the database.
+
+        execute_quote doesn't wait for the write: rows are batched by a
+        background writer. Without a running event loop they are written
+        immediately.
 
         Args:
-            result: Execution result dictionary
+            result: Execution result
         """
-        if not self.quote_logger:
+        row = result.as_row()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_batch([row])
             return
 
+        if self._log_writer_task is None or self._log_writer_task.done():
+            self._log_q = asyncio.Queue()
+            self._log_writer_task = asyncio.create_task(self._log_writer(self._log_q))
+        self._log_q.put_nowait(row)
+
+    async def _log_writer(self, queue: asyncio.Queue) -> None:
+        """Drain queued execution rows, up to _FLUSH_MAX_ROWS per transaction."""
         try:
-            conn = self.quote_logger.conn
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT INTO executions (
-                    execution_id, quote_id, status, lp_name, exchange_side,
-                    quantity, quote_qty, executed_qty, executed_quote_qty,
-                    avg_price, commission, commission_asset,
-                    pnl_amount, pnl_asset, pnl_after_fees, pnl_bps,
-                    error_message, executed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                result['execution_id'],
-                result['quote_id'],
-                result['status'],
-                result['lp_name'],
-                result.get('exchange_side'),
-                result.get('quantity'),
-                result.get('quote_qty'),
-                result.get('executed_qty'),
-                result.get('executed_quote_qty'),
-                result.get('avg_price'),
-                result.get('commission'),
-                result.get('commission_asset'),
-                result.get('pnl_amount'),
-                result.get('pnl_asset'),
-                result.get('pnl_after_fees'),
-                result.get('pnl_bps'),
-                result.get('error_message'),
-                result['executed_at']
-            ))
-
-            conn.commit()
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < _FLUSH_MAX_ROWS and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                # Rows arriving during this write form the next batch
+                try:
+                    await self.quote_logger.run_db(self._flush_batch, batch)
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+        finally:
+            # Cancelled (loop shutdown / close): don't lose queued rows
+            self._drain_queue(queue)
+
+    def _drain_queue(self, queue: asyncio.Queue) -> None:
+        """Synchronously write anything still queued."""
+        batch = []
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+            queue.task_done()
+        self._flush_batch(batch)
+
+    def _flush_batch(self, rows: List[tuple]) -> None:
+        """Write execution rows in one transaction."""
+        if not rows or not self.quote_logger or self.quote_logger.conn is None:
+            return
 
+        try:
+            self.quote_logger.executemany(_INSERT_EXECUTION_SQL, rows)
         except Exception as e:
-            print(f"[ExecutionManager] Error logging execution: {e}")
-            conn.rollback()
+            logger.error("Error logging %d execution(s): %s", len(rows), e)
+            return
+
+        if self.on_logged is not None:
+            self.on_logged()
+
+    async def aclose(self) -> None:
+        """Wait for queued executions to be written."""
+        if self._log_q is not None and self._log_writer_task is not None and not self._log_writer_task.done():
+            await self._log_q.join()
+        self.close()
+
+    def close(self) -> None:
+        """Write any queued executions (call before closing the quote logger)."""
+        if self._log_writer_task is not None:
+            self._log_writer_task.cancel()
+            self._log_writer_task = None
+        if self._log_q is not None:
+            self._drain_queue(self._log_q)
+            self._log_q = None
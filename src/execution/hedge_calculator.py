@@ -9,11 +9,43 @@ Determines how to hedge client trades on an exchange based on:
 Ported from rfq/src/main.py:545-619
 """
 
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from ..core.models import AggregatedQuote
 from ..config.pairs import TradingPairConfig
 
 
+# (target_is_base, client_side, profit_asset) ->
+#     (exchange_side, use_client_receives, divide_by_market_price, as_quote_qty)
+#
+# use_client_receives picks client_receives_amount (else client_gives_amount);
+# as_quote_qty returns the amount as quote_qty (else as base quantity).
+_HEDGE_TABLE = {
+    # Client buys base from us -> we buy base on market
+    # Keep profit in USDT - buy exact amount client receives
+    (True, 'BUY', 'quote'): ('BUY', True, False, False),
+    # Keep profit in BTC - spend all USDT client gave us to buy more BTC
+    (True, 'BUY', 'base'): ('BUY', False, False, True),
+
+    # Client sells base to us -> we sell base on market
+    # Keep profit in BTC - sell only enough base to get USDT for client
+    (True, 'SELL', 'base'): ('SELL', True, True, False),
+    # Keep profit in USDT - sell all BTC client gave us
+    (True, 'SELL', 'quote'): ('SELL', False, False, False),
+
+    # Client buys quote from us -> we sell base to get quote
+    # Keep profit in BTC - sell only enough base to get exact USDT for client
+    (False, 'BUY', 'base'): ('SELL', True, True, False),
+    # Keep profit in USDT - sell all base to get more USDT
+    (False, 'BUY', 'quote'): ('SELL', False, False, False),
+
+    # Client sells quote to us -> we buy base with quote
+    # Keep profit in BTC - spend all USDT to buy more BTC
+    (False, 'SELL', 'base'): ('BUY', False, False, True),
+    # Keep profit in USDT - buy only exact BTC needed for client
+    (False, 'SELL', 'quote'): ('BUY', True, False, False),
+}
+
+
 def determine_hedge_params(
     quote: AggregatedQuote,
     side: str,
@@ -47,70 +79,86 @@ def determine_hedge_params(
         If profit_asset='quote', buy exact 1.5 BTC (keep profit in USDT).
         If profit_asset='base', spend all USDT to buy more BTC (keep profit in BTC).
     """
+    # Client is trading base asset (e.g., BTC on BTCUSDT) or quote asset
+    # (e.g., USDT on BTCUSDT)
+    # For LP aggregator, we use lp_price as the "market price"
+    return _hedge_from_flows(
+        target_asset == pair_config.base_asset,
+        side,
+        pair_config.profit_asset,
+        quote.client_gives_amount,
+        quote.client_receives_amount,
+        quote.lp_price
+    )
+
+
+def _hedge_from_flows(
+    target_is_base: bool,
+    side: str,
+    profit_asset: str,
+    client_gives_amount: float,
+    client_receives_amount: float,
+    market_price: float
+) -> Tuple[str, Optional[float], Optional[float]]:
+    """determine_hedge_params on already-extracted quote fields."""
+    # Any side other than BUY is a SELL
+    exchange_side, use_receives, per_price, as_quote_qty = _HEDGE_TABLE[
+        (target_is_base, 'BUY' if side == 'BUY' else 'SELL', profit_asset)
+    ]
+
+    amount = client_receives_amount if use_receives else client_gives_amount
+    if per_price:
+        amount = amount / market_price
+
+    if as_quote_qty:
+        return exchange_side, None, amount
+    return exchange_side, amount, None
+
+
+def determine_hedge_params_batch(
+    quotes: Sequence[AggregatedQuote],
+    sides: Sequence[str],
+    target_assets: Sequence[str],
+    pair_config: TradingPairConfig
+) -> List[Tuple[str, Optional[float], Optional[float]]]:
+    """
+    Determine hedge parameters for many quotes on the same pair.
+
+    Intended for replaying a batch of quotes priced off one market
+    snapshot: the reciprocal of each distinct lp_price is computed once
+    and per-price amounts are multiplied by it instead of divided. Those
+    amounts can therefore differ from determine_hedge_params in the last
+    ulp.
+
+    Args:
+        quotes: Aggregated quotes
+        sides: Client side per quote ('BUY' or 'SELL')
+        target_assets: Target asset per quote
+        pair_config: Trading pair configuration shared by all quotes
+
+    Returns:
+        One (exchange_side, quantity, quote_qty) tuple per quote
+    """
     base_asset = pair_config.base_asset
-    quote_asset = pair_config.quote_asset
     profit_asset = pair_config.profit_asset
+    inv_prices: Dict[float, float] = {}
+    params = []
 
-    # Calculate client_price (price shown to client after markup)
-    # This is already in the quote, but we need market_price for some calculations
-    # For LP aggregator, we use lp_price as the "market price"
-    market_price = quote.lp_price
-
-    if target_asset == base_asset:
-        # Client is trading base asset (e.g., BTC on BTCUSDT)
-        if side == 'BUY':
-            # Client buys base from us -> we buy base on market
-            exchange_side = 'BUY'
-
-            if profit_asset == 'quote':
-                # Keep profit in USDT - buy exact amount client receives
-                quantity = quote.client_receives_amount
-                quote_qty = None
-            else:
-                # Keep profit in BTC - spend all USDT client gave us to buy more BTC
-                quantity = None
-                quote_qty = quote.client_gives_amount
-        else:
-            # Client sells base to us -> we sell base on market
-            exchange_side = 'SELL'
-
-            if profit_asset == 'base':
-                # Keep profit in BTC - sell only enough base to get USDT for client
-                quantity = quote.client_receives_amount / market_price
-                quote_qty = None
-            else:
-                # Keep profit in USDT - sell all BTC client gave us
-                quantity = quote.client_gives_amount
-                quote_qty = None
-
-    else:  # target_asset == quote_asset
-        # Client is trading quote asset (e.g., USDT on BTCUSDT)
-        if side == 'BUY':
-            # Client buys quote from us -> we sell base to get quote
-            exchange_side = 'SELL'
-
-            if profit_asset == 'base':
-                # Keep profit in BTC - sell only enough base to get exact USDT for client
-                quantity = quote.client_receives_amount / market_price
-                quote_qty = None
-            else:
-                # Keep profit in USDT - sell all base to get more USDT
-                quantity = quote.client_gives_amount
-                quote_qty = None
-        else:
-            # Client sells quote to us -> we buy base with quote
-            exchange_side = 'BUY'
-
-            if profit_asset == 'base':
-                # Keep profit in BTC - spend all USDT to buy more BTC
-                quantity = None
-                quote_qty = quote.client_gives_amount
-            else:
-                # Keep profit in USDT - buy only exact BTC needed for client
-                quantity = quote.client_receives_amount
-                quote_qty = None
-
-    return exchange_side, quantity, quote_qty
+    for quote, side, target_asset in zip(quotes, sides, target_assets):
+        exchange_side, use_receives, per_price, as_quote_qty = _HEDGE_TABLE[
+            (target_asset == base_asset, 'BUY' if side == 'BUY' else 'SELL', profit_asset)
+        ]
+
+        amount = quote.client_receives_amount if use_receives else quote.client_gives_amount
+        if per_price:
+            inv_price = inv_prices.get(quote.lp_price)
+            if inv_price is None:
+                inv_price = inv_prices[quote.lp_price] = 1.0 / quote.lp_price
+            amount = amount * inv_price
+
+        params.append((exchange_side, None, amount) if as_quote_qty else (exchange_side, amount, None))
+
+    return params
 
 
 def format_hedge_params(
@@ -9,16 +9,38 @@ Calculates profit/loss from executed trades based on:
 Ported from rfq/src/main.py:621-714
 """
 
-from typing import Dict, Tuple
+from typing import Tuple
 from ..core.models import AggregatedQuote
 from ..config.pairs import TradingPairConfig
+from .simulator import ExecResult
+
+
+# (target_is_base, client_side, profit_asset) -> (pnl_in_base, exchange_receives)
+#
+# pnl_in_base compares base flows (executed_qty) else quote flows
+# (executed_quote_qty). exchange_receives means the hedge received the profit
+# asset, so P&L = exchange amount - client receives; otherwise the client paid
+# it in, so P&L = client pays - exchange amount.
+_PNL_TABLE = {
+    # Client pays quote, receives base | We bought base with quote
+    (True, 'BUY', 'base'): (True, True),
+    (True, 'BUY', 'quote'): (False, False),
+    (False, 'SELL', 'base'): (True, True),
+    (False, 'SELL', 'quote'): (False, False),
+
+    # Client pays base, receives quote | We sold base for quote
+    (True, 'SELL', 'quote'): (False, True),
+    (True, 'SELL', 'base'): (True, False),
+    (False, 'BUY', 'quote'): (False, True),
+    (False, 'BUY', 'base'): (True, False),
+}
 
 
 def calculate_pnl(
     quote: AggregatedQuote,
     side: str,
     target_asset: str,
-    execution_result: Dict,
+    execution_result: ExecResult,
     pair_config: TradingPairConfig
 ) -> Tuple[float, str, float, float]:
     """
@@ -33,11 +55,11 @@ def calculate_pnl(
         quote: Aggregated quote with trade details
         side: Client side ('BUY' or 'SELL')
         target_asset: Asset the client is trading
-        execution_result: Execution result from exchange with keys:
-            - 'executed_qty': Base asset quantity executed
-            - 'executed_quote_qty': Quote asset quantity executed
-            - 'commission': Fee amount
-            - 'avg_price': Average execution price
+        execution_result: Execution result from exchange with fields:
+            - executed_qty: Base asset quantity executed
+            - executed_quote_qty: Quote asset quantity executed
+            - commission: Fee amount
+            - avg_price: Average execution price
         pair_config: Trading pair configuration
 
     Returns:
@@ -54,73 +76,63 @@ def calculate_pnl(
     """
     base_asset = pair_config.base_asset
     quote_asset = pair_config.quote_asset
-    profit_asset = pair_config.profit_asset
 
-    # Extract client flows
-    client_pays = quote.client_gives_amount
-    client_receives = quote.client_receives_amount
-
-    # Extract exchange execution results
-    we_got_base = execution_result['executed_qty']
-    we_spent_quote = execution_result['executed_quote_qty']
-    commission = execution_result.get('commission', 0.0)
-
-    # Market price (for P&L bps calculation)
-    market_price = quote.lp_price
+    # Notional in quote currency (for P&L bps calculation)
+    if quote.client_gives_asset == quote_asset:
+        notional_quote = quote.client_gives_amount
+    else:
+        notional_quote = quote.client_receives_amount
 
+    # lp_price is the market price (for P&L bps calculation)
+    return _pnl_from_flows(
+        target_asset == base_asset,
+        side,
+        pair_config.profit_asset,
+        base_asset,
+        quote_asset,
+        quote.client_gives_amount,
+        quote.client_receives_amount,
+        notional_quote,
+        quote.lp_price,
+        execution_result.executed_qty,
+        execution_result.executed_quote_qty,
+        execution_result.commission
+    )
+
+
+def _pnl_from_flows(
+    target_is_base: bool,
+    side: str,
+    profit_asset: str,
+    base_asset: str,
+    quote_asset: str,
+    client_pays: float,
+    client_receives: float,
+    notional_quote: float,
+    market_price: float,
+    we_got_base: float,
+    we_spent_quote: float,
+    commission: float
+) -> Tuple[float, str, float, float]:
+    """calculate_pnl on already-extracted quote and execution fields."""
     # Determine P&L based on what the client traded and our profit asset preference
-    if target_asset == base_asset:
-        if side == 'BUY':
-            # Client pays quote, receives base | We bought base with quote
-            if profit_asset == 'base':
-                # Profit in base: we bought more base than client receives
-                pnl_amount = we_got_base - client_receives
-                pnl_asset = base_asset
-            else:
-                # Profit in quote: client paid us more than we spent
-                pnl_amount = client_pays - we_spent_quote
-                pnl_asset = quote_asset
-        else:  # SELL
-            # Client pays base, receives quote | We sold base for quote
-            if profit_asset == 'quote':
-                # Profit in quote: we got more quote than client receives
-                pnl_amount = we_spent_quote - client_receives
-                pnl_asset = quote_asset
-            else:
-                # Profit in base: client gave us more base than we spent
-                pnl_amount = client_pays - we_got_base
-                pnl_asset = base_asset
-    else:  # target_asset == quote_asset
-        if side == 'BUY':
-            # Client pays base, receives quote | We sold base for quote
-            if profit_asset == 'quote':
-                # Profit in quote: we got more quote than client receives
-                pnl_amount = we_spent_quote - client_receives
-                pnl_asset = quote_asset
-            else:
-                # Profit in base: client gave us more base than we spent
-                pnl_amount = client_pays - we_got_base
-                pnl_asset = base_asset
-        else:  # SELL
-            # Client pays quote, receives base | We bought base with quote
-            if profit_asset == 'base':
-                # Profit in base: we bought more base than client receives
-                pnl_amount = we_got_base - client_receives
-                pnl_asset = base_asset
-            else:
-                # Profit in quote: client paid us more than we spent
-                pnl_amount = client_pays - we_spent_quote
-                pnl_asset = quote_asset
+    # (any side other than BUY is a SELL)
+    pnl_in_base, exchange_receives = _PNL_TABLE[
+        (target_is_base, 'BUY' if side == 'BUY' else 'SELL', profit_asset)
+    ]
+    exchange_amount = we_got_base if pnl_in_base else we_spent_quote
+    if exchange_receives:
+        # We got more of the profit asset on exchange than the client receives
+        pnl_amount = exchange_amount - client_receives
+    else:
+        # Client gave us more of the profit asset than we spent on exchange
+        pnl_amount = client_pays - exchange_amount
+    pnl_asset = base_asset if pnl_in_base else quote_asset
 
     # Adjust for commission
     pnl_after_fees = pnl_amount - commission
 
     # Calculate P&L in bps relative to quote currency notional
-    if quote.client_gives_asset == quote_asset:
-        notional_quote = quote.client_gives_amount
-    else:
-        notional_quote = quote.client_receives_amount
-
     # Convert P&L to quote currency if needed for bps calculation
     if pnl_asset == base_asset and notional_quote > 0:
         # P&L is in base, convert to quote for bps
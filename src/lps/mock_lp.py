@@ -2,16 +2,28 @@
 Mock LP implementation for testing and development.
 
 Returns simulated quotes with configurable behavior.
+
+Set MOCK_LP_FAST=1 to skip the simulated network/execution delays (for
+benchmarks and long simulations). Delays are still drawn, so quote prices
+and metadata follow the same random sequence either way.
 """
 
 import asyncio
+import logging
+import os
 import random
 import time
-from typing import Optional
+from typing import List, Optional
 from .base_lp import LiquidityProvider
 from ..core.models import QuoteRequest, LPQuote, AggregatedQuote
 
 
+logger = logging.getLogger(__name__)
+
+# Skip simulated delays (read once at import)
+_FAST = os.environ.get('MOCK_LP_FAST') == '1'
+
+
 class MockLP(LiquidityProvider):
     """
     Mock LP for testing and development.
@@ -37,6 +49,9 @@ class MockLP(LiquidityProvider):
         self.name = name
         self.base_price = base_price
         self.spread_bps = spread_bps
+        # Spread applied to mid: ask when the client buys, bid when it sells
+        self._ask_factor = 1 + spread_bps / 10000
+        self._bid_factor = 1 - spread_bps / 10000
         self.response_delay = response_delay
         self.failure_rate = failure_rate
 
@@ -45,7 +60,8 @@ class MockLP(LiquidityProvider):
 
         # Simulate network delay
         delay = random.uniform(*self.response_delay)
-        await asyncio.sleep(delay)
+        if not _FAST:
+            await asyncio.sleep(delay)
 
         # Simulate occasional failures
         if random.random() < self.failure_rate:
@@ -53,15 +69,52 @@ class MockLP(LiquidityProvider):
 
         # Generate price with random variation
         variation = random.uniform(-0.01, 0.01)  # ±1%
+        return self._build_quote(request, variation, delay)
+
+    @classmethod
+    async def batch_quote(
+        cls,
+        lps: List['MockLP'],
+        request: QuoteRequest
+    ) -> List[Optional[LPQuote]]:
+        """
+        Quote a request from several mock LPs with a single sleep.
+
+        Draws every LP's delay, failure roll and price variation up front
+        and sleeps once for the slowest delay, which is the wall-clock
+        cost of a parallel fan-out. Useful for stress tests and
+        simulations where one task + timer per LP dominates.
+
+        Args:
+            lps: Mock LPs to quote from
+            request: Quote request
+
+        Returns:
+            One quote per LP, in order (None where the LP failed)
+        """
+        draws = [
+            (
+                random.uniform(*lp.response_delay),
+                random.random(),
+                random.uniform(-0.01, 0.01)
+            )
+            for lp in lps
+        ]
+        if draws and not _FAST:
+            await asyncio.sleep(max(delay for delay, _, _ in draws))
+
+        return [
+            None if failure_roll < lp.failure_rate else lp._build_quote(request, variation, delay)
+            for lp, (delay, failure_roll, variation) in zip(lps, draws)
+        ]
+
+    def _build_quote(self, request: QuoteRequest, variation: float, delay: float) -> LPQuote:
+        """Price a quote from a drawn variation and response delay."""
         mid_price = self.base_price * (1 + variation)
 
         # Apply spread based on side
-        if request.side == 'BUY':
-            # Client buying = we sell = ask price
-            price = mid_price * (1 + self.spread_bps / 10000)
-        else:
-            # Client selling = we buy = bid price
-            price = mid_price * (1 - self.spread_bps / 10000)
+        # (client buying = we sell = ask price; client selling = we buy = bid price)
+        price = mid_price * (self._ask_factor if request.side == 'BUY' else self._bid_factor)
 
         return LPQuote(
             lp_name=self.name,
@@ -82,12 +135,14 @@ class MockLP(LiquidityProvider):
     async def execute_trade(self, quote: LPQuote, client_quote: AggregatedQuote) -> bool:
         """Simulate trade execution"""
         # Simulate execution delay
-        await asyncio.sleep(random.uniform(0.2, 0.5))
+        delay = random.uniform(0.2, 0.5)
+        if not _FAST:
+            await asyncio.sleep(delay)
 
         # Check if quote is still valid
         if quote.is_expired():
-            print(f"[{self.name}] Quote expired, cannot execute")
+            logger.info("LP %s quote expired, cannot execute", self.name)
             return False
 
-        print(f"[{self.name}] Trade executed successfully")
+        logger.info("LP %s trade executed", self.name)
         return True
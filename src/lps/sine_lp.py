@@ -8,13 +8,33 @@ Based on _sine_price.py reference implementation.
 """
 
 import asyncio
+import logging
 import math
+import random
 import time
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, List, Optional
 from .base_lp import LiquidityProvider
 from ..core.models import QuoteRequest, LPQuote, AggregatedQuote
 
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SineMeta:
+    """Metadata attached to each SineLPProvider quote"""
+    mid_price: float
+    spread_bps: float
+    delay_ms: float
+    phase: float
+    elapsed: float
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup, so consumers can read metadata.get('delay_ms')"""
+        return getattr(self, key, default)
+
+
 class SineLPProvider(LiquidityProvider):
     """
     LP that provides quotes following a sine wave price pattern.
@@ -57,23 +77,31 @@ class SineLPProvider(LiquidityProvider):
         self.base_price = base_price
         self.amplitude = amplitude
         self.frequency = frequency
+        self._omega = 2 * math.pi * frequency  # Angular frequency (rad/s)
         self.phase = phase
         self.trend = trend
         self.spread_bps = spread_bps
+        # Spread applied to mid: ask when the client buys, bid when it sells
+        self._ask_factor = 1 + spread_bps / 10000
+        self._bid_factor = 1 - spread_bps / 10000
         self.response_delay = response_delay
-        self.start_time = time.time()
+        self.start_ns = time.monotonic_ns()  # Wave origin (monotonic clock, integer ns)
 
-    def _calculate_mid_price(self) -> float:
+    def _calculate_mid_price(self, elapsed: Optional[float] = None) -> float:
         """
         Calculate current mid price based on sine wave.
 
+        Args:
+            elapsed: Seconds since start_ns (read from the clock if None)
+
         Returns:
             Current mid price
         """
-        elapsed = time.time() - self.start_time
+        if elapsed is None:
+            elapsed = (time.monotonic_ns() - self.start_ns) * 1e-9
         price = (
             self.base_price
-            + self.amplitude * math.sin(2 * math.pi * self.frequency * elapsed + self.phase)
+            + self.amplitude * math.sin(self._omega * elapsed + self.phase)
             + self.trend * elapsed
         )
         return price
@@ -89,20 +117,52 @@ class SineLPProvider(LiquidityProvider):
             LP quote or None if unable to provide
         """
         # Simulate network delay
-        import random
         delay = random.uniform(*self.response_delay)
         await asyncio.sleep(delay)
 
-        # Get current mid price from sine wave
-        mid_price = self._calculate_mid_price()
+        # Price off the poll's shared clock read when the streamer set one,
+        # so all LPs in a poll see the same instant (else one read per quote)
+        now_ns = request.poll_time_ns if request.poll_time_ns is not None else time.monotonic_ns()
+        return self._build_quote(request, delay, (now_ns - self.start_ns) * 1e-9)
+
+    @classmethod
+    async def batch_quote(
+        cls,
+        lps: List['SineLPProvider'],
+        request: QuoteRequest
+    ) -> List[LPQuote]:
+        """
+        Quote a request from several sine LPs behind one shared delay.
+
+        Draws every LP's response delay up front, sleeps once for the
+        slowest, then prices all quotes from a single clock read. Each
+        quote's sampled delay is kept in its metadata. For simulations
+        that don't need independent per-LP response times.
+
+        Args:
+            lps: Sine LPs to quote from
+            request: Quote request
+
+        Returns:
+            One quote per LP, in order
+        """
+        delays = [random.uniform(*lp.response_delay) for lp in lps]
+        if delays:
+            await asyncio.sleep(max(delays))
+
+        now_ns = time.monotonic_ns()
+        return [
+            lp._build_quote(request, delay, (now_ns - lp.start_ns) * 1e-9)
+            for lp, delay in zip(lps, delays)
+        ]
+
+    def _build_quote(self, request: QuoteRequest, delay: float, elapsed: float) -> LPQuote:
+        """Price a quote at elapsed seconds into the wave."""
+        mid_price = self._calculate_mid_price(elapsed)
 
         # Apply spread based on side
-        if request.side == 'BUY':
-            # Client buying = we sell = ask price (add spread)
-            price = mid_price * (1 + self.spread_bps / 10000)
-        else:  # SELL
-            # Client selling = we buy = bid price (subtract spread)
-            price = mid_price * (1 - self.spread_bps / 10000)
+        # (client buying = we sell = ask price; client selling = we buy = bid price)
+        price = mid_price * (self._ask_factor if request.side == 'BUY' else self._bid_factor)
 
         return LPQuote(
             lp_name=self.name,
@@ -111,13 +171,13 @@ class SineLPProvider(LiquidityProvider):
             validity_seconds=10.0,
             timestamp=time.time(),
             side=request.side,
-            metadata={
-                'mid_price': mid_price,
-                'spread_bps': self.spread_bps,
-                'delay_ms': delay * 1000,
-                'phase': self.phase,
-                'elapsed': time.time() - self.start_time
-            }
+            metadata=SineMeta(
+                mid_price=mid_price,
+                spread_bps=self.spread_bps,
+                delay_ms=delay * 1000,
+                phase=self.phase,
+                elapsed=elapsed
+            )
         )
 
     def get_name(self) -> str:
@@ -136,13 +196,12 @@ class SineLPProvider(LiquidityProvider):
             True if execution succeeds
         """
         # Simulate execution delay
-        import random
         await asyncio.sleep(random.uniform(0.2, 0.5))
 
         # Check if quote is still valid
         if quote.is_expired():
-            print(f"[{self.name}] Quote expired, cannot execute")
+            logger.info("LP %s quote expired, cannot execute", self.name)
             return False
 
-        print(f"[{self.name}] Trade executed at {quote.price:.2f}")
+        logger.info("LP %s trade executed at %.2f", self.name, quote.price)
         return True
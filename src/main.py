@@ -10,8 +10,14 @@ This application:
 """
 
 import asyncio
+import logging
+import queue
+import sys
 import threading
-from typing import List, Optional, Dict
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
 from colorama import Fore, Style
 
 import math
@@ -25,39 +31,59 @@ from .lps.mock_lp import MockLP
 from .lps.sine_lp import SineLPProvider
 from .ui.terminal import TerminalInterface
 from .ui.monitor import get_monitor
+from .ui.blotter import ExecutionBlotter
 from .execution import determine_hedge_params, calculate_pnl, execute_simulated_trade
 from .execution.execution_manager import ExecutionManager
+from .database.schema import init_database
+from .database.quote_logger import QuoteLogger
 
 
+# Sine LP parameters (increased frequency for faster competition)
+_SINE_AMPLITUDE = 50
+_SINE_FREQUENCY = 0.20  # Increased from 0.05 for faster oscillation (3x faster)
+_SINE_TREND = -1
+# Phase offsets for 3 LPs (creates competition)
+_SINE_PHASES = (0.0, math.pi / 2, math.pi)
+
 def create_mock_lps() -> List[LiquidityProvider]:
     """
-    Create Sine Wave LP instances for realistic price competition.
+    Create mock LP instances for the configured backend (settings.lp_backend).
 
-    Creates LPs with phase-shifted sine wave pricing:
+    'sine' (default) creates LPs with phase-shifted sine wave pricing:
     - LP-1: phase=0 (starts mid, rising)
     - LP-2: phase=π/2 (starts at peak)
     - LP-3: phase=π (starts mid, falling)
 
     This creates realistic competition where different LPs win at different times.
+
+    'mock' creates MockLPs quoting randomly around the base price.
     """
-    # Sine wave parameters (increased frequency for faster competition)
-    amplitude = 50
-    frequency = 0.20  # Increased from 0.05 for faster oscillation (3x faster)
-    trend = -1
-    base_price = settings.mock_base_price
+    if settings.lp_backend == 'mock':
+        return [
+            MockLP(
+                name=f"LP-{i+1}",
+                base_price=settings.mock_base_price,
+                spread_bps=settings.mock_spread_bps,
+                response_delay=(settings.mock_min_delay, settings.mock_max_delay),
+                failure_rate=settings.mock_failure_rate
+            )
+            for i in range(settings.mock_lp_count)
+        ]
+    if settings.lp_backend != 'sine':
+        raise ValueError(f"Unknown LP_BACKEND {settings.lp_backend!r} (expected 'sine' or 'mock')")
 
-    # Phase offsets for 3 LPs (creates competition)
-    phases = [0.0, math.pi / 2, math.pi]
+    base_price = settings.mock_base_price
 
     lps = []
-    for i in range(min(settings.mock_lp_count, 3)):  # Max 3 LPs for clear phases
+    # Max 3 LPs for clear phases
+    for i, phase in enumerate(_SINE_PHASES[:settings.mock_lp_count]):
         lp = SineLPProvider(
             name=f"LP-{i+1}",
             base_price=base_price,
-            amplitude=amplitude,
-            frequency=frequency,
-            phase=phases[i],
-            trend=trend,
+            amplitude=_SINE_AMPLITUDE,
+            frequency=_SINE_FREQUENCY,
+            phase=phase,
+            trend=_SINE_TREND,
             spread_bps=settings.mock_spread_bps,
             response_delay=(settings.mock_min_delay, settings.mock_max_delay)
         )
@@ -66,13 +92,39 @@ def create_mock_lps() -> List[LiquidityProvider]:
     return lps
 
 
+def _write_quote_block(title: str, color: str, locked_lp_name: Optional[str], best_quote: AggregatedQuote) -> None:
+    """
+    Print a locked/improved quote summary with a single write.
+
+    The block is formatted up front so a slow terminal costs one write
+    per event rather than one per line.
+    """
+    rule = '=' * 70
+    lines = [
+        f"\n{color}{rule}",
+        title,
+        f"{rule}{Style.RESET_ALL}\n",
+        f"  LP:             {locked_lp_name}",
+        f"  Side:           {best_quote.side} {best_quote.amount} {best_quote.target_asset}",
+        f"  Client Pays:    {best_quote.client_gives_amount:,.8f} {best_quote.client_gives_asset}",
+        f"  Client Gets:    {best_quote.client_receives_amount:,.8f} {best_quote.client_receives_asset}",
+        f"  Price:          {best_quote.client_price:,.4f} {best_quote.quote_asset}",
+        f"  Valid for:      {best_quote.time_remaining():.1f}s",
+        f"\n{color}{rule}{Style.RESET_ALL}\n",
+        f"{Fore.YELLOW}Commands: [p] proceed  [c] cancel  [q] quit{Style.RESET_ALL}\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 async def handle_quote_stream(
     request: QuoteRequest,
     aggregator: LPAggregator,
     streamer: QuoteStreamer,
     monitor,
-    state: Dict,
-    state_lock
+    locked_quote_ref: List[Optional[AggregatedQuote]],
+    locked_lp_quote_ref: List[Optional[LPQuote]],
+    stop_stream: threading.Event
 ):
     """
     Stream quotes for a given request and update monitor.
@@ -82,31 +134,29 @@ async def handle_quote_stream(
         aggregator: LP aggregator instance
         streamer: Quote streamer instance
         monitor: Monitor GUI instance
-        state: Shared state dictionary with keys:
-            - locked_quote: Current locked AggregatedQuote
-            - locked_lp_quote: Current locked LPQuote
-            - stop_stream: Set to True to stop streaming
+        locked_quote_ref: One-element list holding the current locked AggregatedQuote
+        locked_lp_quote_ref: One-element list holding the current locked LPQuote
+        stop_stream: Set to stop streaming
+
+    The refs are written here and read by main_loop with plain item
+    assignment; each is a single reference swap, so no lock is needed.
     """
     # Track previous locked LP to detect lock changes
     previous_locked_lp = None
 
     # Callback for quote updates
-    def on_quote_update(all_lp_quotes: List[LPQuote], best_quote: AggregatedQuote, poll_count: int, is_improvement: bool, locked_lp_name: Optional[str]):
+    def on_quote_update(all_lp_quotes: List[LPQuote], best_quote: AggregatedQuote, poll_count: int, is_improvement: bool, locked_lp_name: Optional[str], locked_lp_quote: Optional[LPQuote]):
         nonlocal previous_locked_lp
 
         # Check if stream should stop
-        with state_lock:
-            should_stop = state.get('stop_stream', False)
-        
-        if should_stop:
+        if stop_stream.is_set():
             streamer.stop()
             return
 
         try:
-            # Update shared state with locked quote (protected by lock)
-            with state_lock:
-                state['locked_quote'] = best_quote
-                state['locked_lp_quote'] = next((q for q in all_lp_quotes if q.lp_name == locked_lp_name), None)
+            # Publish the locked quote to main_loop
+            locked_quote_ref[0] = best_quote
+            locked_lp_quote_ref[0] = locked_lp_quote
 
             # Update monitor with all LP data
             monitor.update_display(all_lp_quotes, best_quote, poll_count, locked_lp_name)
@@ -114,37 +164,15 @@ async def handle_quote_stream(
             # Terminal feedback - only show initial lock and improvements
             if poll_count == 1:
                 # Initial lock - show quote
-                print(f"\n{Fore.CYAN}{'='*70}")
-                print(f"QUOTE LOCKED")
-                print(f"{'='*70}{Style.RESET_ALL}\n")
-                print(f"  LP:             {locked_lp_name}")
-                print(f"  Side:           {best_quote.side} {best_quote.amount} {best_quote.target_asset}")
-                print(f"  Client Pays:    {best_quote.client_gives_amount:,.8f} {best_quote.client_gives_asset}")
-                print(f"  Client Gets:    {best_quote.client_receives_amount:,.8f} {best_quote.client_receives_asset}")
-                print(f"  Price:          {best_quote.client_price:,.4f} {best_quote.quote_asset}")
-                print(f"  Valid for:      {best_quote.time_remaining():.1f}s")
-                print(f"\n{Fore.CYAN}{'='*70}{Style.RESET_ALL}\n")
-                print(f"{Fore.YELLOW}Commands: [p] proceed  [c] cancel  [q] quit{Style.RESET_ALL}\n")
-
+                _write_quote_block("QUOTE LOCKED", Fore.CYAN, locked_lp_name, best_quote)
                 previous_locked_lp = locked_lp_name
             elif is_improvement:
                 # Improvement - lock switched
-                print(f"\n{Fore.GREEN}{'='*70}")
-                print(f"IMPROVED QUOTE")
-                print(f"{'='*70}{Style.RESET_ALL}\n")
-                print(f"  LP:             {locked_lp_name}")
-                print(f"  Side:           {best_quote.side} {best_quote.amount} {best_quote.target_asset}")
-                print(f"  Client Pays:    {best_quote.client_gives_amount:,.8f} {best_quote.client_gives_asset}")
-                print(f"  Client Gets:    {best_quote.client_receives_amount:,.8f} {best_quote.client_receives_asset}")
-                print(f"  Price:          {best_quote.client_price:,.4f} {best_quote.quote_asset}")
-                print(f"  Valid for:      {best_quote.time_remaining():.1f}s")
-                print(f"\n{Fore.GREEN}{'='*70}{Style.RESET_ALL}\n")
-                print(f"{Fore.YELLOW}Commands: [p] proceed  [c] cancel  [q] quit{Style.RESET_ALL}\n")
+                _write_quote_block("IMPROVED QUOTE", Fore.GREEN, locked_lp_name, best_quote)
                 previous_locked_lp = locked_lp_name
 
         except Exception as e:
             print(f"{Fore.RED}[ERROR] in quote callback: {e}{Style.RESET_ALL}")
-            import traceback
             traceback.print_exc()
 
     # Get auto-refresh setting from monitor (force to True for continuous polling)
@@ -160,7 +188,7 @@ async def handle_quote_stream(
         )
 
         # Stream ended
-        if state.get('stop_stream', False):
+        if stop_stream.is_set():
             # Stopped intentionally (execution completed)
             pass
         else:
@@ -181,10 +209,12 @@ async def main_loop():
     quote_logger = None
     db_path = None
     if settings.enable_database_logging:
-        from .database.schema import init_database
-        from .database.quote_logger import QuoteLogger
         init_database(settings.database_path)
-        quote_logger = QuoteLogger(settings.database_path)
+        quote_logger = QuoteLogger(
+            settings.database_path,
+            partition_lp_quotes_by_day=settings.partition_lp_quotes_by_day,
+            flush_interval_seconds=settings.quote_log_flush_ms / 1000
+        )
         db_path = settings.database_path
 
     # Start monitor in background with database path
@@ -195,27 +225,27 @@ async def main_loop():
     aggregator = LPAggregator(
         lps=lps,
         markup_bps=settings.markup_bps,
-        validity_buffer_seconds=settings.validity_buffer_seconds
+        validity_buffer_seconds=settings.validity_buffer_seconds,
+        quote_timeout_seconds=settings.lp_quote_timeout_seconds or None,
+        max_concurrent_requests=settings.lp_concurrency or None
     )
     streamer = QuoteStreamer(
         aggregator=aggregator,
         poll_interval_ms=settings.poll_interval_ms,
         improvement_threshold_bps=settings.improvement_threshold_bps,
-        quote_logger=quote_logger
+        quote_logger=quote_logger,
+        hedge_after_ms=settings.hedge_after_ms or None
     )
 
     # Create execution manager
     lp_dict = {lp.get_name(): lp for lp in lps}
-    execution_manager = ExecutionManager(lp_dict, quote_logger)
+    execution_manager = ExecutionManager(lp_dict, quote_logger, on_logged=ExecutionBlotter.notify)
 
     # Track current streaming task and locked quote (shared state)
     current_task: Optional[asyncio.Task] = None
-    state = {
-        'locked_quote': None,
-        'locked_lp_quote': None,
-        'stop_stream': False
-    }
-    state_lock = threading.Lock()  # Protect shared state (threading.Lock for sync callback)
+    locked_quote_ref: List[Optional[AggregatedQuote]] = [None]
+    locked_lp_quote_ref: List[Optional[LPQuote]] = [None]
+    stop_stream = threading.Event()
 
     print(f"\n{Fore.CYAN}{'='*70}")
     print(f"LP AGGREGATION RFQ SYSTEM")
@@ -226,27 +256,33 @@ async def main_loop():
     print(f"  Example: s 50000 usdt btcusdt\n")
 
     # Get event loop for async input
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
+
+    # stdin gets its own thread: a pending input() never occupies a worker
+    # of the default executor shared with other blocking work
+    stdin_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stdin")
+    prompt = f"{Fore.CYAN}> {Style.RESET_ALL}"
 
     while True:
         # Get input from operator asynchronously (non-blocking)
-        user_input = await loop.run_in_executor(
-            None,
-            lambda: input(f"{Fore.CYAN}> {Style.RESET_ALL}")
-        )
+        user_input = await loop.run_in_executor(stdin_executor, input, prompt)
         user_input = user_input.strip().lower()
 
         # Handle commands based on context
         if user_input == 'q':
             # Quit application
             if current_task and not current_task.done():
-                with state_lock:
-                    state['stop_stream'] = True
+                stop_stream.set()
                 current_task.cancel()
                 try:
                     await current_task
                 except asyncio.CancelledError:
                     pass
+            # Flush buffered executions and queued quote logs before exiting
+            await execution_manager.aclose()
+            if quote_logger:
+                await quote_logger.aclose()
+            stdin_executor.shutdown(wait=False)
             print(f"\n{Fore.CYAN}Goodbye!{Style.RESET_ALL}\n")
             break
 
@@ -255,21 +291,19 @@ async def main_loop():
             # Streaming active - handle p/c commands
             if user_input == 'p':
                 # Proceed with execution
-                if state['locked_quote'] is None or state['locked_lp_quote'] is None:
+                locked_quote = locked_quote_ref[0]
+                locked_lp_quote = locked_lp_quote_ref[0]
+                if locked_quote is None or locked_lp_quote is None:
                     print(f"{Fore.RED}No locked quote available{Style.RESET_ALL}\n")
                     continue
 
-                locked_quote = state['locked_quote']
-                locked_lp_quote = state['locked_lp_quote']
-
                 # Check if quote is still valid
                 if locked_quote.is_expired():
                     print(f"{Fore.RED}Quote expired. Cannot execute.{Style.RESET_ALL}\n")
                     continue
 
                 # Stop the stream FIRST (before execution)
-                with state_lock:
-                    state['stop_stream'] = True
+                stop_stream.set()
                 current_task.cancel()
                 try:
                     await current_task
@@ -282,28 +316,27 @@ async def main_loop():
                 exec_result = await execution_manager.execute_quote(locked_quote, locked_lp_quote)
 
                 # Display results
-                if exec_result['status'] == 'SUCCESS':
+                if exec_result.status == 'SUCCESS':
                     print(f"{Fore.GREEN}{'='*70}")
                     print(f"EXECUTION SUCCESSFUL")
                     print(f"{'='*70}{Style.RESET_ALL}\n")
-                    print(f"  Execution ID:   {exec_result['execution_id']}")
-                    print(f"  Hedge:          {exec_result['exchange_side']} {exec_result['executed_qty']:,.8f} {locked_quote.base_asset}")
-                    print(f"  Avg Price:      {exec_result['avg_price']:,.2f}")
-                    print(f"  Net P&L:        {Fore.GREEN}{exec_result['pnl_after_fees']:,.8f} {exec_result['pnl_asset']} ({exec_result['pnl_bps']:,.2f} bps){Style.RESET_ALL}")
+                    print(f"  Execution ID:   {exec_result.execution_id}")
+                    print(f"  Hedge:          {exec_result.exchange_side} {exec_result.executed_qty:,.8f} {locked_quote.base_asset}")
+                    print(f"  Avg Price:      {exec_result.avg_price:,.2f}")
+                    print(f"  Net P&L:        {Fore.GREEN}{exec_result.pnl_after_fees:,.8f} {exec_result.pnl_asset} ({exec_result.pnl_bps:,.2f} bps){Style.RESET_ALL}")
                     print(f"\n{Fore.GREEN}{'='*70}{Style.RESET_ALL}\n")
 
                     # Update monitor to show executed status
                     monitor.show_executed()
                 else:
                     print(f"{Fore.RED}{'='*70}")
-                    print(f"EXECUTION FAILED: {exec_result.get('error_message', 'Unknown error')}")
+                    print(f"EXECUTION FAILED: {exec_result.error_message or 'Unknown error'}")
                     print(f"{'='*70}{Style.RESET_ALL}\n")
 
                 # Reset state
-                with state_lock:
-                    state['locked_quote'] = None
-                    state['locked_lp_quote'] = None
-                    state['stop_stream'] = False
+                locked_quote_ref[0] = None
+                locked_lp_quote_ref[0] = None
+                stop_stream.clear()
                 current_task = None
 
                 print(f"{Fore.YELLOW}Enter new quote request:{Style.RESET_ALL}\n")
@@ -311,8 +344,7 @@ async def main_loop():
 
             elif user_input == 'c':
                 # Cancel stream
-                with state_lock:
-                    state['stop_stream'] = True
+                stop_stream.set()
                 current_task.cancel()
                 try:
                     await current_task
@@ -320,10 +352,9 @@ async def main_loop():
                     pass
 
                 # Reset state
-                with state_lock:
-                    state['locked_quote'] = None
-                    state['locked_lp_quote'] = None
-                    state['stop_stream'] = False
+                locked_quote_ref[0] = None
+                locked_lp_quote_ref[0] = None
+                stop_stream.clear()
                 current_task = None
 
                 print(f"\n{Fore.YELLOW}Cancelled. Enter new quote request:{Style.RESET_ALL}\n")
@@ -345,25 +376,75 @@ async def main_loop():
                 continue
 
             # Reset state
-            state['locked_quote'] = None
-            state['locked_lp_quote'] = None
-            state['stop_stream'] = False
+            locked_quote_ref[0] = None
+            locked_lp_quote_ref[0] = None
+            stop_stream.clear()
 
             # Start new stream in background
             current_task = asyncio.create_task(
-                handle_quote_stream(request, aggregator, streamer, monitor, state, state_lock)
+                handle_quote_stream(
+                    request, aggregator, streamer, monitor,
+                    locked_quote_ref, locked_lp_quote_ref, stop_stream
+                )
             )
 
             # Give the task a moment to start and fetch quotes
             await asyncio.sleep(0.5)
 
 
+def setup_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route log records through a queue drained by a background thread.
+
+    Coroutines only enqueue records, so the event loop never blocks on
+    stderr writes.
+
+    Returns:
+        Started QueueListener (call stop() on shutdown to flush)
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("[%(name)s] %(levelname)s: %(message)s"))
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+def event_loop_factory():
+    """
+    Pick the event loop implementation for the application.
+
+    Returns uvloop's loop factory when USE_UVLOOP is enabled and uvloop is
+    installed (it is not available on Windows); otherwise None, which
+    means the default asyncio loop.
+    """
+    if not settings.use_uvloop:
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        logging.getLogger(__name__).info("uvloop not installed; using the default asyncio loop")
+        return None
+
+    return uvloop.new_event_loop
+
+
 def main():
     """Entry point"""
+    log_listener = setup_logging()
     try:
-        asyncio.run(main_loop())
+        with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+            runner.run(main_loop())
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}Application stopped by operator{Style.RESET_ALL}\n")
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
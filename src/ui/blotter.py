@@ -9,10 +9,73 @@ Shows executed trades with:
 
 import tkinter as tk
 from tkinter import font
+import queue
 import sqlite3
 import threading
-from typing import Optional, List, Dict
+from collections import deque
+from typing import Deque, Optional, List, Dict, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+
+# Executions shown (no scrolling)
+_MAX_ROWS = 10
+
+# Time, Side, Pair, Client, Hedge, LP, P&L
+_COLUMN_COUNT = 7
+
+# Kept as one constant so every poll reuses the same text and hits the
+# connection's prepared-statement cache. Selects only what _format_cells renders,
+# plus e.id: executions is insert-only and id (the rowid) only grows, so
+# "id > last seen" is a rowid range seek that finds exactly the new rows
+_NEW_EXECUTIONS_SQL = """
+    SELECT
+        e.id,
+        e.execution_id,
+        e.status,
+        e.lp_name,
+        e.avg_price,
+        e.pnl_after_fees,
+        e.pnl_asset,
+        e.executed_at,
+        q.base_asset,
+        q.quote_asset,
+        q.client_price,
+        q.side
+    FROM executions e
+    LEFT JOIN quotes q ON e.quote_id = q.quote_id
+    WHERE e.id > ?
+    ORDER BY e.id DESC
+    LIMIT ?
+"""
+
+# Column offsets into a _NEW_EXECUTIONS_SQL row (same order as the SELECT)
+(
+    _COL_ID,
+    _COL_EXECUTION_ID,
+    _COL_STATUS,
+    _COL_LP_NAME,
+    _COL_AVG_PRICE,
+    _COL_PNL_AFTER_FEES,
+    _COL_PNL_ASSET,
+    _COL_EXECUTED_AT,
+    _COL_BASE_ASSET,
+    _COL_QUOTE_ASSET,
+    _COL_CLIENT_PRICE,
+    _COL_SIDE,
+) = range(12)
+
+# How often the Tk thread checks for results from the I/O worker
+_NOTIFY_POLL_MS = 100
+
+# Worker poll without a notification, for rows written by other processes
+_FALLBACK_REFRESH_SECONDS = 10.0
+
+
+@lru_cache(maxsize=None)
+def _pnl_decimals(asset: str) -> int:
+    """P&L display precision for an asset (2 for USDT-quoted, else 6)"""
+    return 2 if asset.endswith('USDT') else 6
 
 
 class ExecutionBlotter:
@@ -21,12 +84,22 @@ class ExecutionBlotter:
 
     Features:
     - Displays last 10 executions (no scrolling)
-    - Auto-refresh from database (2 second polling)
+    - Refreshes when notify() reports a logged execution
     - Color-coded status and P&L
     - Thread-safe updates
     - Smart caching to prevent blinking
     """
 
+    # Set by notify() from the execution writer's thread, cleared by the
+    # I/O worker when it polls; class-level so the writer can be wired
+    # up before any blotter exists
+    _dirty = threading.Event()
+
+    @classmethod
+    def notify(cls) -> None:
+        """Signal that executions were written (safe from any thread)."""
+        cls._dirty.set()
+
     def __init__(self, parent_frame: tk.Frame, db_path: Optional[str] = None):
         """
         Initialize blotter with parent Tkinter frame and database path.
@@ -38,7 +111,6 @@ class ExecutionBlotter:
         self.parent_frame = parent_frame
         self.db_path = db_path
         self.running = False
-        self.lock = threading.Lock()
 
         # Colors (consistent with monitor)
         self.bg_color = "#1e1e1e"
@@ -56,13 +128,25 @@ class ExecutionBlotter:
         self.tiny_font = font.Font(family="Consolas", size=8)
 
         # UI elements
-        self.execution_rows = []  # List of (frame, labels) tuples
+        self.execution_rows = []  # List of (frame, labels) tuples, _MAX_ROWS pre-built
+        self._row_cells = []  # (text, color) per column currently shown in each row
+        self._visible_rows = 0  # Rows currently packed
+        self._formatted: Dict[tuple, List[Tuple[str, str]]] = {}  # Row -> cells, for the rows shown
         self.scrollable_frame = None
         self.canvas = None
         self.empty_state_label = None  # Track empty state label
 
         # Cache for preventing unnecessary updates
         self.last_execution_ids = []  # Track which executions are displayed
+        self._recent: Deque[tuple] = deque(maxlen=_MAX_ROWS)  # Last rows fetched, newest first
+        self._last_id = 0  # Highest executions.id fetched so far
+
+        # Database reads run on a worker thread that owns the connection
+        # (opened on first poll and reused) and posts results to the Tk
+        # thread through a latest-wins queue
+        self._conn: Optional[sqlite3.Connection] = None
+        self._results: queue.Queue = queue.Queue(maxsize=1)
+        self._io_thread: Optional[threading.Thread] = None
 
         # Build UI
         self._build_ui()
@@ -70,7 +154,9 @@ class ExecutionBlotter:
         # Start auto-refresh if database is available
         if self.db_path:
             self.running = True
-            self.parent_frame.after(2000, self._update_loop)  # Start after 2 seconds
+            self._io_thread = threading.Thread(target=self._io_loop, name="blotter-io", daemon=True)
+            self._io_thread.start()
+            self.parent_frame.after(_NOTIFY_POLL_MS, self._update_loop)
 
     def _build_ui(self):
         """Build the blotter UI"""
@@ -106,6 +192,10 @@ class ExecutionBlotter:
         # Column headers
         self._create_headers()
 
+        # Rows are built once and reused; only changed cells are reconfigured
+        for idx in range(_MAX_ROWS):
+            self._create_row(idx)
+
         # Initial empty state
         self._show_empty_state()
 
@@ -160,12 +250,11 @@ class ExecutionBlotter:
             self.empty_state_label.destroy()
             self.empty_state_label = None
 
-    def _create_row(self, execution: Dict, row_index: int):
+    def _create_row(self, row_index: int):
         """
-        Create a single execution row.
+        Create an empty execution row (not packed until it has data).
 
         Args:
-            execution: Execution data dictionary
             row_index: Row index (for alternating colors)
         """
         # Alternating row colors
@@ -176,49 +265,81 @@ class ExecutionBlotter:
             bg=row_bg,
             height=50
         )
-        row_frame.pack(fill='x', pady=1)
         row_frame.pack_propagate(False)
 
+        # Configure grid columns (same as headers)
+        row_frame.columnconfigure(0, weight=1, minsize=60)   # Time
+        row_frame.columnconfigure(1, weight=1, minsize=45)   # Side
+        row_frame.columnconfigure(2, weight=1, minsize=70)   # Pair
+        row_frame.columnconfigure(3, weight=2, minsize=90)   # Client Price
+        row_frame.columnconfigure(4, weight=2, minsize=90)   # Hedge Price
+        row_frame.columnconfigure(5, weight=1, minsize=45)   # LP
+        row_frame.columnconfigure(6, weight=2, minsize=100)  # P&L
+
+        # Create a label for each column
+        labels = []
+        for idx in range(_COLUMN_COUNT):
+            label = tk.Label(
+                row_frame,
+                text="",
+                font=self.row_font,
+                bg=row_bg,
+                fg=self.fg_color,
+                anchor='w'
+            )
+            label.grid(row=0, column=idx, sticky='w', padx=2, pady=5)
+            labels.append(label)
+
+        # Store row reference
+        self.execution_rows.append((row_frame, labels))
+        self._row_cells.append([("", self.fg_color)] * _COLUMN_COUNT)
+
+    def _format_cells(self, execution: tuple) -> List[Tuple[str, str]]:
+        """
+        Format an execution into (text, color) per column.
+
+        Args:
+            execution: Execution row (see the _COL_* offsets)
+
+        Returns:
+            One (text, color) tuple per column
+        """
         # Format timestamp
-        executed_at = execution.get('executed_at', 0)
+        executed_at = execution[_COL_EXECUTED_AT]
         time_str = datetime.fromtimestamp(executed_at).strftime('%H:%M:%S')
 
-        # Format side (use client side from quotes table, not exchange_side)
-        client_side = execution.get('side', execution.get('exchange_side', '--'))
+        # Format side (client side from quotes table)
+        client_side = execution[_COL_SIDE] or '--'
 
         # Format pair from joined quotes table
-        base_asset = execution.get('base_asset', '?')
-        quote_asset = execution.get('quote_asset', '?')
+        base_asset = execution[_COL_BASE_ASSET]
+        quote_asset = execution[_COL_QUOTE_ASSET]
         pair_str = f"{base_asset}/{quote_asset}"
 
         # Format client price
-        client_price = execution.get('client_price')
+        client_price = execution[_COL_CLIENT_PRICE]
         if client_price is not None:
             client_price_str = f"{client_price:,.2f}"
         else:
             client_price_str = "--"
 
         # Format hedge price (avg_price from execution)
-        hedge_price = execution.get('avg_price')
+        hedge_price = execution[_COL_AVG_PRICE]
         if hedge_price is not None:
             hedge_price_str = f"{hedge_price:,.2f}"
         else:
             hedge_price_str = "--"
 
         # Format LP
-        lp_name = execution.get('lp_name', '--')
+        lp_name = execution[_COL_LP_NAME]
 
         # Format P&L (in asset, not bps)
-        pnl_after_fees = execution.get('pnl_after_fees')
-        pnl_asset = execution.get('pnl_asset', '')
-        status = execution.get('status', 'UNKNOWN')
+        pnl_after_fees = execution[_COL_PNL_AFTER_FEES]
+        pnl_asset = execution[_COL_PNL_ASSET]
+        status = execution[_COL_STATUS]
 
         if status == 'SUCCESS' and pnl_after_fees is not None:
-            # Determine precision based on asset
-            if pnl_asset == 'USDT' or pnl_asset.endswith('USDT'):
-                pnl_str = f"{pnl_after_fees:+,.2f} {pnl_asset}"
-            else:
-                pnl_str = f"{pnl_after_fees:+,.6f} {pnl_asset}"
+            pnl_str = f"{pnl_after_fees:+,.{_pnl_decimals(pnl_asset)}f} {pnl_asset}"
 
             if pnl_after_fees > 0:
                 pnl_color = self.positive_pnl_color
@@ -230,17 +351,7 @@ class ExecutionBlotter:
             pnl_str = "FAILED" if status == 'FAILED' else "--"
             pnl_color = self.failed_color if status == 'FAILED' else self.muted_color
 
-        # Configure grid columns (same as headers)
-        row_frame.columnconfigure(0, weight=1, minsize=60)   # Time
-        row_frame.columnconfigure(1, weight=1, minsize=45)   # Side
-        row_frame.columnconfigure(2, weight=1, minsize=70)   # Pair
-        row_frame.columnconfigure(3, weight=2, minsize=90)   # Client Price
-        row_frame.columnconfigure(4, weight=2, minsize=90)   # Hedge Price
-        row_frame.columnconfigure(5, weight=1, minsize=45)   # LP
-        row_frame.columnconfigure(6, weight=2, minsize=100)  # P&L
-
-        # Create labels for each column
-        columns_data = [
+        return [
             (time_str, self.fg_color),
             (client_side, self.accent_color),
             (pair_str, self.fg_color),
@@ -250,131 +361,203 @@ class ExecutionBlotter:
             (pnl_str, pnl_color)
         ]
 
-        labels = []
-        for idx, (text, color) in enumerate(columns_data):
-            label = tk.Label(
-                row_frame,
-                text=text,
-                font=self.row_font,
-                bg=row_bg,
-                fg=color,
-                anchor='w'
-            )
-            label.grid(row=0, column=idx, sticky='w', padx=2, pady=5)
-            labels.append(label)
+    def _apply_row(self, row_index: int, cells: List[Tuple[str, str]]):
+        """
+        Show formatted cells in a pre-built row, reconfiguring only changed ones.
 
-        # Store row reference
-        self.execution_rows.append((row_frame, labels))
+        Args:
+            row_index: Row to fill
+            cells: (text, color) per column, from _format_cells
+        """
+        _, labels = self.execution_rows[row_index]
+        shown = self._row_cells[row_index]
+
+        for label, old, new in zip(labels, shown, cells):
+            if old != new:
+                label.configure(text=new[0], fg=new[1])
+        self._row_cells[row_index] = cells
+
+    def _show_rows(self, count: int):
+        """
+        Pack the first count rows and hide the rest.
 
-    def _fetch_recent_executions(self, limit: int = 50) -> List[Dict]:
+        Args:
+            count: Number of rows with data
+        """
+        # Only the rows crossing the boundary change. Nothing is packed
+        # after the rows, so appending keeps them in order
+        for row_frame, _ in self.execution_rows[self._visible_rows:count]:
+            row_frame.pack(fill='x', pady=1)
+        for row_frame, _ in self.execution_rows[count:self._visible_rows]:
+            row_frame.pack_forget()
+        self._visible_rows = count
+
+    def _get_connection(self) -> sqlite3.Connection:
         """
-        Query database for recent executions.
+        Return the blotter's reader connection, opening it on first use.
+
+        The database is already in WAL mode (init_database), so this reader
+        sees a consistent snapshot without blocking the execution writer.
+        The pragmas below only tune this connection.
+
+        Returns:
+            Open SQLite connection
+        """
+        if self._conn is None:
+            # Opened, used and closed only by the I/O worker thread
+            conn = sqlite3.connect(self.db_path)
+            conn.executescript("""
+                PRAGMA busy_timeout=5000;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-64000;
+                PRAGMA mmap_size=268435456;
+            """)
+            self._conn = conn
+        return self._conn
+
+    def _fetch_new_executions(self, after_id: int, limit: int) -> List[tuple]:
+        """
+        Query database for executions logged after a given row.
 
         Args:
+            after_id: Only rows with executions.id above this
             limit: Maximum number of executions to fetch
 
         Returns:
-            List of execution dictionaries (most recent first)
+            Execution rows, most recent first (see the _COL_* offsets)
         """
         if not self.db_path:
             return []
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Access columns by name
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT
-                    e.execution_id,
-                    e.quote_id,
-                    e.status,
-                    e.lp_name,
-                    e.exchange_side,
-                    e.executed_qty,
-                    e.avg_price,
-                    e.commission,
-                    e.commission_asset,
-                    e.pnl_after_fees,
-                    e.pnl_bps,
-                    e.pnl_asset,
-                    e.error_message,
-                    e.executed_at,
-                    q.base_asset,
-                    q.quote_asset,
-                    q.client_price,
-                    q.lp_price,
-                    q.side
-                FROM executions e
-                LEFT JOIN quotes q ON e.quote_id = q.quote_id
-                ORDER BY e.executed_at DESC
-                LIMIT ?
-            """, (limit,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            # Convert to list of dicts
-            return [dict(row) for row in rows]
+            return self._get_connection().execute(_NEW_EXECUTIONS_SQL, (after_id, limit)).fetchall()
 
         except sqlite3.Error as e:
             print(f"[Blotter] Database error: {e}")
+            # Reconnect on the next poll
+            self.close()
             return []
         except Exception as e:
             print(f"[Blotter] Error fetching executions: {e}")
             return []
 
-    def _update_display(self):
-        """Update blotter display with latest executions"""
-        with self.lock:
-            # Fetch recent executions (last 10 only)
-            executions = self._fetch_recent_executions(limit=10)
+    def _poll_executions(self) -> Optional[List[tuple]]:
+        """
+        Fetch recent executions if any were logged since the last poll.
 
-            # Get current execution IDs
-            current_execution_ids = [e.get('execution_id') for e in executions]
+        Only rows newer than the last one seen are read; they are merged
+        into the last _MAX_ROWS kept in memory. Runs on the I/O worker thread.
 
-            # Check if data has changed
-            if current_execution_ids == self.last_execution_ids:
-                # No changes, skip update to avoid blinking
-                return
+        Returns:
+            Recent executions (most recent first), or None if unchanged
+        """
+        new_rows = self._fetch_new_executions(self._last_id, _MAX_ROWS)
+        if not new_rows:
+            return None
+
+        self._last_id = new_rows[0][_COL_ID]
+        # Oldest first, so the newest ends up at the front
+        for row in reversed(new_rows):
+            self._recent.appendleft(row)
+        return list(self._recent)
+
+    def _io_loop(self):
+        """I/O worker: poll the database on notify() (or the fallback interval)"""
+        while self.running:
+            # Clear first so a notify() during the poll triggers another
+            self._dirty.clear()
+            try:
+                executions = self._poll_executions()
+            except Exception as e:
+                print(f"[Blotter] Update error: {e}")
+                executions = None
+
+            if executions is not None:
+                # Hand the latest result to the Tk thread, replacing any
+                # it hasn't picked up yet
+                try:
+                    self._results.put_nowait(executions)
+                except queue.Full:
+                    try:
+                        self._results.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._results.put_nowait(executions)
+
+            self._dirty.wait(_FALLBACK_REFRESH_SECONDS)
+
+        self.close()
+
+    def _update_display(self, executions: List[tuple]):
+        """
+        Update blotter display with latest executions.
 
-            # Data has changed, update the cache
-            self.last_execution_ids = current_execution_ids
+        Args:
+            executions: Recent executions from the I/O worker (most recent first)
+        """
+        # Get current execution IDs
+        current_execution_ids = [e[_COL_EXECUTION_ID] for e in executions]
 
-            # Clear existing rows
-            for row_frame, labels in self.execution_rows:
-                row_frame.destroy()
-            self.execution_rows.clear()
+        # Check if data has changed
+        if current_execution_ids == self.last_execution_ids:
+            # No changes, skip update to avoid blinking
+            return
 
-            if not executions:
-                # Show empty state
-                self._show_empty_state()
-            else:
-                # Hide empty state if showing executions
-                self._hide_empty_state()
+        # Data has changed, update the cache
+        self.last_execution_ids = current_execution_ids
 
-                # Create rows for each execution
-                for idx, execution in enumerate(executions):
-                    self._create_row(execution, idx)
+        if not executions:
+            # Show empty state
+            self._show_rows(0)
+            self._show_empty_state()
+        else:
+            # Hide empty state if showing executions
+            self._hide_empty_state()
+
+            # Fill the pre-built rows in place; rows already on screen
+            # reuse their formatted cells (keyed by the row itself)
+            formatted = {}
+            for idx, execution in enumerate(executions):
+                cells = self._formatted.get(execution) or self._format_cells(execution)
+                formatted[execution] = cells
+                self._apply_row(idx, cells)
+            self._formatted = formatted
+            self._show_rows(len(executions))
 
     def _update_loop(self):
-        """Auto-update loop (called every 2 seconds)"""
+        """Apply results posted by the I/O worker; rechecks every _NOTIFY_POLL_MS"""
         if not self.running:
             return
 
         try:
-            self._update_display()
-        except Exception as e:
-            print(f"[Blotter] Update error: {e}")
+            executions = self._results.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            try:
+                self._update_display(executions)
+            except Exception as e:
+                print(f"[Blotter] Update error: {e}")
 
-        # Schedule next update
+        # Schedule next check
         if self.running:
-            self.parent_frame.after(2000, self._update_loop)
+            self.parent_frame.after(_NOTIFY_POLL_MS, self._update_loop)
 
     def refresh(self):
-        """Manual refresh trigger"""
-        self._update_display()
+        """Manual refresh trigger (the I/O worker polls right away)"""
+        self.notify()
+
+    def close(self):
+        """Close the reader connection (called by the I/O worker; reopened on the next poll)"""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
 
     def stop(self):
-        """Stop auto-refresh"""
+        """Stop auto-refresh (the I/O worker closes its connection on exit)"""
         self.running = False
+        # Wake the worker so it sees running=False
+        self._dirty.set()
@@ -9,6 +9,7 @@ Tkinter-based dashboard showing:
 
 import tkinter as tk
 from tkinter import font
+import queue
 import threading
 import time
 from typing import Optional, List
@@ -17,6 +18,10 @@ from datetime import datetime
 from ..core.models import LPQuote, AggregatedQuote
 
 
+# How often the Tk thread picks up posted quote updates (~60 Hz)
+_DRAIN_INTERVAL_MS = 16
+
+
 class LPAggregationMonitor:
     """
     LP Aggregation Monitor with Mario Kart style leaderboard.
@@ -53,6 +58,10 @@ class LPAggregationMonitor:
 
         self.lock = threading.Lock()
 
+        # Latest (all_lp_quotes, best_quote, poll_count) posted by the
+        # stream; older pending updates are replaced, never queued
+        self._updates: queue.Queue = queue.Queue(maxsize=1)
+
     def start(self):
         """Start the monitor window in a separate daemon thread"""
         if not self.running:
@@ -212,8 +221,9 @@ class LPAggregationMonitor:
             from .blotter import ExecutionBlotter
             self.blotter = ExecutionBlotter(right_frame, self.db_path)
 
-        # Start update loop
+        # Start update loops
         self.window.after(1000, self._update_loop)
+        self.window.after(_DRAIN_INTERVAL_MS, self._drain_updates)
 
         # Handle close
         self.window.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -290,6 +300,30 @@ class LPAggregationMonitor:
         # Schedule next update
         self.window.after(1000, self._update_loop)
 
+    def _drain_updates(self):
+        """Apply and render the latest posted quote update, if any"""
+        if not self.running:
+            return
+
+        try:
+            all_lp_quotes, best_quote, poll_count = self._updates.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            try:
+                with self.lock:
+                    self.all_lp_quotes = all_lp_quotes
+                    self.best_quote = best_quote
+                    self.poll_count = poll_count
+
+                    self._update_best_quote_display()
+                    if self.all_lp_quotes:
+                        self._update_leaderboard_display()
+            except Exception as e:
+                print(f"Monitor update error: {e}")
+
+        self.window.after(_DRAIN_INTERVAL_MS, self._drain_updates)
+
     def _update_best_quote_display(self):
         """Update the best quote section"""
         if not self.best_quote:
@@ -474,7 +508,10 @@ class LPAggregationMonitor:
         """
         Update monitor with new quote data.
 
-        Thread-safe method to update display from streaming thread.
+        Thread-safe method to update display from streaming thread. Only
+        posts the data; the Tk thread renders it on its next drain, so the
+        caller never waits on a redraw. If an update is still pending it
+        is replaced by this one.
 
         Args:
             all_lp_quotes: All LP quotes received (includes frozen data for locked LP)
@@ -482,18 +519,23 @@ class LPAggregationMonitor:
             poll_count: Current poll number
             locked_lp_name: Name of currently locked LP (if any)
         """
-        with self.lock:
-            # Deep copy to prevent shared state issues
-            self.all_lp_quotes = list(all_lp_quotes) if all_lp_quotes else []
-            self.best_quote = best_quote  # AggregatedQuote is immutable (dataclass)
-            self.poll_count = poll_count
-
-            # Reset executed flag on new quote (poll 1 means new quote request)
-            if poll_count == 1:
-                self.is_executed = False
-
-            # Update status
-            # Status label removed - no longer needed
+        # Reset executed flag on new quote (poll 1 means new quote request).
+        # Done here rather than on drain so a replaced poll-1 update can't skip it
+        if poll_count == 1:
+            self.is_executed = False
+
+        # Copy the list to prevent shared state issues;
+        # AggregatedQuote is immutable (dataclass)
+        payload = (list(all_lp_quotes) if all_lp_quotes else [], best_quote, poll_count)
+        try:
+            self._updates.put_nowait(payload)
+        except queue.Full:
+            # Drop the stale pending update in favour of this one
+            try:
+                self._updates.get_nowait()
+            except queue.Empty:
+                pass
+            self._updates.put_nowait(payload)
 
     def show_expired(self):
         """Show expired status"""
@@ -522,12 +564,16 @@ class LPAggregationMonitor:
     def _on_close(self):
         """Handle window close"""
         self.running = False
+        if self.blotter:
+            self.blotter.stop()
         if self.window:
             self.window.destroy()
 
     def stop(self):
         """Stop monitor"""
         self.running = False
+        if self.blotter:
+            self.blotter.stop()
         if self.window:
             try:
                 self.window.destroy()
@@ -56,7 +56,8 @@ async def test_auto_refresh_with_kill_switch():
     improvement_count = 0
 
     def on_quote_update(all_lp_quotes: List[LPQuote], best_quote: AggregatedQuote,
-                        poll_num: int, is_improvement: bool, locked_lp_name: Optional[str]):
+                        poll_num: int, is_improvement: bool, locked_lp_name: Optional[str],
+                        locked_lp_quote: Optional[LPQuote]):
         nonlocal refresh_count, poll_count, last_poll_num, improvement_count
 
         poll_count = poll_num
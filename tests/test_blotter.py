@@ -0,0 +1,229 @@
+"""
+Unit tests for the execution blotter's database polling.
+
+Runs without a display: the Tk widgets are replaced with stand-ins, and
+executions are written to a temporary database.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+# Add parent to path to import src as a module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.schema import init_database
+from src.database.quote_logger import QuoteLogger
+from src.execution.execution_manager import ExecutionManager, ExecutionResult, _INSERT_EXECUTION_SQL
+from src.ui import blotter as blotter_module
+from src.ui.blotter import ExecutionBlotter, _MAX_ROWS, _COL_ID
+
+
+class FakeWidget:
+    """Accepts any Tk widget call and does nothing"""
+
+    def __init__(self, *args, **kwargs):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _NoDisplay:
+    """Swap the blotter's tk/font modules for stand-ins during a test"""
+
+    def __enter__(self):
+        self.saved = (blotter_module.tk, blotter_module.font)
+        blotter_module.tk = SimpleNamespace(Frame=FakeWidget, Label=FakeWidget)
+        blotter_module.font = SimpleNamespace(Font=lambda **kwargs: None)
+        return self
+
+    def __exit__(self, *exc):
+        blotter_module.tk, blotter_module.font = self.saved
+
+
+def _results(count: int, start: int) -> List[ExecutionResult]:
+    """Successful executions E<start>..E<start+count-1>"""
+    return [
+        ExecutionResult(
+            execution_id=f"E{n}",
+            status='SUCCESS',
+            quote_id=f"Q{n}",
+            lp_name='LP-1',
+            executed_at=time.time(),
+            exchange_side='BUY',
+            avg_price=100000.0,
+            pnl_asset='USDT',
+            pnl_after_fees=1.0
+        )
+        for n in range(start, start + count)
+    ]
+
+
+def _insert_executions(db_path: str, count: int, start: int) -> None:
+    """Write executions directly, as another process would"""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executemany(_INSERT_EXECUTION_SQL, [r.as_row() for r in _results(count, start)])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_poll_new_executions():
+    """Test the id cursor and the recent-rows deque across bursts"""
+    print("\n=== Test 1: Poll only new executions ===")
+
+    with _NoDisplay(), tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "blotter.db")
+        init_database(db_path)
+
+        # No db_path at construction: no I/O worker, polls run here
+        blotter = ExecutionBlotter(FakeWidget(), None)
+        blotter.db_path = db_path
+        try:
+            _insert_executions(db_path, 7, start=1)
+            first = blotter._poll_executions()
+            print(f"Burst 1: {[row[_COL_ID] for row in first]}")
+            assert [row[_COL_ID] for row in first] == list(range(7, 0, -1))
+
+            # More than _MAX_ROWS new rows: only the newest are fetched
+            _insert_executions(db_path, 13, start=8)
+            second = blotter._poll_executions()
+            print(f"Burst 2: {[row[_COL_ID] for row in second]}")
+            assert [row[_COL_ID] for row in second] == list(range(20, 20 - _MAX_ROWS, -1))
+            assert blotter._last_id == 20
+
+            # A small burst is merged in front of the rows already kept
+            _insert_executions(db_path, 3, start=21)
+            third = blotter._poll_executions()
+            print(f"Burst 3: {[row[_COL_ID] for row in third]}")
+            assert [row[_COL_ID] for row in third] == list(range(23, 23 - _MAX_ROWS, -1))
+
+            idle = blotter._poll_executions()
+            print(f"Idle poll: {idle}")
+            assert idle is None
+        finally:
+            blotter.close()
+
+    print("[OK] Test passed!")
+
+
+def test_execution_logging_notifies():
+    """Test that ExecutionManager wakes the blotter once rows are committed"""
+    print("\n=== Test 2: notify() wiring ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "blotter.db")
+        init_database(db_path)
+        quote_logger = QuoteLogger(db_path)
+        manager = ExecutionManager({}, quote_logger, on_logged=ExecutionBlotter.notify)
+        try:
+            ExecutionBlotter._dirty.clear()
+            # No running event loop: the row is written (and notified) now
+            manager._log_execution(_results(1, start=1)[0])
+
+            conn = sqlite3.connect(db_path)
+            logged = conn.execute("SELECT COUNT(*) FROM executions").fetchone()[0]
+            conn.close()
+            print(f"Rows: {logged}, notified: {ExecutionBlotter._dirty.is_set()}")
+            assert logged == 1
+            assert ExecutionBlotter._dirty.is_set()
+
+            # A failed write doesn't notify
+            ExecutionBlotter._dirty.clear()
+            manager._log_execution(_results(1, start=1)[0])  # Duplicate execution_id
+            print(f"After failed write, notified: {ExecutionBlotter._dirty.is_set()}")
+            assert not ExecutionBlotter._dirty.is_set()
+        finally:
+            ExecutionBlotter._dirty.clear()
+            quote_logger.close()
+
+    print("[OK] Test passed!")
+
+
+def _wait_for_result(blotter: ExecutionBlotter, timeout: float = 2.0) -> bool:
+    """Wait until the I/O worker has posted a result"""
+    deadline = time.monotonic() + timeout
+    while blotter._results.empty():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_worker_handoff():
+    """Test that the I/O worker polls on notify() and hands rows to the Tk side"""
+    print("\n=== Test 3: I/O worker handoff ===")
+
+    with _NoDisplay(), tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "blotter.db")
+        init_database(db_path)
+        _insert_executions(db_path, 3, start=1)
+
+        parent = FakeWidget()
+        blotter = ExecutionBlotter(parent, db_path)
+        try:
+            # Initial poll runs on the worker thread
+            assert _wait_for_result(blotter)
+            blotter._update_loop()  # What Tk's after() would call
+            print(f"Initial: {blotter.last_execution_ids}, rows shown: {blotter._visible_rows}")
+            assert blotter.last_execution_ids == ['E3', 'E2', 'E1']
+            assert blotter._visible_rows == 3
+            assert parent.scheduled[-1] == blotter._update_loop  # Rescheduled
+
+            # New rows are picked up on notify(), well before the fallback poll
+            _insert_executions(db_path, 2, start=4)
+            ExecutionBlotter.notify()
+            assert _wait_for_result(blotter)
+            blotter._update_loop()
+            print(f"After notify: {blotter.last_execution_ids}")
+            assert blotter.last_execution_ids == ['E5', 'E4', 'E3', 'E2', 'E1']
+
+            # Nothing new: the worker posts nothing
+            ExecutionBlotter.notify()
+            time.sleep(0.1)
+            assert blotter._results.empty()
+        finally:
+            blotter.stop()
+            blotter._io_thread.join(2.0)
+
+        print(f"Worker stopped: {not blotter._io_thread.is_alive()}, connection closed: {blotter._conn is None}")
+        assert not blotter._io_thread.is_alive()
+        assert blotter._conn is None
+
+    print("[OK] Test passed!")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("  Blotter Tests")
+    print("=" * 60)
+
+    try:
+        test_poll_new_executions()
+        test_execution_logging_notifies()
+        test_worker_handoff()
+
+        print("\n" + "=" * 60)
+        print("  [SUCCESS] All tests passed!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -87,22 +87,22 @@ async def test_execution():
     exec_result = await execution_manager.execute_quote(best_quote, lp_quote)
 
     # Display results
-    if exec_result['status'] == 'SUCCESS':
+    if exec_result.status == 'SUCCESS':
         print("="*70)
         print("EXECUTION SUCCESSFUL")
         print("="*70)
-        print(f"Execution ID:    {exec_result['execution_id']}")
-        print(f"Quote ID:        {exec_result['quote_id']}")
-        print(f"LP:              {exec_result['lp_name']}")
-        print(f"Exchange Side:   {exec_result['exchange_side']}")
-        print(f"Executed Qty:    {exec_result['executed_qty']:,.8f} BTC")
-        print(f"Avg Price:       {exec_result['avg_price']:,.2f}")
-        print(f"Commission:      {exec_result['commission']:,.8f} {exec_result['commission_asset']}")
+        print(f"Execution ID:    {exec_result.execution_id}")
+        print(f"Quote ID:        {exec_result.quote_id}")
+        print(f"LP:              {exec_result.lp_name}")
+        print(f"Exchange Side:   {exec_result.exchange_side}")
+        print(f"Executed Qty:    {exec_result.executed_qty:,.8f} BTC")
+        print(f"Avg Price:       {exec_result.avg_price:,.2f}")
+        print(f"Commission:      {exec_result.commission:,.8f} {exec_result.commission_asset}")
         print()
         print("P&L:")
-        print(f"  Gross:         {exec_result['pnl_amount']:,.8f} {exec_result['pnl_asset']}")
-        print(f"  Net:           {exec_result['pnl_after_fees']:,.8f} {exec_result['pnl_asset']}")
-        print(f"  bps:           {exec_result['pnl_bps']:,.2f}")
+        print(f"  Gross:         {exec_result.pnl_amount:,.8f} {exec_result.pnl_asset}")
+        print(f"  Net:           {exec_result.pnl_after_fees:,.8f} {exec_result.pnl_asset}")
+        print(f"  bps:           {exec_result.pnl_bps:,.2f}")
         print("="*70)
         print()
         print("[OK] Test passed!")
@@ -110,12 +110,13 @@ async def test_execution():
         print("="*70)
         print("EXECUTION FAILED")
         print("="*70)
-        print(f"Error: {exec_result.get('error_message')}")
+        print(f"Error: {exec_result.error_message}")
         print("="*70)
         print()
         print("[FAIL] Test failed")
 
     # Close logger
+    execution_manager.close()
     quote_logger.close()
 
 
@@ -51,7 +51,8 @@ async def test_expiry_no_autorefresh():
     expired_shown = False
 
     def on_quote_update(all_lp_quotes: List[LPQuote], best_quote: AggregatedQuote,
-                        poll_num: int, is_improvement: bool, locked_lp_name: Optional[str]):
+                        poll_num: int, is_improvement: bool, locked_lp_name: Optional[str],
+                        locked_lp_quote: Optional[LPQuote]):
         nonlocal poll_count, expired_shown
         poll_count = poll_num
 
@@ -121,7 +122,8 @@ async def test_expiry_with_autorefresh():
     last_poll = 0
 
     def on_quote_update(all_lp_quotes: List[LPQuote], best_quote: AggregatedQuote,
-                        poll_num: int, is_improvement: bool, locked_lp_name: Optional[str]):
+                        poll_num: int, is_improvement: bool, locked_lp_name: Optional[str],
+                        locked_lp_quote: Optional[LPQuote]):
         nonlocal poll_count, refresh_count, last_poll
 
         # Detect refresh (poll count resets)
@@ -5,7 +5,9 @@ Tests all 8 scenarios:
 - target_asset (base/quote) × side (BUY/SELL) × profit_asset (base/quote)
 """
 
+import math
 import sys
+from dataclasses import replace
 from pathlib import Path
 import time
 
@@ -14,7 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.models import AggregatedQuote
 from src.config.pairs import get_pair_config
-from src.execution.hedge_calculator import determine_hedge_params
+from src.execution.hedge_calculator import determine_hedge_params, determine_hedge_params_batch
 from src.execution.pnl_calculator import calculate_pnl
 from src.execution.simulator import execute_simulated_trade
 
@@ -118,7 +120,7 @@ def test_scenario_1():
         quote, 'BUY', 'BTC', exec_result, pair_config
     )
 
-    print(f"Execution: Bought {exec_result['executed_qty']:.5f} BTC at {exec_result['avg_price']:.2f}")
+    print(f"Execution: Bought {exec_result.executed_qty:.5f} BTC at {exec_result.avg_price:.2f}")
     print(f"P&L: {pnl_after_fees:.2f} {pnl_asset} ({pnl_bps:.2f} bps)")
 
     assert pnl_asset == 'USDT'
@@ -209,11 +211,51 @@ def test_all_8_scenarios():
     print("=" * 60)
 
 
+def test_hedge_params_batch():
+    """Test determine_hedge_params_batch against determine_hedge_params"""
+    print("\n=== Test: Batch hedge params match per-quote results ===")
+
+    scenarios = [
+        ('BUY', 'BTC', 1.5),
+        ('SELL', 'BTC', 1.5),
+        ('BUY', 'USDT', 50000.0),
+        ('SELL', 'USDT', 50000.0),
+    ]
+
+    for profit_asset in ('quote', 'base'):
+        pair_config = replace(get_pair_config('BTCUSDT'), profit_asset=profit_asset)
+
+        # Two LP prices so the reciprocal cache is both filled and reused
+        quotes, sides, targets = [], [], []
+        for lp_price in (100000.0, 101000.0, 100000.0):
+            for side, target, amount in scenarios:
+                quotes.append(create_test_quote(side, amount, target, lp_price, 5.0, 'BTCUSDT'))
+                sides.append(side)
+                targets.append(target)
+
+        batch = determine_hedge_params_batch(quotes, sides, targets, pair_config)
+        assert len(batch) == len(quotes)
+
+        for quote, side, target, got in zip(quotes, sides, targets, batch):
+            expected = determine_hedge_params(quote, side, target, pair_config)
+            assert got[0] == expected[0], f"{side} {target} profit={profit_asset}: {got} != {expected}"
+            for got_qty, expected_qty in zip(got[1:], expected[1:]):
+                # None in the same slot; amounts may differ in the last ulp
+                assert (got_qty is None) == (expected_qty is None)
+                if expected_qty is not None:
+                    assert math.isclose(got_qty, expected_qty, rel_tol=1e-12)
+
+        print(f"profit_asset={profit_asset}: {len(quotes)} quotes match")
+
+    print("[OK] Test passed!")
+
+
 if __name__ == "__main__":
     try:
         test_scenario_1()
         test_scenario_2()
         test_all_8_scenarios()
+        test_hedge_params_batch()
 
         print("\n" + "=" * 60)
         print("  All hedge/P&L tests passed!")
@@ -0,0 +1,219 @@
+"""
+Unit tests for LPAggregator request hedging.
+
+Tests which request wins when a slow LP is hedged, and that every
+request - won, lost, failed or timed out - adds a latency sample.
+"""
+
+import asyncio
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+# Add parent to path to import src as a module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.models import QuoteRequest, LPQuote
+from src.lps.base_lp import LiquidityProvider
+from src.core.lp_aggregator import LPAggregator, _LATENCY_WINDOW
+
+
+class ScriptedLP(LiquidityProvider):
+    """
+    LP whose Nth request sleeps and then answers or raises as scripted.
+
+    Each script entry is (delay_seconds, price); a price of None raises
+    ConnectionError, an exception instance is raised as-is.
+    """
+
+    def __init__(self, script: List[Tuple[float, Union[float, BaseException, None]]]):
+        self.script = list(script)
+        self.calls = 0
+
+    def get_name(self) -> str:
+        """Return LP name"""
+        return 'LP-Scripted'
+
+    async def execute_trade(self, quote, client_quote) -> bool:
+        """Execute trade (not used)"""
+        return True
+
+    async def request_quote(self, request: QuoteRequest) -> Optional[LPQuote]:
+        """Play the next script entry"""
+        delay, price = self.script[self.calls]
+        self.calls += 1
+        await asyncio.sleep(delay)
+        if isinstance(price, BaseException):
+            raise price
+        if price is None:
+            raise ConnectionError("scripted failure")
+        return LPQuote(
+            lp_name=self.get_name(),
+            price=price,
+            quantity=10.0,
+            validity_seconds=10.0,
+            timestamp=time.time(),
+            side=request.side
+        )
+
+
+def _request() -> QuoteRequest:
+    """BUY 1 BTC request"""
+    return QuoteRequest(side='BUY', amount=1.0, base_asset='BTC', quote_asset='USDT', target_asset='BTC')
+
+
+def _run(aggregator: LPAggregator, lp: ScriptedLP) -> Optional[LPQuote]:
+    """Request one quote through the hedging path"""
+    return asyncio.run(aggregator._request_quote_safe(lp, _request()))
+
+
+def test_hedge_wins():
+    """Test that a fast hedge beats a slow primary"""
+    print("\n=== Test 1: Hedge wins ===")
+
+    lp = ScriptedLP([(0.5, 100.0), (0.01, 200.0)])
+    aggregator = LPAggregator(lps=[lp], hedge_after_ms=20)
+    quote = _run(aggregator, lp)
+    samples = aggregator._latencies[lp.get_name()]
+
+    print(f"Winner price: {quote.price}, samples: {[round(s, 3) for s in samples]}")
+    assert quote.price == 200.0
+    assert lp.calls == 2
+    # The cancelled primary still reports how long it ran
+    assert len(samples) == 2
+    assert max(samples) >= 0.02
+
+    print("[OK] Test passed!")
+
+
+def test_primary_wins():
+    """Test that the primary still wins if it answers before the hedge"""
+    print("\n=== Test 2: Primary wins ===")
+
+    lp = ScriptedLP([(0.05, 100.0), (0.5, 200.0)])
+    aggregator = LPAggregator(lps=[lp], hedge_after_ms=20)
+    quote = _run(aggregator, lp)
+    samples = aggregator._latencies[lp.get_name()]
+
+    print(f"Winner price: {quote.price}, samples: {[round(s, 3) for s in samples]}")
+    assert quote.price == 100.0
+    assert lp.calls == 2
+    assert len(samples) == 2
+
+    print("[OK] Test passed!")
+
+
+def test_both_fail():
+    """Test that the LP is declined when primary and hedge both fail"""
+    print("\n=== Test 3: Both fail ===")
+
+    lp = ScriptedLP([(0.05, None), (0.01, None)])
+    aggregator = LPAggregator(lps=[lp], hedge_after_ms=20)
+    quote = _run(aggregator, lp)
+    samples = aggregator._latencies[lp.get_name()]
+
+    print(f"Result: {quote}, samples: {len(samples)}")
+    assert quote is None
+    assert lp.calls == 2
+    assert len(samples) == 2
+
+    print("[OK] Test passed!")
+
+
+def test_timeout_records_samples():
+    """Test that requests cut off by the quote timeout are sampled"""
+    print("\n=== Test 4: Timed-out requests are sampled ===")
+
+    lp = ScriptedLP([(0.5, 100.0), (0.5, 200.0)])
+    aggregator = LPAggregator(lps=[lp], quote_timeout_seconds=0.05, hedge_after_ms=20)
+    quote = _run(aggregator, lp)
+    samples = aggregator._latencies[lp.get_name()]
+
+    print(f"Result: {quote}, samples: {[round(s, 3) for s in samples]}")
+    assert quote is None
+    assert len(samples) == 2
+    # The primary ran until the timeout, not just until the hedge
+    assert max(samples) >= 0.05
+
+    print("[OK] Test passed!")
+
+
+def test_lp_timeout_error_without_deadline():
+    """Test an LP raising TimeoutError when no quote timeout is set"""
+    print("\n=== Test 5: LP TimeoutError without quote timeout ===")
+
+    class Collect(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.messages = []
+
+        def emit(self, record):
+            # getMessage() applies the %-args, so a bad format raises here
+            self.messages.append(record.getMessage())
+
+    handler = Collect()
+    aggregator_logger = logging.getLogger('src.core.lp_aggregator')
+    aggregator_logger.addHandler(handler)
+    try:
+        lp = ScriptedLP([(0.0, TimeoutError("LP gateway timeout"))])
+        aggregator = LPAggregator(lps=[lp])
+        quote = _run(aggregator, lp)
+    finally:
+        aggregator_logger.removeHandler(handler)
+
+    print(f"Result: {quote}, logged: {handler.messages}")
+    assert quote is None
+    assert handler.messages == ["LP error: LP gateway timeout"]
+
+    print("[OK] Test passed!")
+
+
+def test_latency_window_p95():
+    """Test the sorted window against a full sort of the samples"""
+    print("\n=== Test 6: Latency window p95 ===")
+
+    aggregator = LPAggregator(lps=[], hedge_after_ms=20)
+    rng = random.Random(7)
+    for _ in range(_LATENCY_WINDOW * 3):
+        aggregator._record_latency('LP-1', rng.random())
+
+    samples = aggregator._latencies['LP-1']
+    ordered = sorted(samples)
+    expected = ordered[int(len(ordered) * 0.95)]
+    print(f"Window: {len(samples)} samples, p95: {aggregator._hedge_delay('LP-1'):.4f}")
+    assert aggregator._latencies_sorted['LP-1'] == ordered
+    assert aggregator._hedge_delay('LP-1') == expected
+
+    print("[OK] Test passed!")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("  Hedging Tests")
+    print("=" * 60)
+
+    try:
+        test_hedge_wins()
+        test_primary_wins()
+        test_both_fail()
+        test_timeout_records_samples()
+        test_lp_timeout_error_without_deadline()
+        test_latency_window_p95()
+
+        print("\n" + "=" * 60)
+        print("  [SUCCESS] All tests passed!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -245,6 +245,25 @@ def test_rounding():
     print("[OK] Test passed!")
 
 
+def test_exact_rounding():
+    """Test Decimal rounding at float boundary values"""
+    print("\n=== Test 6: Exact Rounding ===")
+
+    float_aggregator = LPAggregator(lps=[], markup_bps=5.0)
+    exact_aggregator = LPAggregator(lps=[], markup_bps=5.0, exact_rounding=True)
+
+    # 1.1 * 100 == 110.00000000000001 in float arithmetic, so ceil overshoots
+    print(f"Float ceil:   {float_aggregator._round_amount(1.1, 2, round_up=True)}")
+    print(f"Decimal ceil: {exact_aggregator._round_amount(1.1, 2, round_up=True)}")
+
+    assert float_aggregator._round_amount(1.1, 2, round_up=True) == 1.11
+    assert exact_aggregator._round_amount(1.1, 2, round_up=True) == 1.1
+    assert exact_aggregator._round_amount(1.23456789, 5, round_up=False) == 1.23456
+    assert exact_aggregator._round_amount(1.23456789, 5, round_up=True) == 1.23457
+
+    print("[OK] Test passed!")
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 60)
@@ -257,6 +276,7 @@ def run_all_tests():
         test_sell_base_asset()
         test_sell_quote_asset()
         test_rounding()
+        test_exact_rounding()
 
         print("\n" + "=" * 60)
         print("  [SUCCESS] All tests passed!")
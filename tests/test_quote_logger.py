@@ -0,0 +1,209 @@
+"""
+Unit tests for QuoteLogger.
+
+Tests the background writer's shutdown paths, transaction handling and
+per-day LP quote partitions against a temporary database.
+"""
+
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent to path to import src as a module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.models import AggregatedQuote, LPQuote
+from src.database.schema import init_database, LP_QUOTES_PARTITION_SQL
+from src.database.quote_logger import QuoteLogger
+
+
+def _make_quote(quote_id: str) -> AggregatedQuote:
+    """Minimal BUY 1 BTC quote"""
+    return AggregatedQuote(
+        quote_id=quote_id,
+        client_price=100050.0,
+        lp_price=100000.0,
+        lp_name='LP-1',
+        markup_bps=5.0,
+        side='BUY',
+        amount=1.0,
+        base_asset='BTC',
+        quote_asset='USDT',
+        target_asset='BTC',
+        profit_asset='USDT',
+        client_gives_amount=100050.0,
+        client_gives_asset='USDT',
+        client_receives_amount=1.0,
+        client_receives_asset='BTC',
+        base_decimals=8,
+        quote_decimals=2,
+        validity_seconds=10.0
+    )
+
+
+def _count(db_path: str, table: str) -> int:
+    """Row count of a table"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_close_writes_collected_records():
+    """Test that close()/aclose() keep records the writer is still collecting"""
+    print("\n=== Test 1: Close during flush interval ===")
+
+    async def log_then_close(db_path: str, use_aclose: bool) -> None:
+        init_database(db_path)
+        quote_logger = QuoteLogger(db_path, flush_interval_seconds=1.0)
+        for i in range(3):
+            quote_logger.log_quote(_make_quote(f"Q{i}"), [], i + 1, False, None)
+            await asyncio.sleep(0.01)  # Writer picks them up and keeps collecting
+
+        if use_aclose:
+            await quote_logger.aclose()
+        else:
+            quote_logger.close()
+        await asyncio.sleep(0.05)  # Let the cancelled writer run its cleanup
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for use_aclose in (False, True):
+            db_path = os.path.join(tmp, f"close_{use_aclose}.db")
+            asyncio.run(log_then_close(db_path, use_aclose))
+            written = _count(db_path, 'quotes')
+            print(f"{'aclose()' if use_aclose else 'close()'}: {written} of 3 quotes written")
+            assert written == 3
+
+    print("[OK] Test passed!")
+
+
+def test_rollback_keeps_performance_dirty():
+    """Test that a rolled-back write keeps LP performance updates pending"""
+    print("\n=== Test 2: Rollback keeps performance updates ===")
+
+    def orphan_write(cursor):
+        # Violates a deferred foreign key, so the COMMIT (after the
+        # performance rows are written) fails and rolls back
+        cursor.execute("INSERT INTO temp.child (parent_id) VALUES (1)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "perf.db")
+        init_database(db_path)
+        quote_logger = QuoteLogger(db_path)
+        try:
+            quote_logger.conn.executescript("""
+                PRAGMA foreign_keys=ON;
+                CREATE TEMP TABLE parent (id INTEGER PRIMARY KEY);
+                CREATE TEMP TABLE child (
+                    parent_id INTEGER REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED
+                );
+            """)
+            quote_logger.update_lp_performance('LP-1', won=True, price=100.0)
+            quote_logger._write_batch([(orphan_write, ())])
+            print(f"After rollback: dirty={sorted(quote_logger._perf_dirty)}, "
+                  f"rows={_count(db_path, 'lp_performance')}")
+            assert quote_logger._perf_dirty == {'LP-1'}
+            assert _count(db_path, 'lp_performance') == 0
+
+            stats = quote_logger.get_lp_stats('LP-1')
+            print(f"After retry: dirty={sorted(quote_logger._perf_dirty)}, stats={stats['total_wins']} win(s)")
+            assert not quote_logger._perf_dirty
+            assert stats['total_wins'] == 1
+        finally:
+            quote_logger.close()
+
+    print("[OK] Test passed!")
+
+
+def _lp_quote(lp_name: str, price: float, timestamp: float) -> LPQuote:
+    """LP quote at a given wall-clock time"""
+    return LPQuote(lp_name=lp_name, price=price, quantity=1.0, validity_seconds=10.0,
+                   timestamp=timestamp, side='BUY')
+
+
+def test_partitioned_lp_quote_history():
+    """Test get_lp_quote_history across the main table and day files"""
+    print("\n=== Test 3: Partitioned LP quote history ===")
+
+    now = time.time()
+    old_ts = 1577880000.0  # 2020-01-01 12:00 UTC
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "quotes.db")
+        init_database(db_path)
+        quote_logger = QuoteLogger(db_path, partition_lp_quotes_by_day=True)
+        try:
+            # Today's day file, written through the logger
+            quote_logger.log_lp_quotes("Q-NOW", [
+                _lp_quote('LP-1', 100.0, now - 10),
+                _lp_quote('LP-2', 101.0, now - 5),
+            ])
+
+            # An older day file and a row left in the main table
+            old_file = quote_logger.db_path_for(old_ts)
+            conn = sqlite3.connect(old_file)
+            conn.executescript(LP_QUOTES_PARTITION_SQL.format(schema='main'))
+            conn.execute(
+                "INSERT INTO lp_quotes (quote_id, lp_name, price, quantity, validity_seconds, timestamp, side)"
+                " VALUES ('Q-OLD', 'LP-1', 90.0, 1.0, 10.0, ?, 'BUY')", (old_ts,))
+            conn.commit()
+            conn.close()
+            conn = sqlite3.connect(db_path)
+            conn.execute(
+                "INSERT INTO lp_quotes (quote_id, lp_name, price, quantity, validity_seconds, timestamp, side)"
+                " VALUES ('Q-MAIN', 'LP-1', 95.0, 1.0, 10.0, ?, 'BUY')", (now - 7,))
+            conn.commit()
+            conn.close()
+
+            history = quote_logger.get_lp_quote_history()
+            print(f"All:     {[row['price'] for row in history]}")
+            assert [row['price'] for row in history] == [101.0, 95.0, 100.0, 90.0]
+
+            lp1 = quote_logger.get_lp_quote_history(lp_name='LP-1')
+            print(f"LP-1:    {[row['price'] for row in lp1]}")
+            assert [row['price'] for row in lp1] == [95.0, 100.0, 90.0]
+
+            # The 2020 file is outside the range and not opened
+            recent = quote_logger.get_lp_quote_history(start_time=now - 60)
+            print(f"Recent:  {[row['price'] for row in recent]}")
+            assert [row['price'] for row in recent] == [101.0, 95.0, 100.0]
+            assert quote_logger._partition_files(now - 60, None) == [quote_logger.db_path_for(now)]
+
+            limited = quote_logger.get_lp_quote_history(limit=2)
+            print(f"Limit 2: {[row['price'] for row in limited]}")
+            assert [row['price'] for row in limited] == [101.0, 95.0]
+        finally:
+            quote_logger.close()
+
+    print("[OK] Test passed!")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("  QuoteLogger Tests")
+    print("=" * 60)
+
+    try:
+        test_close_writes_collected_records()
+        test_rollback_keeps_performance_dirty()
+        test_partitioned_lp_quote_history()
+
+        print("\n" + "=" * 60)
+        print("  [SUCCESS] All tests passed!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
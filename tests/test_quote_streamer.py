@@ -0,0 +1,154 @@
+"""
+Unit tests for QuoteStreamer.
+
+Tests callback dispatch across the lifetime of a stream and heartbeat
+logging of unchanged polls.
+"""
+
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add parent to path to import src as a module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.models import QuoteRequest, LPQuote
+from src.lps.base_lp import LiquidityProvider
+from src.lps.mock_lp import MockLP
+from src.core.lp_aggregator import LPAggregator
+from src.core.quote_streamer import QuoteStreamer
+from src.database.schema import init_database
+from src.database.quote_logger import QuoteLogger
+
+
+class FixedLP(LiquidityProvider):
+    """LP that always quotes the same price, immediately"""
+
+    def __init__(self, name: str, price: float):
+        self.name = name
+        self.price = price
+
+    def get_name(self) -> str:
+        """Return LP name"""
+        return self.name
+
+    async def execute_trade(self, quote, client_quote) -> bool:
+        """Execute trade (not used)"""
+        return True
+
+    async def request_quote(self, request: QuoteRequest) -> Optional[LPQuote]:
+        """Quote the fixed price"""
+        return LPQuote(
+            lp_name=self.name,
+            price=self.price,
+            quantity=10.0,
+            validity_seconds=30.0,
+            timestamp=time.time(),
+            side=request.side
+        )
+
+
+def _request() -> QuoteRequest:
+    """BUY 1 BTC request"""
+    return QuoteRequest(side='BUY', amount=1.0, base_asset='BTC', quote_asset='USDT', target_asset='BTC')
+
+
+def _callback_threads() -> list:
+    """Live 'thread' mode callback workers"""
+    return [t for t in threading.enumerate() if t.name.startswith("quote-callback")]
+
+
+def test_thread_mode_worker_exits():
+    """Test that the 'thread' mode callback worker is shut down with the stream"""
+    print("\n=== Test 1: Callback thread shut down after stream ===")
+
+    lps = [MockLP(f"LP-{i}", response_delay=(0.0, 0.0)) for i in range(3)]
+    streamer = QuoteStreamer(LPAggregator(lps=lps), poll_interval_ms=20)
+    polls = []
+
+    def on_update(all_quotes, best_quote, poll_count, *rest):
+        time.sleep(0.005)  # Blocking work belongs on the callback thread
+        polls.append(poll_count)
+
+    asyncio.run(streamer.stream_quotes(_request(), on_update, duration_seconds=0.2,
+                                       callback_mode='thread'))
+
+    # Queued callbacks still run; the worker then exits
+    deadline = time.monotonic() + 2.0
+    while _callback_threads() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    print(f"Callbacks: {len(polls)}, live callback threads: {len(_callback_threads())}")
+    assert streamer._cb_executor is None
+    assert not _callback_threads()
+    assert polls == sorted(polls) and len(polls) >= 2
+
+    print("[OK] Test passed!")
+
+
+def test_heartbeat_logging():
+    """Test that unchanged polls are logged as heartbeats on the locked quote"""
+    print("\n=== Test 2: Heartbeat logging ===")
+
+    polls = []
+
+    async def stream(db_path: str) -> None:
+        init_database(db_path)
+        quote_logger = QuoteLogger(db_path)
+        # LP-A always wins, so every later poll leaves the lock unchanged
+        lps = [FixedLP('LP-A', 100000.0), FixedLP('LP-B', 100100.0)]
+        streamer = QuoteStreamer(LPAggregator(lps=lps), poll_interval_ms=10,
+                                 quote_logger=quote_logger, heartbeat_polls=5)
+
+        def on_update(all_quotes, best_quote, poll_count, is_improvement, *rest):
+            polls.append((poll_count, is_improvement))
+
+        await streamer.stream_quotes(_request(), on_update, duration_seconds=0.3)
+        await quote_logger.aclose()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "heartbeat.db")
+        asyncio.run(stream(db_path))
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT lp_name, poll_number, poll_count_since FROM quotes").fetchall()
+        conn.close()
+
+    quiet = sum(1 for _, is_improvement in polls if not is_improvement)
+    print(f"Polls: {len(polls)} ({quiet} unchanged), quote rows: {rows}")
+    assert quiet >= 5
+    # One row for the lock; every unchanged poll counted on it
+    assert rows == [('LP-A', 1, quiet)]
+
+    print("[OK] Test passed!")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("  QuoteStreamer Tests")
+    print("=" * 60)
+
+    try:
+        test_thread_mode_worker_exits()
+        test_heartbeat_logging()
+
+        print("\n" + "=" * 60)
+        print("  [SUCCESS] All tests passed!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
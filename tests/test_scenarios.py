@@ -179,7 +179,7 @@ async def run_scenario(scenario_name: str, lps: list, duration: int = 15):
     improvements = 0
     previous_locked_lp = None
 
-    def on_quote_update(all_lp_quotes, best_quote, poll_num, is_improvement, locked_lp_name):
+    def on_quote_update(all_lp_quotes, best_quote, poll_num, is_improvement, locked_lp_name, locked_lp_quote):
         nonlocal poll_count, improvements, previous_locked_lp
         poll_count = poll_num
 
@@ -218,6 +218,9 @@ async def run_scenario(scenario_name: str, lps: list, duration: int = 15):
 
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}Scenario interrupted{Style.RESET_ALL}\n")
+    finally:
+        if quote_logger:
+            await quote_logger.aclose()
 
 
 async def scenario_1_competing():
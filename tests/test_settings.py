@@ -0,0 +1,160 @@
+"""
+Unit tests for Settings.from_env .env handling.
+
+Tests that edits to a .env file take effect on reload, that real
+environment variables still take precedence, and the from_env cache.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent to path to import src as a module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import settings as settings_module
+from src.config.settings import Settings
+
+
+def _write_env(path: str, text: str, mtime_ns: int) -> None:
+    """Write a .env file and pin its mtime (so reloads always see a change)"""
+    with open(path, 'w') as f:
+        f.write(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+# Variables the tests write (through os.environ or a .env file)
+_TEST_VARS = ('MARKUP_BPS', 'MOCK_LP_COUNT')
+
+
+class _CleanEnv:
+    """Remove _TEST_VARS from os.environ for the test, restore afterwards"""
+
+    def __enter__(self):
+        self.saved = {name: os.environ.pop(name, None) for name in _TEST_VARS}
+        self.saved_file_values = dict(settings_module._ENV_FILE_VALUES)
+        for name in _TEST_VARS:
+            settings_module._ENV_FILE_VALUES.pop(name, None)
+        return self
+
+    def __exit__(self, *exc):
+        for name, value in self.saved.items():
+            os.environ.pop(name, None)
+            if value is not None:
+                os.environ[name] = value
+        settings_module._ENV_FILE_VALUES.clear()
+        settings_module._ENV_FILE_VALUES.update(self.saved_file_values)
+
+
+def test_env_file_edit_reload():
+    """Test that an edited .env file takes effect on reload"""
+    print("\n=== Test 1: Edit .env and reload ===")
+
+    with _CleanEnv(), tempfile.TemporaryDirectory() as tmp:
+        env_file = os.path.join(tmp, '.env')
+
+        _write_env(env_file, "MARKUP_BPS=7\n", 1_000_000_000)
+        first = Settings.from_env(env_file)
+        print(f"First load:  markup_bps={first.markup_bps}")
+
+        _write_env(env_file, "MARKUP_BPS=9\n", 2_000_000_000)
+        second = Settings.from_env(env_file)
+        print(f"After edit:  markup_bps={second.markup_bps}")
+
+        assert first.markup_bps == 7.0
+        assert second.markup_bps == 9.0
+
+    print("[OK] Test passed!")
+
+
+def test_real_env_wins_over_env_file():
+    """Test that a real environment variable beats the .env file"""
+    print("\n=== Test 2: Real environment takes precedence ===")
+
+    with _CleanEnv(), tempfile.TemporaryDirectory() as tmp:
+        env_file = os.path.join(tmp, '.env')
+        os.environ['MARKUP_BPS'] = '3'
+
+        _write_env(env_file, "MARKUP_BPS=7\n", 1_000_000_000)
+        loaded = Settings.from_env(env_file)
+        print(f"Default:         markup_bps={loaded.markup_bps}")
+        assert loaded.markup_bps == 3.0
+
+        _write_env(env_file, "MARKUP_BPS=9\n", 2_000_000_000)
+        overwritten = Settings.from_env(env_file, overwrite=True)
+        print(f"overwrite=True:  markup_bps={overwritten.markup_bps}")
+        assert overwritten.markup_bps == 9.0
+
+    print("[OK] Test passed!")
+
+
+def test_env_cache_hit_and_miss():
+    """Test the from_env cache: hit, env change, and .env edit"""
+    print("\n=== Test 3: from_env cache ===")
+
+    with _CleanEnv(), tempfile.TemporaryDirectory() as tmp:
+        env_file = os.path.join(tmp, '.env')
+
+        _write_env(env_file, "MARKUP_BPS=7\n", 1_000_000_000)
+        first = Settings.from_env(env_file)
+        again = Settings.from_env(env_file)
+        print(f"Unchanged reload returns cached object: {again is first}")
+        assert again is first
+
+        # Environment changed, file unchanged -> miss
+        os.environ['MARKUP_BPS'] = '4'
+        env_changed = Settings.from_env(env_file)
+        print(f"After env change:  markup_bps={env_changed.markup_bps}")
+        assert env_changed is not first
+        assert env_changed.markup_bps == 4.0
+
+        # File edited -> miss (real env value still wins)
+        _write_env(env_file, "MARKUP_BPS=9\nMOCK_LP_COUNT=2\n", 2_000_000_000)
+        edited = Settings.from_env(env_file)
+        print(f"After .env edit:   markup_bps={edited.markup_bps} mock_lp_count={edited.mock_lp_count}")
+        assert edited is not env_changed
+        assert edited.markup_bps == 4.0
+        assert edited.mock_lp_count == 2
+
+    print("[OK] Test passed!")
+
+
+def test_cache_key_covers_every_setting():
+    """Test that _SETTING_ENV_VARS lists every variable from_env reads"""
+    print("\n=== Test 4: Cache key covers every setting ===")
+
+    import inspect
+    import re
+    read = set(re.findall(r"env\.get\('(\w+)'", inspect.getsource(Settings.from_env)))
+    print(f"from_env reads {len(read)} variables")
+    assert read == set(settings_module._SETTING_ENV_VARS)
+
+    print("[OK] Test passed!")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 60)
+    print("  Settings Tests")
+    print("=" * 60)
+
+    try:
+        test_env_file_edit_reload()
+        test_real_env_wins_over_env_file()
+        test_env_cache_hit_and_miss()
+        test_cache_key_covers_every_setting()
+
+        print("\n" + "=" * 60)
+        print("  [SUCCESS] All tests passed!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
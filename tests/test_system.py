@@ -102,7 +102,7 @@ async def test_quote_streaming():
 
     quote_count = 0
 
-    def on_update(all_lp_quotes, best_quote, poll_count, is_improvement, locked_lp_name):
+    def on_update(all_lp_quotes, best_quote, poll_count, is_improvement, locked_lp_name, locked_lp_quote):
         nonlocal quote_count
         quote_count += 1
         improvement_tag = " [IMPROVEMENT]" if is_improvement else ""